@@ -1,6 +1,8 @@
 """Override parsing and validation for per-request standards customization."""
 
+import dataclasses
 import logging
+import sys
 from typing import Dict, Optional, Tuple, List
 
 from .schema import (
@@ -22,6 +24,15 @@ OVERRIDE_VALIDATORS = {
     "module_naming": None,  # Accept any string
 }
 
+# Mapping of override keys to StandardsConfig attributes
+OVERRIDE_KEY_MAPPING = {
+    "naming": "naming_convention",
+    "test_framework": "test_framework",
+    "documentation": "documentation_style",
+    "organization": "code_organization",
+    "module_naming": "module_naming_pattern",
+}
+
 
 class OverrideParser:
     """Parses and validates --override command-line flags."""
@@ -56,7 +67,13 @@ class OverrideParser:
                 continue
 
             if key not in OVERRIDE_VALIDATORS:
-                errors.append(f"Unknown override key: {key}")
+                from difflib import get_close_matches
+
+                message = f"Unknown override key: {key}"
+                suggestion = get_close_matches(key, OVERRIDE_VALIDATORS.keys(), n=1)
+                if suggestion:
+                    message += f". Did you mean '{suggestion[0]}'?"
+                errors.append(message)
                 continue
 
             # Validate value if validator exists
@@ -68,7 +85,7 @@ class OverrideParser:
                 )
                 continue
 
-            overrides[key] = value
+            overrides[key] = sys.intern(value)
             logger.debug(f"Parsed override: {key}={value}")
 
         return overrides, errors
@@ -88,24 +105,14 @@ class OverrideParser:
         Returns:
             New StandardsConfig with overrides applied
         """
-        # Map override keys to StandardsConfig attributes
-        key_mapping = {
-            "naming": "naming_convention",
-            "test_framework": "test_framework",
-            "documentation": "documentation_style",
-            "organization": "code_organization",
-            "module_naming": "module_naming_pattern",
+        changes = {
+            OVERRIDE_KEY_MAPPING[key]: value
+            for key, value in overrides.items()
+            if key in OVERRIDE_KEY_MAPPING
         }
+        logger.debug(f"Applied overrides: {changes}")
 
-        config_dict = base_config.to_dict()
-
-        for override_key, override_value in overrides.items():
-            config_key = key_mapping.get(override_key)
-            if config_key:
-                config_dict[config_key] = override_value
-                logger.debug(f"Applied override: {config_key}={override_value}")
-
-        return StandardsConfig.from_dict(config_dict)
+        return dataclasses.replace(base_config, **changes)
 
     @staticmethod
     def get_override_help() -> str:
@@ -1,6 +1,7 @@
 """Configuration schema and validation for standards configuration."""
 
 import logging
+import sys
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 
@@ -34,6 +35,22 @@ VALID_CODE_ORGANIZATION = [
     "monolithic",
 ]
 
+# (attribute, valid values, formatted options) checked by StandardsConfig.validate
+_VALIDATION_CHECKS = tuple(
+    (attr, valid, ", ".join(valid))
+    for attr, valid in (
+        ("naming_convention", VALID_NAMING_CONVENTIONS),
+        ("test_framework", VALID_TEST_FRAMEWORKS),
+        ("documentation_style", VALID_DOCUMENTATION_STYLES),
+        ("code_organization", VALID_CODE_ORGANIZATION),
+    )
+)
+
+
+def _intern(value: Any) -> Any:
+    """Intern string values so repeated configs share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
 
 @dataclass
 class StandardsConfig:
@@ -54,38 +71,12 @@ class StandardsConfig:
         """
         errors = []
 
-        if (
-            self.naming_convention
-            and self.naming_convention not in VALID_NAMING_CONVENTIONS
-        ):
-            errors.append(
-                f"Invalid naming_convention: {self.naming_convention}. "
-                f"Valid options: {', '.join(VALID_NAMING_CONVENTIONS)}"
-            )
-
-        if self.test_framework and self.test_framework not in VALID_TEST_FRAMEWORKS:
-            errors.append(
-                f"Invalid test_framework: {self.test_framework}. "
-                f"Valid options: {', '.join(VALID_TEST_FRAMEWORKS)}"
-            )
-
-        if (
-            self.documentation_style
-            and self.documentation_style not in VALID_DOCUMENTATION_STYLES
-        ):
-            errors.append(
-                f"Invalid documentation_style: {self.documentation_style}. "
-                f"Valid options: {', '.join(VALID_DOCUMENTATION_STYLES)}"
-            )
-
-        if (
-            self.code_organization
-            and self.code_organization not in VALID_CODE_ORGANIZATION
-        ):
-            errors.append(
-                f"Invalid code_organization: {self.code_organization}. "
-                f"Valid options: {', '.join(VALID_CODE_ORGANIZATION)}"
-            )
+        for attr, valid, options in _VALIDATION_CHECKS:
+            value = getattr(self, attr)
+            if value and value not in valid:
+                errors.append(
+                    f"Invalid {attr}: {value}. Valid options: {options}"
+                )
 
         return len(errors) == 0, errors
 
@@ -103,9 +94,9 @@ class StandardsConfig:
     def from_dict(cls, data: Dict[str, Any]) -> "StandardsConfig":
         """Create config from dictionary."""
         return cls(
-            naming_convention=data.get("naming_convention"),
-            test_framework=data.get("test_framework"),
-            documentation_style=data.get("documentation_style"),
-            code_organization=data.get("code_organization"),
-            module_naming_pattern=data.get("module_naming_pattern"),
+            naming_convention=_intern(data.get("naming_convention")),
+            test_framework=_intern(data.get("test_framework")),
+            documentation_style=_intern(data.get("documentation_style")),
+            code_organization=_intern(data.get("code_organization")),
+            module_naming_pattern=_intern(data.get("module_naming_pattern")),
         )
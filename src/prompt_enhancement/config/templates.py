@@ -2,13 +2,25 @@
 
 import logging
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Any, Dict, Optional, List
 from .schema import StandardsConfig
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _parse_template_bytes(raw: bytes) -> Dict[str, Any]:
+    """
+    Parse raw template file contents.
+
+    Keyed by the file contents, so identical templates share a single parse
+    even across renames. Callers must treat the result as read-only.
+    """
+    return json.loads(raw)
+
+
 class TemplateManager:
     """Manages predefined and custom templates for standards."""
 
@@ -84,8 +96,7 @@ class TemplateManager:
         custom_path = self.templates_dir / f"{template_name}.json"
         if custom_path.exists():
             try:
-                with open(custom_path) as f:
-                    data = json.load(f)
+                data = _parse_template_bytes(custom_path.read_bytes())
                 return StandardsConfig.from_dict(data)
             except Exception as e:
                 logger.error(f"Error loading custom template {template_name}: {e}")
@@ -12,11 +12,14 @@ Main components:
 - PromptBuilder: Builds structured LLM prompts
 - SensitiveDataValidator: Ensures no sensitive data in prompts
 - EnhancementGenerator: Orchestrates LLM-based enhancement
+- SqliteBackend, RedisBackend: Persist enhancement results across processes
 - StepExtractor: Parses LLM responses to extract steps
 - CriteriaGenerator: Generates verification criteria
 - GuideBuilder: Creates comprehensive implementation guides
 """
 
+import importlib
+
 from .context import (
     ProjectContext,
     StandardsDetectionResult,
@@ -24,33 +27,50 @@ from .context import (
     GitHistoryContext,
     Dependency,
 )
-from .context_collector import ProjectContextCollector
-from .prompt_builder import PromptBuilder
-from .sensitive_validator import SensitiveDataValidator
-from .generator import EnhancementGenerator, EnhancementResult
-from .step_extractor import (
-    StepExtractor,
-    ImplementationStep,
-    StepFormat,
-    ExtractedSteps,
-    StepGroup,
-)
-from .criteria_generator import (
-    CriteriaGenerator,
-    VerificationCriterion,
-    CodeExample,
-    TestingGuidance,
-    GeneratedCriteria,
-    ArtifactType,
-)
-from .guide_builder import (
-    GuideBuilder,
-    ImplementationGuide,
-    ImplementationPath,
-    PathAlternative,
-    ImplementationGuideSection,
-    ValidationResult,
-)
+
+# Heavier components (LLM clients, parsers) are imported on first access
+# so that callers which only need the context dataclasses stay cheap.
+_LAZY_EXPORTS = {
+    "ProjectContextCollector": ".context_collector",
+    "PromptBuilder": ".prompt_builder",
+    "SensitiveDataValidator": ".sensitive_validator",
+    "EnhancementGenerator": ".generator",
+    "EnhancementResult": ".generator",
+    "CacheBackend": ".result_cache",
+    "SqliteBackend": ".result_cache",
+    "RedisBackend": ".result_cache",
+    "StepExtractor": ".step_extractor",
+    "ImplementationStep": ".step_extractor",
+    "StepFormat": ".step_extractor",
+    "ExtractedSteps": ".step_extractor",
+    "StepGroup": ".step_extractor",
+    "CriteriaGenerator": ".criteria_generator",
+    "VerificationCriterion": ".criteria_generator",
+    "CodeExample": ".criteria_generator",
+    "TestingGuidance": ".criteria_generator",
+    "GeneratedCriteria": ".criteria_generator",
+    "ArtifactType": ".criteria_generator",
+    "GuideBuilder": ".guide_builder",
+    "ImplementationGuide": ".guide_builder",
+    "ImplementationPath": ".guide_builder",
+    "PathAlternative": ".guide_builder",
+    "ImplementationGuideSection": ".guide_builder",
+    "ValidationResult": ".guide_builder",
+}
+
+
+def __getattr__(name):
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Story 3.1 exports
@@ -65,6 +85,9 @@ __all__ = [
     # Story 3.2 exports
     "EnhancementGenerator",
     "EnhancementResult",
+    "CacheBackend",
+    "SqliteBackend",
+    "RedisBackend",
     # Story 3.3 exports
     "StepExtractor",
     "ImplementationStep",
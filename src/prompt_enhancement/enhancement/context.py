@@ -5,10 +5,14 @@ Contains dataclasses that represent collected project information
 used for building project-aware enhancement prompts.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+# dataclass(slots=True) needs Python 3.10+; fall back to a regular dataclass
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 @dataclass
 class StandardsDetectionResult:
@@ -46,7 +50,7 @@ class GitHistoryContext:
     active_days: Optional[int] = None  # Days between first and last commit
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Dependency:
     """Information about a project dependency."""
 
@@ -80,8 +84,8 @@ class ProjectContext:
         None  # "by-feature", "by-layer", "by-type", etc.
     )
 
-    # Git history context
-    git_context: Optional[GitHistoryContext] = field(default_factory=GitHistoryContext)
+    # Git history context (None when git history was not collected)
+    git_context: Optional[GitHistoryContext] = None
 
     # Dependencies and libraries
     dependencies: List[Dependency] = field(default_factory=list)
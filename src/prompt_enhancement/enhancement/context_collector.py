@@ -6,8 +6,24 @@ to create a comprehensive context for enhancement generation (AC1).
 """
 
 import logging
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+import operator
+import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 from pathlib import Path
 
 from .context import (
@@ -21,6 +37,114 @@ from ..symbol_indexer import SymbolIndexer
 
 logger = logging.getLogger(__name__)
 
+# Fallback fingerprint: number of .py files sampled, and the files whose
+# mtimes invalidate a previously computed fingerprint
+FINGERPRINT_MAX_FILES = 100
+FINGERPRINT_MARKER_FILES = ("pyproject.toml", "package.json", ".git/HEAD")
+
+# Confidence report entries collected into ProjectContext.detected_standards
+STANDARD_NAMES = frozenset(
+    {
+        "naming_convention",
+        "test_framework",
+        "documentation_style",
+        "code_organization",
+        "module_naming",
+    }
+)
+
+# Collection modes in which each optional extractor runs
+ALL_MODES = frozenset({"full", "partial", "minimal"})
+NON_MINIMAL_MODES = frozenset({"full", "partial"})
+FULL_MODE_ONLY = frozenset({"full"})
+DEGRADED_MODES = frozenset({"partial", "minimal"})
+
+# (ProjectContext attribute, analysis result key, extractor method, modes)
+# applied in order by collect_context
+CONTEXT_EXTRACTORS = (
+    ("detected_standards", "confidence_report", "_extract_standards", ALL_MODES),
+    ("git_context", "git_history", "_extract_git_context", NON_MINIMAL_MODES),
+    ("dependencies", "indicator_files", "_extract_dependencies", FULL_MODE_ONLY),
+    (
+        "project_organization",
+        "confidence_report",
+        "_extract_project_organization",
+        ALL_MODES,
+    ),
+)
+
+# Symbol dictionary keys and the ExtractedSymbol attributes they come from
+SYMBOL_FIELDS = {
+    "name": "name",
+    "type": "symbol_type",
+    "signature": "signature",
+    "line": "line_number",
+    "parent_class": "parent_class",
+    "decorators": "decorators",
+    "docstring": "docstring",
+}
+_SYMBOL_KEYS = tuple(SYMBOL_FIELDS)
+_get_symbol_values = operator.attrgetter(*SYMBOL_FIELDS.values())
+
+
+@lru_cache(maxsize=32)
+def _symbol_values_getter(keys: Tuple[str, ...]) -> Callable[[Any], Tuple[Any, ...]]:
+    """Build a getter returning the ExtractedSymbol values for ``keys``."""
+    unknown = [key for key in keys if key not in SYMBOL_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown symbol fields: {', '.join(unknown)}. "
+            f"Valid fields: {', '.join(SYMBOL_FIELDS)}"
+        )
+    getter = operator.attrgetter(*(SYMBOL_FIELDS[key] for key in keys))
+    # attrgetter returns a bare value (not a tuple) for a single attribute
+    return (lambda symbol: (getter(symbol),)) if len(keys) == 1 else getter
+
+
+# (field name, predicate) pairs reported in CollectionMetadata, in order
+COLLECTED_FIELD_CHECKS = (
+    ("language", lambda c: bool(c.language) and c.language != "unknown"),
+    ("framework", lambda c: bool(c.framework)),
+    ("detected_standards", lambda c: bool(c.detected_standards)),
+    ("git_history", lambda c: bool(c.git_context and c.git_context.total_commits)),
+    ("dependencies", lambda c: bool(c.dependencies)),
+)
+
+# Files per worker task when indexing symbols in parallel
+SYMBOL_INDEX_CHUNKSIZE = 16
+
+# Files whose symbols are kept, least recently used evicted first
+SYMBOL_CACHE_SIZE = 1024
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings drawn from small vocabularies (languages, standards)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _infer_package_manager(package_name: str) -> Optional[str]:
+    """Infer package manager from package name patterns."""
+    if "-py" in package_name or "py-" in package_name:
+        return "pip"
+    if package_name[:1] == "@":
+        return "npm"
+    if package_name.endswith("-rs"):
+        return "cargo"
+    return None
+
+
+def _index_file_symbols(project_root: str, file_path: str) -> Optional[List[Any]]:
+    """
+    Worker entry point: extract symbols for one file in a pool process.
+
+    Returns None on failure so the caller does not cache the error.
+    """
+    try:
+        return SymbolIndexer(project_root).get_file_symbols(file_path)
+    except Exception as e:
+        logger.warning(f"Error indexing symbols for {file_path}: {e}")
+        return None
+
 
 class ProjectContextCollector:
     """
@@ -39,9 +163,32 @@ class ProjectContextCollector:
             project_root: Root directory of project (defaults to cwd)
         """
         self.project_root = Path(project_root) if project_root else Path.cwd()
-        self.symbol_indexer = SymbolIndexer(str(self.project_root))
+        # Created on first symbol lookup (see the symbol_indexer property)
+        self._symbol_indexer: Optional[SymbolIndexer] = None
+        # (invalidation key, fingerprint) for the fallback fingerprint
+        self._fingerprint_cache: Optional[Tuple[int, str]] = None
+        # absolute path -> ((absolute path, mtime_ns, size), extracted symbols),
+        # one entry per file, ordered least recently used first
+        self._symbol_cache: "OrderedDict[str, Tuple[Tuple[str, int, int], List[Any]]]" = (
+            OrderedDict()
+        )
+        # Created on first parallel symbol request and reused afterwards
+        self._symbol_pool: Optional[ProcessPoolExecutor] = None
+        # type -> whether analysis objects of that type provide to_dict()
+        self._to_dict_types: Dict[type, bool] = {}
         logger.debug(f"Initialized ProjectContextCollector for {self.project_root}")
 
+    @property
+    def symbol_indexer(self) -> SymbolIndexer:
+        """Symbol indexer for the project, created on first use."""
+        if self._symbol_indexer is None:
+            self._symbol_indexer = SymbolIndexer(str(self.project_root))
+        return self._symbol_indexer
+
+    @symbol_indexer.setter
+    def symbol_indexer(self, indexer: SymbolIndexer) -> None:
+        self._symbol_indexer = indexer
+
     def collect_context(
         self,
         analysis_result: Optional[Dict[str, Any]] = None,
@@ -54,7 +201,8 @@ class ProjectContextCollector:
 
         Args:
             analysis_result: Results from ProjectAnalyzer (Epic 2)
-            collection_mode: "full", "partial", or "minimal"
+            collection_mode: "full", "partial" (skips dependencies), or
+                "minimal" (also skips Git history and the fingerprint file walk)
             user_overrides: User-specified standard overrides
             template_name: Name of template being used (if any)
 
@@ -63,39 +211,34 @@ class ProjectContextCollector:
         """
         logger.info(f"Collecting project context (mode={collection_mode})")
 
+        analysis = analysis_result or {}
+        tech_stack = analysis.get("tech_stack")
+
         context = ProjectContext(
             project_name=self._extract_project_name(),
-            language=self._extract_language(analysis_result),
-            framework=self._extract_framework(analysis_result),
-            framework_version=self._extract_framework_version(analysis_result),
-            project_fingerprint=self._extract_fingerprint(analysis_result),
+            language=self._extract_language(tech_stack),
+            framework=self._extract_framework(tech_stack),
+            framework_version=self._extract_framework_version(tech_stack),
+            project_fingerprint=self._extract_fingerprint(analysis, collection_mode),
             user_overrides=user_overrides or {},
             template_name=template_name,
         )
 
-        # Collect detected standards
-        if analysis_result and "confidence_report" in analysis_result:
-            context.detected_standards = self._extract_standards(
-                analysis_result["confidence_report"]
-            )
-
-        # Collect Git history
-        if analysis_result and "git_history" in analysis_result:
-            context.git_context = self._extract_git_context(
-                analysis_result["git_history"]
-            )
-
-        # Collect dependencies
-        if analysis_result and "indicator_files" in analysis_result:
-            context.dependencies = self._extract_dependencies(
-                analysis_result["indicator_files"]
+        # Decode the confidence report once; it feeds two extractors
+        sources = dict(analysis)
+        if sources.get("confidence_report") is not None:
+            sources["confidence_report"] = self._decode_confidence_report(
+                sources["confidence_report"]
             )
 
-        # Collect project organization
-        if analysis_result and "confidence_report" in analysis_result:
-            context.project_organization = self._extract_project_organization(
-                analysis_result["confidence_report"]
-            )
+        # Collect standards, Git history, dependencies and organization;
+        # degraded modes skip the more expensive extractors entirely
+        for attr, key, extractor_name, modes in CONTEXT_EXTRACTORS:
+            if collection_mode not in modes:
+                continue
+            value = sources.get(key)
+            if value is not None:
+                setattr(context, attr, getattr(self, extractor_name)(value))
 
         # Generate collection metadata
         context.collection_metadata = self._create_collection_metadata(
@@ -107,114 +250,148 @@ class ProjectContextCollector:
 
     def _extract_project_name(self) -> str:
         """Extract project name from directory or config."""
-        # Try to get from pyproject.toml or package.json
-        try:
-            # Simple approach: use directory name
-            return self.project_root.name
-        except Exception as e:
-            logger.warning(f"Could not extract project name: {e}")
-            return "unknown-project"
+        # Simple approach: use directory name
+        return self.project_root.name or "unknown-project"
 
-    def _extract_language(self, analysis_result: Optional[Dict[str, Any]]) -> str:
+    def _extract_language(self, tech_stack: Optional[Any]) -> str:
         """
         Extract primary programming language.
 
         AC1: Required field
         """
-        if analysis_result and "tech_stack" in analysis_result:
-            try:
-                tech_stack = analysis_result["tech_stack"]
-                if hasattr(tech_stack, "primary_language"):
-                    lang = tech_stack.primary_language
-                    return lang.value if hasattr(lang, "value") else str(lang)
-            except Exception as e:
-                logger.warning(f"Error extracting language: {e}")
-
-        return "unknown"
+        lang = getattr(tech_stack, "primary_language", None)
+        if lang is None:
+            return "unknown"
+        return _intern(lang.value if hasattr(lang, "value") else str(lang))
 
-    def _extract_framework(
-        self, analysis_result: Optional[Dict[str, Any]]
-    ) -> Optional[str]:
+    def _extract_framework(self, tech_stack: Optional[Any]) -> Optional[str]:
         """Extract framework information."""
-        if analysis_result and "tech_stack" in analysis_result:
-            try:
-                tech_stack = analysis_result["tech_stack"]
-                if hasattr(tech_stack, "frameworks") and tech_stack.frameworks:
-                    # Return primary framework
-                    return tech_stack.frameworks[0] if tech_stack.frameworks else None
-            except Exception as e:
-                logger.warning(f"Error extracting framework: {e}")
-
-        return None
+        frameworks = getattr(tech_stack, "frameworks", None)
+        if not frameworks or not isinstance(frameworks, (list, tuple)):
+            return None
+        # Return primary framework
+        return _intern(frameworks[0])
 
-    def _extract_framework_version(
-        self, analysis_result: Optional[Dict[str, Any]]
-    ) -> Optional[str]:
+    def _extract_framework_version(self, tech_stack: Optional[Any]) -> Optional[str]:
         """Extract framework version."""
-        if analysis_result and "tech_stack" in analysis_result:
-            try:
-                tech_stack = analysis_result["tech_stack"]
-                if (
-                    hasattr(tech_stack, "framework_versions")
-                    and tech_stack.framework_versions
-                ):
-                    return tech_stack.framework_versions.get("primary")
-            except Exception as e:
-                logger.warning(f"Error extracting framework version: {e}")
-
-        return None
-
-    def _extract_fingerprint(self, analysis_result: Optional[Dict[str, Any]]) -> str:
+        versions = getattr(tech_stack, "framework_versions", None)
+        if not isinstance(versions, Mapping):
+            return None
+        return versions.get("primary")
+
+    def _extract_fingerprint(
+        self, analysis: Mapping[str, Any], collection_mode: str = "full"
+    ) -> str:
         """Extract project fingerprint for caching."""
-        if analysis_result and "fingerprint" in analysis_result:
-            return analysis_result["fingerprint"]
+        if "fingerprint" in analysis:
+            return analysis["fingerprint"]
 
         # Generate simple fingerprint if not provided
         try:
             import hashlib
 
-            files = list(self.project_root.glob("**/*.py"))[:100]
-            file_str = "".join(str(f) for f in sorted(files))
-            return hashlib.md5(file_str.encode()).hexdigest()
+            if collection_mode == "minimal":
+                # Skip the file walk: root name and mtime are enough here
+                digest = hashlib.blake2b(digest_size=16)
+                digest.update(os.fsencode(self.project_root.name))
+                digest.update(str(os.stat(self.project_root).st_mtime_ns).encode())
+                return digest.hexdigest()
+
+            cache_key = self._fingerprint_cache_key()
+            if self._fingerprint_cache and self._fingerprint_cache[0] == cache_key:
+                return self._fingerprint_cache[1]
+
+            # Stream raw path bytes into the digest instead of joining one
+            # large string; NUL separators keep path boundaries unambiguous
+            digest = hashlib.blake2b(digest_size=16)
+            for raw_path in sorted(
+                map(os.fsencode, self._scan_python_files(FINGERPRINT_MAX_FILES))
+            ):
+                digest.update(raw_path)
+                digest.update(b"\0")
+            fingerprint = digest.hexdigest()
+            self._fingerprint_cache = (cache_key, fingerprint)
+            return fingerprint
         except Exception as e:
             logger.warning(f"Error generating fingerprint: {e}")
             return "unknown"
 
-    def _extract_standards(
+    def _fingerprint_cache_key(self) -> int:
+        """Cheap invalidation key: newest mtime of the root and marker files."""
+        mtimes = [0]
+        for name in ("",) + FINGERPRINT_MARKER_FILES:
+            try:
+                mtimes.append(os.stat(self.project_root / name).st_mtime_ns)
+            except OSError:
+                continue
+        return max(mtimes)
+
+    def _scan_python_files(self, limit: int) -> List[Path]:
+        """Collect up to ``limit`` .py files, stopping the walk once reached."""
+        files: List[Path] = []
+        pending = [str(self.project_root)]
+
+        while pending and len(files) < limit:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith(".py"):
+                            files.append(Path(entry.path))
+                            if len(files) >= limit:
+                                break
+            except OSError:
+                continue
+
+        return files
+
+    def _as_dict(self, obj: Any) -> Any:
+        """Return ``obj.to_dict()`` for analysis result objects, else ``obj``."""
+        obj_type = type(obj)
+        has_to_dict = self._to_dict_types.get(obj_type)
+        if has_to_dict is None:
+            has_to_dict = hasattr(obj, "to_dict")
+            self._to_dict_types[obj_type] = has_to_dict
+        return obj.to_dict() if has_to_dict else obj
+
+    def _decode_confidence_report(
         self, confidence_report: Optional[Any]
+    ) -> Optional[Mapping[str, Any]]:
+        """Convert a confidence report to a plain mapping (once per collection)."""
+        if not confidence_report:
+            return None
+
+        try:
+            return self._as_dict(confidence_report)
+        except Exception as e:
+            logger.warning(f"Error decoding confidence report: {e}")
+            return None
+
+    def _extract_standards(
+        self, report_dict: Optional[Mapping[str, Any]]
     ) -> Dict[str, StandardsDetectionResult]:
         """
-        Extract detected standards from confidence report.
+        Extract detected standards from a decoded confidence report.
 
         AC1: Collect detected standards
         AC3: Handle low-confidence standards
         """
         standards = {}
 
-        if not confidence_report:
+        if not report_dict:
             return standards
 
         try:
             # Map from confidence report to StandardsDetectionResult
-            report_dict = (
-                confidence_report.to_dict()
-                if hasattr(confidence_report, "to_dict")
-                else confidence_report
-            )
-
             for standard_name, standard_data in report_dict.items():
-                if standard_name in [
-                    "naming_convention",
-                    "test_framework",
-                    "documentation_style",
-                    "code_organization",
-                    "module_naming",
-                ]:
+                if standard_name in STANDARD_NAMES:
+                    standard_name = _intern(standard_name)
                     try:
                         result = StandardsDetectionResult(
                             standard_name=standard_name,
-                            detected_value=standard_data.get(
-                                "detected_value", "unknown"
+                            detected_value=_intern(
+                                standard_data.get("detected_value", "unknown")
                             ),
                             confidence=float(standard_data.get("confidence", 0.0)),
                             sample_size=int(standard_data.get("sample_size", 0)),
@@ -243,11 +420,7 @@ class ProjectContextCollector:
             return context
 
         try:
-            git_dict = (
-                git_history.to_dict()
-                if hasattr(git_history, "to_dict")
-                else git_history
-            )
+            git_dict = self._as_dict(git_history)
 
             context.current_branch = git_dict.get("current_branch")
             context.total_commits = git_dict.get("total_commits")
@@ -270,24 +443,16 @@ class ProjectContextCollector:
             return dependencies
 
         try:
-            indicator_dict = (
-                indicator_files.to_dict()
-                if hasattr(indicator_files, "to_dict")
-                else indicator_files
-            )
+            indicator_dict = self._as_dict(indicator_files)
 
             # Extract from dependencies dict if available
             if "dependencies" in indicator_dict:
                 deps = indicator_dict["dependencies"]
                 if isinstance(deps, dict):
-                    for name, version in deps.items():
-                        dependencies.append(
-                            Dependency(
-                                name=name,
-                                version=version,
-                                package_manager=self._infer_package_manager(name),
-                            )
-                        )
+                    dependencies = [
+                        Dependency(name, version, _infer_package_manager(name))
+                        for name, version in deps.items()
+                    ]
 
             logger.debug(f"Extracted {len(dependencies)} dependencies")
         except Exception as e:
@@ -295,29 +460,16 @@ class ProjectContextCollector:
 
         return dependencies
 
-    def _infer_package_manager(self, package_name: str) -> Optional[str]:
-        """Infer package manager from package name patterns."""
-        if any(ext in package_name for ext in ["-py", "py-"]):
-            return "pip"
-        if package_name.startswith("@"):
-            return "npm"
-        if package_name.endswith("-rs"):
-            return "cargo"
-        return None
-
     def _extract_project_organization(
-        self, confidence_report: Optional[Any]
+        self, report_dict: Optional[Mapping[str, Any]]
     ) -> Optional[str]:
-        """Extract project organization pattern."""
-        try:
-            report_dict = (
-                confidence_report.to_dict()
-                if hasattr(confidence_report, "to_dict")
-                else confidence_report
-            )
+        """Extract project organization pattern from a decoded confidence report."""
+        if not report_dict:
+            return None
 
+        try:
             if "code_organization" in report_dict:
-                return report_dict["code_organization"].get("detected_value")
+                return _intern(report_dict["code_organization"].get("detected_value"))
         except Exception as e:
             logger.warning(f"Error extracting project organization: {e}")
 
@@ -337,69 +489,49 @@ class ProjectContextCollector:
         fields_skipped = []
 
         # Track which fields were collected
-        if context.language and context.language != "unknown":
-            fields_collected.append("language")
-        else:
-            fields_skipped.append("language")
-
-        if context.framework:
-            fields_collected.append("framework")
-        else:
-            fields_skipped.append("framework")
-
-        if context.detected_standards:
-            fields_collected.append("detected_standards")
-        else:
-            fields_skipped.append("detected_standards")
-
-        if context.git_context.total_commits:
-            fields_collected.append("git_history")
-        else:
-            fields_skipped.append("git_history")
-
-        if context.dependencies:
-            fields_collected.append("dependencies")
-        else:
-            fields_skipped.append("dependencies")
-
-        # Build standards confidence map
-        standards_confidence = {
-            name: result.confidence
-            for name, result in context.detected_standards.items()
-        }
+        for field_name, is_collected in COLLECTED_FIELD_CHECKS:
+            (fields_collected if is_collected(context) else fields_skipped).append(
+                field_name
+            )
+
+        # Build standards confidence map and low-confidence warnings in one
+        # pass over the detected standards
+        standards_confidence = {}
+        warnings = []
+        for name, result in context.detected_standards.items():
+            confidence = result.confidence
+            standards_confidence[name] = confidence
+            if confidence < 0.60:
+                warnings.append(
+                    f"Low confidence in {name}: {confidence:.0%} "
+                    f"(consider using --override)"
+                )
+        warnings.extend(self._generate_warnings(collection_mode))
 
         return CollectionMetadata(
-            collected_at=datetime.utcnow().isoformat() + "Z",
-            collection_mode=collection_mode,
+            collected_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            collection_mode=_intern(collection_mode),
             standards_confidence=standards_confidence,
             fields_collected=fields_collected,
             fields_skipped=fields_skipped,
-            warnings=self._generate_warnings(context, collection_mode),
+            warnings=warnings,
         )
 
-    def _generate_warnings(
-        self, context: ProjectContext, collection_mode: str
-    ) -> List[str]:
-        """Generate warnings about collection issues."""
+    def _generate_warnings(self, collection_mode: str) -> List[str]:
+        """Generate warnings about the collection mode."""
         warnings = []
 
-        # Check confidence levels
-        for name, result in context.detected_standards.items():
-            if result.confidence < 0.60:
-                warnings.append(
-                    f"Low confidence in {name}: {result.confidence:.0%} "
-                    f"(consider using --override)"
-                )
-
         # Check if collection mode is degraded
-        if collection_mode in ["partial", "minimal"]:
+        if collection_mode in DEGRADED_MODES:
             warnings.append(
                 f"Collection mode is {collection_mode} - some context unavailable"
             )
 
         return warnings
 
-    def get_file_symbols(self, file_path: str) -> List[Dict[str, Any]]:
+    def get_file_symbols(
+        self, file_path: str, fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get symbol index for a file (functions, classes, methods).
 
@@ -408,16 +540,178 @@ class ProjectContextCollector:
 
         Args:
             file_path: Path to the file to analyze
+            fields: Optional subset of symbol keys to include (see
+                SYMBOL_FIELDS); all keys are returned when omitted
 
         Returns:
             List of symbol dictionaries with name, type, signature, line number
+
+        Raises:
+            ValueError: If ``fields`` contains an unknown key
+        """
+        return list(self.iter_file_symbols(file_path, fields))
+
+    def iter_file_symbols(
+        self, file_path: str, fields: Optional[Sequence[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
         """
+        Iterate over a file's symbol dictionaries without building a list.
+
+        The file is indexed (or served from cache) immediately; each symbol
+        dictionary is created only as the caller consumes it.
+
+        Args:
+            file_path: Path to the file to analyze
+            fields: Optional subset of symbol keys to include
+
+        Returns:
+            Iterator of symbol dictionaries (empty if the file can't be indexed)
+
+        Raises:
+            ValueError: If ``fields`` contains an unknown key
+        """
+        if fields is not None:
+            _symbol_values_getter(tuple(fields))  # validate before indexing
+
         try:
-            symbols = self.symbol_indexer.get_file_symbols(file_path)
-            return [self._symbol_to_dict(s) for s in symbols]
+            symbols = self._get_cached_symbols(file_path)
         except Exception as e:
             logger.warning(f"Error getting file symbols for {file_path}: {e}")
-            return []
+            return iter(())
+
+        return self._iter_symbol_dicts(symbols, fields)
+
+    def get_many_file_symbols(
+        self, file_paths: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get symbol indexes for many files, parsing uncached files in parallel.
+
+        Files already in the symbol cache are served directly. When at least
+        SYMBOL_INDEX_CHUNKSIZE files remain, they are indexed in a process
+        pool (AST parsing is CPU-bound); smaller batches, or a pool that is
+        unavailable, are indexed serially. Files that fail to index are
+        reported with no symbols and are not cached.
+
+        Args:
+            file_paths: Paths of the files to analyze
+
+        Returns:
+            Dictionary mapping each requested path to its symbol dictionaries
+        """
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        pending: Dict[str, Tuple[str, int, int]] = {}
+
+        for file_path in file_paths:
+            try:
+                key = self._symbol_cache_key(file_path)
+            except OSError as e:
+                logger.warning(f"Error getting file symbols for {file_path}: {e}")
+                results[file_path] = []
+                continue
+            symbols = self._lookup_symbols(key)
+            if symbols is not None:
+                results[file_path] = self._symbols_to_dicts(symbols)
+            else:
+                pending[file_path] = key
+
+        # Starting worker processes costs more than indexing a few files
+        if len(pending) < SYMBOL_INDEX_CHUNKSIZE:
+            for file_path in pending:
+                results[file_path] = self.get_file_symbols(file_path)
+            return results
+
+        paths = list(pending)
+        try:
+            if self._symbol_pool is None:
+                self._symbol_pool = ProcessPoolExecutor()
+            indexed = list(
+                self._symbol_pool.map(
+                    _index_file_symbols,
+                    [str(self.project_root)] * len(paths),
+                    [pending[p][0] for p in paths],
+                    chunksize=SYMBOL_INDEX_CHUNKSIZE,
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Parallel symbol indexing unavailable, indexing serially: {e}")
+            for file_path in paths:
+                results[file_path] = self.get_file_symbols(file_path)
+            return results
+
+        for file_path, symbols in zip(paths, indexed):
+            if symbols is None:
+                results[file_path] = []
+                continue
+            self._store_symbols(pending[file_path], symbols)
+            results[file_path] = self._symbols_to_dicts(symbols)
+        return results
+
+    def close(self) -> None:
+        """Shut down the symbol indexing pool, if one was started."""
+        if self._symbol_pool is not None:
+            self._symbol_pool.shutdown()
+            self._symbol_pool = None
+
+    def _symbols_to_dicts(self, symbols: List[Any]) -> List[Dict[str, Any]]:
+        """Convert a list of ExtractedSymbol objects to dictionaries."""
+        return list(self._iter_symbol_dicts(symbols))
+
+    def _iter_symbol_dicts(
+        self, symbols: List[Any], fields: Optional[Sequence[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily convert ExtractedSymbol objects to (projected) dictionaries."""
+        if fields is None:
+            for symbol in symbols:
+                yield self._symbol_to_dict(symbol)
+            return
+
+        keys = tuple(fields)
+        get_values = _symbol_values_getter(keys)
+        normalize_decorators = "decorators" in keys
+        for symbol in symbols:
+            symbol_dict = dict(zip(keys, get_values(symbol)))
+            if normalize_decorators and not symbol_dict["decorators"]:
+                symbol_dict["decorators"] = []
+            yield symbol_dict
+
+    @staticmethod
+    def _symbol_cache_key(file_path: str) -> Tuple[str, int, int]:
+        """Build the (absolute path, mtime_ns, size) symbol cache key."""
+        abs_path = os.path.abspath(file_path)
+        stat = os.stat(abs_path)
+        return (abs_path, stat.st_mtime_ns, stat.st_size)
+
+    def _get_cached_symbols(self, file_path: str) -> List[Any]:
+        """
+        Return extracted symbols, re-indexing only when the file changed.
+
+        Entries are keyed by (absolute path, mtime_ns, size), so an unchanged
+        file is served without re-reading or re-hashing it.
+        """
+        key = self._symbol_cache_key(file_path)
+        abs_path = key[0]
+
+        symbols = self._lookup_symbols(key)
+        if symbols is None:
+            symbols = self.symbol_indexer.get_file_symbols(abs_path)
+            self._store_symbols(key, symbols)
+        return symbols
+
+    def _lookup_symbols(self, key: Tuple[str, int, int]) -> Optional[List[Any]]:
+        """Return cached symbols for a file if it is unchanged since indexing."""
+        entry = self._symbol_cache.get(key[0])
+        if entry is None or entry[0] != key:
+            return None
+        self._symbol_cache.move_to_end(key[0])
+        return entry[1]
+
+    def _store_symbols(self, key: Tuple[str, int, int], symbols: List[Any]) -> None:
+        """Cache a file's symbols, replacing any older version of that file."""
+        self._symbol_cache[key[0]] = (key, symbols)
+        self._symbol_cache.move_to_end(key[0])
+        if len(self._symbol_cache) > SYMBOL_CACHE_SIZE:
+            self._symbol_cache.popitem(last=False)
 
     def _symbol_to_dict(self, symbol: Any) -> Dict[str, Any]:
         """
@@ -429,12 +723,7 @@ class ProjectContextCollector:
         Returns:
             Dictionary representation of symbol
         """
-        return {
-            "name": symbol.name,
-            "type": symbol.symbol_type,
-            "signature": symbol.signature,
-            "line": symbol.line_number,
-            "parent_class": symbol.parent_class,
-            "decorators": symbol.decorators if symbol.decorators else [],
-            "docstring": symbol.docstring,
-        }
+        symbol_dict = dict(zip(_SYMBOL_KEYS, _get_symbol_values(symbol)))
+        if not symbol_dict["decorators"]:
+            symbol_dict["decorators"] = []
+        return symbol_dict
@@ -6,7 +6,11 @@ Error categories (AC3) for LLM API failures.
 
 
 class EnhancementError(Exception):
-    """Base exception for enhancement errors."""
+    """Base exception for enhancement errors.
+
+    Subclasses declare a fixed category and recovery_suggestion as class
+    attributes; direct instantiation passes them per instance.
+    """
 
     def __init__(self, message: str, category: str, recovery_suggestion: str = None):
         self.message = message
@@ -18,53 +22,53 @@ class EnhancementError(Exception):
 class AuthenticationError(EnhancementError):
     """API key invalid or missing (AC3)."""
 
+    category = "AUTH_ERROR"
+    recovery_suggestion = "Check your API key configuration"
+
     def __init__(self, message: str = "API key invalid or missing"):
-        super().__init__(
-            message,
-            category="AUTH_ERROR",
-            recovery_suggestion="Check your API key configuration",
-        )
+        self.message = message
+        Exception.__init__(self, message)
 
 
 class RateLimitError(EnhancementError):
     """Too many API requests (AC3)."""
 
+    category = "RATE_LIMIT_ERROR"
+    recovery_suggestion = "Wait a moment and try again"
+
     def __init__(self, message: str = "API rate limit exceeded"):
-        super().__init__(
-            message,
-            category="RATE_LIMIT_ERROR",
-            recovery_suggestion="Wait a moment and try again",
-        )
+        self.message = message
+        Exception.__init__(self, message)
 
 
 class TimeoutError(EnhancementError):
     """API request timed out (AC3)."""
 
+    category = "TIMEOUT_ERROR"
+    recovery_suggestion = "Request timeout - try again with a simpler prompt"
+
     def __init__(self, message: str = "API request timed out"):
-        super().__init__(
-            message,
-            category="TIMEOUT_ERROR",
-            recovery_suggestion="Request timeout - try again with a simpler prompt",
-        )
+        self.message = message
+        Exception.__init__(self, message)
 
 
 class ServerError(EnhancementError):
     """LLM service unavailable (AC3)."""
 
+    category = "SERVER_ERROR"
+    recovery_suggestion = "Try again in a few moments"
+
     def __init__(self, message: str = "LLM service unavailable"):
-        super().__init__(
-            message,
-            category="SERVER_ERROR",
-            recovery_suggestion="Try again in a few moments",
-        )
+        self.message = message
+        Exception.__init__(self, message)
 
 
 class ValidationError(EnhancementError):
     """Response validation failed (AC2)."""
 
+    category = "VALIDATION_ERROR"
+    recovery_suggestion = "Try with a different prompt"
+
     def __init__(self, message: str = "Response validation failed"):
-        super().__init__(
-            message,
-            category="VALIDATION_ERROR",
-            recovery_suggestion="Try with a different prompt",
-        )
+        self.message = message
+        Exception.__init__(self, message)
@@ -5,18 +5,29 @@ Combines ProjectContext, PromptBuilder, and LLM providers to generate
 project-aware enhancements (AC1-AC8).
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
 import time
-from dataclasses import dataclass
-from typing import Optional, Tuple
-from openai import AuthenticationError, RateLimitError
-from openai import APITimeoutError as OpenAITimeout
+from array import array
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from .context import ProjectContext
 from .prompt_builder import PromptBuilder
-from .llm_provider import LLMProvider, create_provider, LLMResponse
+from .llm_provider import (
+    ContextLengthError,
+    LLMProvider,
+    LLMResponse,
+    SemanticCache,
+    create_provider,
+    track_streamed,
+)
 from .response_validator import ResponseValidator
+from .result_cache import CacheBackend
 from .exceptions import (
     EnhancementError,
     AuthenticationError as AuthError,
@@ -28,6 +39,40 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# openai SDK exception classes, imported on the first failed call so that
+# importing this module does not load the SDK
+_openai_errors: Optional[Tuple[type, type, Tuple[type, ...]]] = None
+
+
+def _get_openai_errors() -> Tuple[type, type, Tuple[type, ...]]:
+    """Return the (auth, rate limit, timeout) exception classes to classify."""
+    global _openai_errors
+    if _openai_errors is None:
+        from openai import AuthenticationError, RateLimitError
+        from openai import APITimeoutError as OpenAITimeout
+
+        # Providers re-raise SDK timeouts as the builtin TimeoutError, and
+        # asyncio.wait_for raises asyncio.TimeoutError (an alias from 3.11)
+        _openai_errors = (
+            AuthenticationError,
+            RateLimitError,
+            (OpenAITimeout, asyncio.TimeoutError, TimeoutError),
+        )
+    return _openai_errors
+
+
+# Degraded output: the original prompt followed by static generic guidance
+_GENERIC_ENHANCEMENT_TEMPLATE = (
+    "{prompt}\n\n"
+    "[Generic enhancement - project-specific guidance not available]\n\n"
+    "Key considerations:\n"
+    "1. Clearly define requirements\n"
+    "2. Provide implementation steps\n"
+    "3. Include testing approach\n"
+    "4. Handle edge cases\n"
+    "5. Document assumptions"
+)
+
 
 @dataclass
 class EnhancementResult:
@@ -66,23 +111,62 @@ class EnhancementGenerator:
     HARD_TIMEOUT_SECONDS = 30  # Absolute limit
     MAX_RETRIES = 1  # Retry once on certain errors
 
-    def __init__(self, project_root: Optional[str] = None):
+    # Circuit breaker: skip a provider for a while after repeated failures
+    BREAKER_FAILURE_THRESHOLD = 3
+    BREAKER_COOLDOWN_SECONDS = 60.0
+
+    # Exact-match response cache (most recently used entries kept)
+    RESPONSE_CACHE_SIZE = 256
+    PERSISTENT_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+    def __init__(
+        self,
+        project_root: Optional[str] = None,
+        cache_enabled: bool = True,
+        cache: Optional[CacheBackend] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+    ):
         """
         Initialize enhancement generator.
 
         Args:
             project_root: Root directory of project
+            cache_enabled: Reuse results for identical LLM prompts
+            cache: Persistent backend that shares results across processes,
+                consulted after the in-memory cache
+            semantic_cache: Also reuse results for user prompts similar to
+                an earlier one with the same system prompt and project
+                context (off by default)
         """
         self.project_root = project_root
         self.prompt_builder = PromptBuilder()
         self.response_validator = ResponseValidator()
+        self.cache_enabled = cache_enabled
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        self._response_cache: "OrderedDict[str, EnhancementResult]" = OrderedDict()
+        # Provider name -> (consecutive failures, monotonic time of the last one)
+        self._breaker: Dict[str, Tuple[int, float]] = {}
+        self.refresh_credentials()
         logger.debug("Initialized EnhancementGenerator")
 
+    def refresh_credentials(self) -> None:
+        """
+        Re-read API keys from the environment.
+
+        Keys are read once at construction and the providers built from
+        them are reused; call this after rotating keys at runtime.
+        """
+        self._openai_key = os.getenv("OPENAI_API_KEY")
+        self._deepseek_key = os.getenv("DEEPSEEK_API_KEY")
+        self._providers: Optional[List[LLMProvider]] = None
+
     def generate_enhancement(
         self,
         user_prompt: str,
         project_context: ProjectContext,
         use_degradation: bool = True,
+        stream_callback: Optional[Callable[[str], None]] = None,
     ) -> EnhancementResult:
         """
         Generate project-aware enhancement.
@@ -96,6 +180,10 @@ class EnhancementGenerator:
             user_prompt: Original user prompt
             project_context: Collected project context (from Story 3.1)
             use_degradation: Allow graceful degradation on failure
+            stream_callback: Receives response text as it streams in; a
+                cache hit delivers the cached enhancement in one call. Once
+                text has streamed, a failed call is raised instead of being
+                retried or failed over, so no text is delivered twice
 
         Returns:
             EnhancementResult with enhanced prompt
@@ -104,127 +192,511 @@ class EnhancementGenerator:
             EnhancementError: If enhancement fails completely
         """
         logger.info(f"Generating enhancement for prompt ({len(user_prompt)} chars)")
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
-            # Step 1: Select LLM provider (AC6)
-            provider = self._select_provider()
+            # Step 1: Build structured prompt (AC1, AC5)
+            system_prompt, llm_prompt, cache_key, prompt_cache_key = (
+                self._prepare_request(user_prompt, project_context)
+            )
 
-            # Step 2: Build structured prompt (AC1, AC5)
-            llm_prompt = self.prompt_builder.build_prompt(
-                user_prompt=user_prompt,
-                project_context=project_context,
+            # The prompt was already answered - skip the API call
+            cached, vector = self._get_cached_result(
+                cache_key, prompt_cache_key, user_prompt, start_time
             )
-            system_prompt = self.prompt_builder.build_system_prompt()
+            if cached is not None:
+                if stream_callback is not None:
+                    stream_callback(cached.enhanced_prompt)
+                return cached
 
-            logger.debug(f"Built LLM prompt ({len(llm_prompt)} chars)")
+            # Step 2: Select LLM providers in fallback order (AC6)
+            providers = self._select_providers()
 
             # Step 3: Call LLM API (AC1, AC3)
-            response = self._call_llm_with_retry(
-                provider=provider,
+            provider, response = self._call_with_fallback(
+                providers=providers,
                 system_prompt=system_prompt,
                 user_message=llm_prompt,
                 timeout_seconds=self.HARD_TIMEOUT_SECONDS,
+                prompt_cache_key=prompt_cache_key,
+                stream_callback=stream_callback,
             )
 
-            # Step 4: Validate response (AC2)
-            is_valid, violations = self.response_validator.validate_response(
-                response=response.content,
-                original_prompt=user_prompt,
+            # Step 4: Validate response and build result (AC2)
+            return self._build_result(
+                user_prompt,
+                provider,
+                response,
+                start_time,
+                cache_key,
+                prompt_cache_key,
+                vector,
             )
 
-            if not is_valid:
-                logger.warning(f"Response validation failed: {violations}")
-                raise ValidationError(
-                    f"Response validation failed: {', '.join(violations)}"
-                )
+        except EnhancementError:
+            # Expected enhancement error
+            raise
+        except Exception as e:
+            return self._handle_unexpected_error(e, user_prompt, use_degradation)
+
+    async def agenerate_enhancement(
+        self,
+        user_prompt: str,
+        project_context: ProjectContext,
+        use_degradation: bool = True,
+        stream_callback: Optional[Callable[[str], None]] = None,
+    ) -> EnhancementResult:
+        """
+        Generate project-aware enhancement without blocking the event loop.
+
+        Same behavior as generate_enhancement, but providers are called
+        through LLMProvider.acall so a batch driver can asyncio.gather()
+        many enhancements and overlap their network time.
+
+        Args:
+            user_prompt: Original user prompt
+            project_context: Collected project context (from Story 3.1)
+            use_degradation: Allow graceful degradation on failure
+            stream_callback: As for generate_enhancement
+
+        Returns:
+            EnhancementResult with enhanced prompt
+
+        Raises:
+            EnhancementError: If enhancement fails completely
+        """
+        logger.info(f"Generating enhancement for prompt ({len(user_prompt)} chars)")
+        start_time = time.monotonic()
 
-            # Success - return result
-            elapsed = time.time() - start_time
-            estimated_cost = provider.estimate_cost(
-                response.tokens_input,
-                response.tokens_output,
+        try:
+            system_prompt, llm_prompt, cache_key, prompt_cache_key = (
+                self._prepare_request(user_prompt, project_context)
             )
 
-            result = EnhancementResult(
-                original_prompt=user_prompt,
-                enhanced_prompt=self.response_validator.sanitize_response(
-                    response.content
-                ),
-                provider=response.provider,
-                tokens_input=response.tokens_input,
-                tokens_output=response.tokens_output,
-                estimated_cost=estimated_cost,
-                generation_time_seconds=elapsed,
-                was_degraded=False,
+            cached, vector = self._get_cached_result(
+                cache_key, prompt_cache_key, user_prompt, start_time
             )
+            if cached is not None:
+                if stream_callback is not None:
+                    stream_callback(cached.enhanced_prompt)
+                return cached
+
+            providers = self._select_providers()
 
-            logger.info(
-                f"Enhancement successful: {response.tokens_input} input, "
-                f"{response.tokens_output} output, ${estimated_cost:.4f}, {elapsed:.2f}s"
+            provider, response = await self._acall_with_fallback(
+                providers=providers,
+                system_prompt=system_prompt,
+                user_message=llm_prompt,
+                timeout_seconds=self.HARD_TIMEOUT_SECONDS,
+                prompt_cache_key=prompt_cache_key,
+                stream_callback=stream_callback,
             )
 
-            return result
+            return self._build_result(
+                user_prompt,
+                provider,
+                response,
+                start_time,
+                cache_key,
+                prompt_cache_key,
+                vector,
+            )
 
         except EnhancementError:
-            # Expected enhancement error
             raise
         except Exception as e:
-            # Unexpected error
-            logger.error(f"Unexpected error in enhancement: {e}")
-            if use_degradation:
-                return self._degrade_to_generic_enhancement(
-                    user_prompt=user_prompt,
-                    reason=str(e),
+            return self._handle_unexpected_error(e, user_prompt, use_degradation)
+
+    def _prepare_request(
+        self, user_prompt: str, project_context: ProjectContext
+    ) -> Tuple[str, str, Optional[str], str]:
+        """
+        Build the prompts for an enhancement request (AC1, AC5).
+
+        The provider prompt cache key identifies the static prefix (system
+        prompt plus project context), so requests for the same project are
+        routed to the same provider-side prefix cache. It also scopes the
+        semantic cache, so different projects never share an entry.
+
+        Returns:
+            Tuple of (system prompt, LLM prompt, response cache key,
+            provider prompt cache key)
+        """
+        context_prompt = self.prompt_builder.build_context_prompt(project_context)
+        llm_prompt = self.prompt_builder.build_prompt(
+            user_prompt=user_prompt,
+            project_context=project_context,
+            context_prompt=context_prompt,
+        )
+        system_prompt = self.prompt_builder.build_system_prompt()
+
+        logger.debug(f"Built LLM prompt ({len(llm_prompt)} chars)")
+
+        cache_key = self._cache_key(system_prompt, context_prompt, user_prompt)
+        prompt_cache_key = hashlib.sha256(
+            f"{system_prompt}\x1f{context_prompt}".encode("utf-8")
+        ).hexdigest()[:32]
+        return system_prompt, llm_prompt, cache_key, prompt_cache_key
+
+    def _build_result(
+        self,
+        user_prompt: str,
+        provider: LLMProvider,
+        response: LLMResponse,
+        start_time: float,
+        cache_key: Optional[str],
+        prompt_cache_key: str,
+        vector: Optional[array],
+    ) -> EnhancementResult:
+        """
+        Validate an LLM response and turn it into an EnhancementResult (AC2).
+
+        A successful result is cached; vector is the user prompt embedding
+        from a semantic cache miss, if any.
+
+        Raises:
+            ValidationError: If the response fails validation
+        """
+        is_valid, violations = self.response_validator.validate_response(
+            response=response.content,
+            original_prompt=user_prompt,
+        )
+
+        if not is_valid:
+            logger.warning(f"Response validation failed: {violations}")
+            raise ValidationError(
+                f"Response validation failed: {', '.join(violations)}"
+            )
+
+        # Success - return result
+        elapsed = time.monotonic() - start_time
+        estimated_cost = provider.estimate_cost(
+            response.tokens_input,
+            response.tokens_output,
+        )
+
+        result = EnhancementResult(
+            original_prompt=user_prompt,
+            enhanced_prompt=self.response_validator.sanitize_response(
+                response.content
+            ),
+            provider=response.provider,
+            tokens_input=response.tokens_input,
+            tokens_output=response.tokens_output,
+            estimated_cost=estimated_cost,
+            generation_time_seconds=elapsed,
+            was_degraded=False,
+        )
+
+        logger.info(
+            f"Enhancement successful: {response.tokens_input} input, "
+            f"{response.tokens_output} output, ${estimated_cost:.4f}, {elapsed:.2f}s"
+        )
+
+        self._store_cached_result(cache_key, result, prompt_cache_key, vector)
+        return result
+
+    def _handle_unexpected_error(
+        self, error: Exception, user_prompt: str, use_degradation: bool
+    ) -> EnhancementResult:
+        """Degrade to a generic enhancement, or wrap the error (AC4)."""
+        logger.error(f"Unexpected error in enhancement: {error}")
+        if use_degradation:
+            return self._degrade_to_generic_enhancement(
+                user_prompt=user_prompt,
+                reason=str(error),
+            )
+        raise EnhancementError(
+            f"Enhancement failed: {error}",
+            category="UNEXPECTED_ERROR",
+        ) from error
+
+    def _cache_key(
+        self, system_prompt: str, context_prompt: str, user_prompt: str
+    ) -> Optional[str]:
+        """
+        Return the response cache key for a request, if caching is on.
+
+        All three prompts are keyed verbatim: a difference in case or
+        whitespace can change the meaning of code in a prompt.
+        """
+        if not self.cache_enabled:
+            return None
+        payload = f"{system_prompt}\x1f{context_prompt}\x1f{user_prompt}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_cached_result(
+        self,
+        cache_key: Optional[str],
+        scope: str,
+        user_prompt: str,
+        start_time: float,
+    ) -> Tuple[Optional[EnhancementResult], Optional[array]]:
+        """
+        Return a copy of a cached result, or None on a miss.
+
+        The exact key is tried first, then the semantic cache if one is
+        set. A hit made no API call, so it reports zero cost and its own
+        timing, and carries the caller's prompt as original_prompt.
+
+        Returns:
+            Tuple of (cached result or None, user prompt embedding or None)
+        """
+        if cache_key is None:
+            return None, None
+
+        vector = None
+        cached = self._lookup_result(cache_key)
+        if cached is None and self.semantic_cache is not None:
+            vector = self.semantic_cache.embed_text(user_prompt)
+            similar_key = self.semantic_cache.lookup(vector, scope)
+            if similar_key is not None:
+                cached = self._lookup_result(similar_key)
+                if cached is not None:
+                    logger.info("Enhancement served for a similar prompt")
+
+        if cached is None:
+            return None, vector
+
+        result = replace(
+            cached,
+            original_prompt=user_prompt,
+            estimated_cost=0.0,
+            generation_time_seconds=time.monotonic() - start_time,
+            quality_warnings=list(cached.quality_warnings),
+        )
+        return result, vector
+
+    def _lookup_result(self, cache_key: str) -> Optional[EnhancementResult]:
+        """Find a result in memory, then in the persistent cache."""
+        if cache_key in self._response_cache:
+            self._response_cache.move_to_end(cache_key)
+            logger.info("Enhancement served from response cache")
+            return self._response_cache[cache_key]
+
+        cached = self._load_persisted_result(cache_key)
+        if cached is not None:
+            self._remember_result(cache_key, cached)
+            logger.info("Enhancement served from persistent cache")
+        return cached
+
+    def _store_cached_result(
+        self,
+        cache_key: Optional[str],
+        result: EnhancementResult,
+        scope: Optional[str] = None,
+        vector: Optional[array] = None,
+    ) -> None:
+        """Remember a successful result in memory and the persistent cache."""
+        if cache_key is None:
+            return
+
+        self._remember_result(cache_key, result)
+        if vector is not None:
+            # Similar prompts resolve to this result through its exact key
+            self.semantic_cache.add(vector, cache_key, scope)
+        if self.cache is not None:
+            try:
+                self.cache.set(
+                    cache_key,
+                    json.dumps(asdict(result)),
+                    self.PERSISTENT_CACHE_TTL_SECONDS,
                 )
-            else:
-                raise EnhancementError(
-                    f"Enhancement failed: {e}",
-                    category="UNEXPECTED_ERROR",
-                ) from e
+            except Exception as e:
+                logger.warning(f"Could not write persistent cache: {e}")
 
-    def _select_provider(self) -> LLMProvider:
+    def _remember_result(self, cache_key: str, result: EnhancementResult) -> None:
+        """Keep a result in memory, evicting the least recently used."""
+        # Keep a private copy so callers mutating their result can't alter it
+        self._response_cache[cache_key] = replace(
+            result, quality_warnings=list(result.quality_warnings)
+        )
+        self._response_cache.move_to_end(cache_key)
+        if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
+    def _load_persisted_result(self, cache_key: str) -> Optional[EnhancementResult]:
+        """Read a result from the persistent cache; failures count as misses."""
+        if self.cache is None:
+            return None
+        try:
+            data = self.cache.get(cache_key)
+            return EnhancementResult(**json.loads(data)) if data else None
+        except Exception as e:
+            logger.warning(f"Could not read persistent cache: {e}")
+            return None
+
+    def _select_providers(self) -> List[LLMProvider]:
         """
-        Select LLM provider (AC6).
+        Select LLM providers in fallback order (AC6).
 
-        Tries OpenAI first, falls back to DeepSeek.
+        OpenAI first, then DeepSeek, for whichever API keys were set when
+        credentials were last read. Providers are built once and reused.
+        Providers whose circuit is open are skipped, unless every
+        provider's is.
 
         Returns:
-            LLMProvider instance
+            Non-empty list of LLMProvider instances
 
         Raises:
             AuthenticationError: If no valid API keys available
         """
-        openai_key = os.getenv("OPENAI_API_KEY")
-        deepseek_key = os.getenv("DEEPSEEK_API_KEY")
-
-        if openai_key:
-            logger.debug("Using OpenAI provider")
-            return create_provider("openai", openai_key)
-        elif deepseek_key:
-            logger.debug("Using DeepSeek provider (OpenAI unavailable)")
-            return create_provider("deepseek", deepseek_key)
-        else:
+        if self._providers is None:
+            providers = []
+            if self._openai_key:
+                providers.append(create_provider("openai", self._openai_key))
+            if self._deepseek_key:
+                providers.append(create_provider("deepseek", self._deepseek_key))
+            self._providers = providers
+
+        if not self._providers:
             logger.error("No API keys available")
             raise AuthError("No OPENAI_API_KEY or DEEPSEEK_API_KEY found")
 
+        providers = [p for p in self._providers if not self._circuit_open(p)]
+        if not providers:
+            # Nothing healthy to fall back to - try them all anyway
+            providers = list(self._providers)
+
+        logger.debug(
+            f"Provider order: {', '.join(p.get_provider_name() for p in providers)}"
+        )
+        return providers
+
+    def breaker_status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Report circuit breaker state for providers that have failed.
+
+        Returns:
+            Provider name -> {"failures", "open", "retry_in_seconds"}
+        """
+        now = time.monotonic()
+        status = {}
+        for name, (failures, opened_at) in self._breaker.items():
+            remaining = 0.0
+            if failures >= self.BREAKER_FAILURE_THRESHOLD:
+                remaining = max(0.0, opened_at + self.BREAKER_COOLDOWN_SECONDS - now)
+            status[name] = {
+                "failures": failures,
+                "open": remaining > 0,
+                "retry_in_seconds": remaining,
+            }
+        return status
+
+    def _circuit_open(self, provider: LLMProvider) -> bool:
+        """Whether a provider is still cooling down after repeated failures."""
+        failures, opened_at = self._breaker.get(provider.get_provider_name(), (0, 0.0))
+        return (
+            failures >= self.BREAKER_FAILURE_THRESHOLD
+            and time.monotonic() - opened_at < self.BREAKER_COOLDOWN_SECONDS
+        )
+
+    def _record_outcome(self, provider: LLMProvider, succeeded: bool) -> None:
+        """Reset a provider's breaker on success, or count a failure."""
+        name = provider.get_provider_name()
+        if succeeded:
+            self._breaker.pop(name, None)
+            return
+
+        failures = self._breaker.get(name, (0, 0.0))[0] + 1
+        self._breaker[name] = (failures, time.monotonic())
+        if failures == self.BREAKER_FAILURE_THRESHOLD:
+            logger.warning(
+                f"{name} failed {failures} times in a row, skipping it for "
+                f"{self.BREAKER_COOLDOWN_SECONDS:.0f}s"
+            )
+
+    def _select_provider(self) -> LLMProvider:
+        """
+        Select the preferred LLM provider (AC6).
+
+        Returns:
+            First provider from _select_providers
+
+        Raises:
+            AuthenticationError: If no valid API keys available
+        """
+        return self._select_providers()[0]
+
+    def _call_with_fallback(
+        self,
+        providers: List[LLMProvider],
+        system_prompt: str,
+        user_message: str,
+        timeout_seconds: int,
+        prompt_cache_key: Optional[str] = None,
+        stream_callback: Optional[Callable[[str], None]] = None,
+    ) -> Tuple[LLMProvider, LLMResponse]:
+        """
+        Call providers in order until one succeeds (AC4, AC6).
+
+        While another provider remains, auth errors, timeouts and server
+        errors move straight on to it instead of retrying; rate limits keep
+        their single retry. The last provider gets the full retry behavior.
+
+        Once the stream callback has received text, a failure is raised
+        instead of moving on, so the answer is never streamed twice.
+
+        Returns:
+            Tuple of (provider that answered, its LLMResponse)
+
+        Raises:
+            EnhancementError subclass from the last provider tried
+        """
+        streamed: List[bool] = []
+        callback = track_streamed(stream_callback, streamed)
+        last_index = len(providers) - 1
+        for index, provider in enumerate(providers):
+            try:
+                response = self._call_llm_with_retry(
+                    provider=provider,
+                    system_prompt=system_prompt,
+                    user_message=user_message,
+                    timeout_seconds=timeout_seconds,
+                    fail_fast=index < last_index,
+                    prompt_cache_key=prompt_cache_key,
+                    stream_callback=callback,
+                    streamed=streamed,
+                )
+                self._record_outcome(provider, succeeded=True)
+                return provider, response
+            except (AuthError, RateLimitErr, TimeoutErr, ServerError) as e:
+                self._record_outcome(provider, succeeded=False)
+                if index == last_index or streamed:
+                    raise
+                logger.warning(
+                    f"{provider.get_provider_name()} failed ({e.category}), "
+                    f"falling back to {providers[index + 1].get_provider_name()}"
+                )
+
     def _call_llm_with_retry(
         self,
         provider: LLMProvider,
         system_prompt: str,
         user_message: str,
         timeout_seconds: int,
+        fail_fast: bool = False,
+        prompt_cache_key: Optional[str] = None,
+        stream_callback: Optional[Callable[[str], None]] = None,
+        streamed: Optional[List[bool]] = None,
     ) -> LLMResponse:
         """
         Call LLM with retry logic (AC3, AC4).
 
-        Retries once on timeout/network errors, not on auth errors.
+        Retries once on timeout/network errors, not on auth errors, and
+        never after the stream callback has received text.
 
         Args:
             provider: LLM provider to use
             system_prompt: System prompt with context
             user_message: User message
             timeout_seconds: Hard timeout limit
+            fail_fast: Raise timeout/network errors without retrying, for
+                when a fallback provider will take over
+            prompt_cache_key: Provider prompt cache routing key
+            stream_callback: Receives response text as it streams in
+            streamed: Records text delivered to stream_callback when the
+                caller has already wrapped it with track_streamed
 
         Returns:
             LLMResponse from successful call
@@ -232,6 +704,9 @@ class EnhancementGenerator:
         Raises:
             EnhancementError subclass for various error types
         """
+        if streamed is None:
+            streamed = []
+            stream_callback = track_streamed(stream_callback, streamed)
         for attempt in range(self.MAX_RETRIES + 1):
             try:
                 logger.debug(f"LLM call attempt {attempt + 1}/{self.MAX_RETRIES + 1}")
@@ -240,49 +715,157 @@ class EnhancementGenerator:
                     system_prompt=system_prompt,
                     user_message=user_message,
                     timeout_seconds=timeout_seconds,
+                    prompt_cache_key=prompt_cache_key,
+                    stream_callback=stream_callback,
                 )
 
                 logger.debug(f"LLM call succeeded on attempt {attempt + 1}")
                 return response
 
-            except AuthenticationError as e:
-                # Don't retry auth errors
-                logger.error(f"Authentication error: {e}")
-                raise AuthError(str(e)) from e
-
-            except RateLimitError as e:
-                # Might succeed on retry
-                if attempt < self.MAX_RETRIES:
-                    logger.warning(
-                        f"Rate limited, retrying... ({attempt + 1}/{self.MAX_RETRIES})"
-                    )
-                    time.sleep(1)  # Brief backoff
-                    continue
-                else:
-                    logger.error(f"Rate limit exceeded: {e}")
-                    raise RateLimitErr(str(e)) from e
-
-            except OpenAITimeout as e:
-                # Might succeed on retry
-                if attempt < self.MAX_RETRIES:
-                    logger.warning(
-                        f"Timeout, retrying... ({attempt + 1}/{self.MAX_RETRIES})"
-                    )
-                    time.sleep(0.5)  # Brief backoff
-                    continue
-                else:
-                    logger.error(f"Timeout after {timeout_seconds}s")
-                    raise TimeoutErr(f"LLM timeout after {timeout_seconds}s") from e
+            except Exception as e:
+                time.sleep(
+                    self._retry_delay(e, attempt, timeout_seconds, fail_fast, streamed)
+                )
+
+    async def _acall_with_fallback(
+        self,
+        providers: List[LLMProvider],
+        system_prompt: str,
+        user_message: str,
+        timeout_seconds: int,
+        prompt_cache_key: Optional[str] = None,
+        stream_callback: Optional[Callable[[str], None]] = None,
+    ) -> Tuple[LLMProvider, LLMResponse]:
+        """Async counterpart of _call_with_fallback (AC4, AC6)."""
+        streamed: List[bool] = []
+        callback = track_streamed(stream_callback, streamed)
+        last_index = len(providers) - 1
+        for index, provider in enumerate(providers):
+            try:
+                response = await self._acall_llm_with_retry(
+                    provider=provider,
+                    system_prompt=system_prompt,
+                    user_message=user_message,
+                    timeout_seconds=timeout_seconds,
+                    fail_fast=index < last_index,
+                    prompt_cache_key=prompt_cache_key,
+                    stream_callback=callback,
+                    streamed=streamed,
+                )
+                self._record_outcome(provider, succeeded=True)
+                return provider, response
+            except (AuthError, RateLimitErr, TimeoutErr, ServerError) as e:
+                self._record_outcome(provider, succeeded=False)
+                if index == last_index or streamed:
+                    raise
+                logger.warning(
+                    f"{provider.get_provider_name()} failed ({e.category}), "
+                    f"falling back to {providers[index + 1].get_provider_name()}"
+                )
+
+    async def _acall_llm_with_retry(
+        self,
+        provider: LLMProvider,
+        system_prompt: str,
+        user_message: str,
+        timeout_seconds: int,
+        fail_fast: bool = False,
+        prompt_cache_key: Optional[str] = None,
+        stream_callback: Optional[Callable[[str], None]] = None,
+        streamed: Optional[List[bool]] = None,
+    ) -> LLMResponse:
+        """
+        Async counterpart of _call_llm_with_retry (AC3, AC4).
+
+        The hard timeout is enforced with asyncio.wait_for, so a hung
+        provider is abandoned without holding a thread.
+        """
+        if streamed is None:
+            streamed = []
+            stream_callback = track_streamed(stream_callback, streamed)
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                logger.debug(f"LLM call attempt {attempt + 1}/{self.MAX_RETRIES + 1}")
+
+                response = await asyncio.wait_for(
+                    provider.acall(
+                        system_prompt=system_prompt,
+                        user_message=user_message,
+                        timeout_seconds=timeout_seconds,
+                        prompt_cache_key=prompt_cache_key,
+                        stream_callback=stream_callback,
+                    ),
+                    timeout=timeout_seconds,
+                )
+
+                logger.debug(f"LLM call succeeded on attempt {attempt + 1}")
+                return response
 
             except Exception as e:
-                # Unknown error
-                if attempt < self.MAX_RETRIES:
-                    logger.warning(f"API error, retrying: {e}")
-                    time.sleep(0.5)
-                    continue
-                else:
-                    logger.error(f"API error: {e}")
-                    raise ServerError(f"LLM API error: {e}") from e
+                await asyncio.sleep(
+                    self._retry_delay(e, attempt, timeout_seconds, fail_fast, streamed)
+                )
+
+    def _retry_delay(
+        self,
+        error: Exception,
+        attempt: int,
+        timeout_seconds: int,
+        fail_fast: bool,
+        streamed: Sequence[bool] = (),
+    ) -> float:
+        """
+        Classify a failed LLM call (AC3, AC4).
+
+        Auth errors are never retried. Rate limits get one retry even when
+        fail_fast is set; timeouts and other API errors only without it.
+        Nothing is retried once streamed records delivered text.
+
+        Returns:
+            Seconds to back off before the next attempt
+
+        Raises:
+            EnhancementError subclass when the call should not be retried
+        """
+        can_retry = attempt < self.MAX_RETRIES and not streamed
+        auth_errors, rate_limit_errors, timeout_errors = _get_openai_errors()
+
+        if isinstance(error, auth_errors):
+            # Don't retry auth errors
+            logger.error(f"Authentication error: {error}")
+            raise AuthError(str(error)) from error
+
+        if isinstance(error, rate_limit_errors):
+            # Might succeed on retry
+            if can_retry:
+                logger.warning(
+                    f"Rate limited, retrying... ({attempt + 1}/{self.MAX_RETRIES})"
+                )
+                return 1.0  # Brief backoff
+            logger.error(f"Rate limit exceeded: {error}")
+            raise RateLimitErr(str(error)) from error
+
+        if isinstance(error, timeout_errors):
+            # Might succeed on retry
+            if can_retry and not fail_fast:
+                logger.warning(
+                    f"Timeout, retrying... ({attempt + 1}/{self.MAX_RETRIES})"
+                )
+                return 0.5  # Brief backoff
+            logger.error(f"Timeout after {timeout_seconds}s")
+            raise TimeoutErr(f"LLM timeout after {timeout_seconds}s") from error
+
+        if isinstance(error, ContextLengthError):
+            # The same prompt cannot fit on a retry either
+            logger.error(f"Prompt too long: {error}")
+            raise ServerError(f"LLM API error: {error}") from error
+
+        # Unknown error
+        if can_retry and not fail_fast:
+            logger.warning(f"API error, retrying: {error}")
+            return 0.5
+        logger.error(f"API error: {error}")
+        raise ServerError(f"LLM API error: {error}") from error
 
     def _degrade_to_generic_enhancement(
         self,
@@ -304,16 +887,7 @@ class EnhancementGenerator:
         logger.warning(f"Degrading to generic enhancement: {reason}")
 
         # Simple generic enhancement (note: no project-aware customization)
-        enhanced = (
-            f"{user_prompt}\n\n"
-            f"[Generic enhancement - project-specific guidance not available]\n\n"
-            f"Key considerations:\n"
-            f"1. Clearly define requirements\n"
-            f"2. Provide implementation steps\n"
-            f"3. Include testing approach\n"
-            f"4. Handle edge cases\n"
-            f"5. Document assumptions"
-        )
+        enhanced = _GENERIC_ENHANCEMENT_TEMPLATE.format(prompt=user_prompt)
 
         return EnhancementResult(
             original_prompt=user_prompt,
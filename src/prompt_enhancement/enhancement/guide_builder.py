@@ -5,9 +5,12 @@ Implements AC6-AC8: Create implementation guide, handle multiple paths,
 and validate completeness.
 """
 
+import heapq
 import logging
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Tuple
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Dict, Tuple
 from enum import Enum
 
 from .step_extractor import ExtractedSteps, ImplementationStep
@@ -16,6 +19,35 @@ from .context import ProjectContext
 
 logger = logging.getLogger(__name__)
 
+# Rollback advice does not depend on the steps, so it is built once
+_ROLLBACK_INSTRUCTIONS = (
+    "Rollback Instructions:\n"
+    "If implementation fails or needs to be reverted:\n"
+    "1. Revert any modified files to their previous state\n"
+    "2. Remove any newly created files\n"
+    "3. Restore any configuration to original state\n"
+    "4. Restart affected services if needed\n"
+    "Consider implementing in a feature branch to simplify rollback."
+)
+
+# Tradeoffs of the built-in alternative paths (AC7), shared read-only
+_SIMPLE_TRADEOFFS = MappingProxyType(
+    {
+        "complexity": "Low",
+        "implementation_time": "Quick",
+        "robustness": "Moderate",
+        "maintainability": "Good",
+    }
+)
+_ROBUST_TRADEOFFS = MappingProxyType(
+    {
+        "complexity": "Moderate",
+        "implementation_time": "Longer",
+        "robustness": "High",
+        "maintainability": "Excellent",
+    }
+)
+
 
 class ImplementationPath(Enum):
     """Different implementation approaches (AC7)."""
@@ -42,9 +74,9 @@ class PathAlternative:
 
     path_type: ImplementationPath  # Type of approach
     description: str  # What this path means
-    steps: List[ImplementationStep]  # Steps for this path
-    criteria: List[GeneratedCriteria]  # Criteria for this path
-    tradeoffs: Dict[str, str]  # Tradeoff analysis
+    steps: Tuple[ImplementationStep, ...]  # Steps for this path
+    criteria: Tuple[GeneratedCriteria, ...]  # Criteria for this path
+    tradeoffs: Mapping[str, str]  # Tradeoff analysis (read-only)
     alignment_with_project: str  # How it aligns with project patterns
     complexity_estimate: str  # simple/moderate/complex
 
@@ -136,13 +168,9 @@ class GuideBuilder:
         )
 
         # Generate criteria for each step
-        criteria_per_step = []
-        for step in extracted_steps.steps:
-            criterion = self.criteria_gen.generate_criteria_for_step(
-                step,
-                step_index=extracted_steps.steps.index(step),
-            )
-            criteria_per_step.append(criterion)
+        criteria_per_step = self.criteria_gen.generate_criteria_for_steps(
+            extracted_steps.steps
+        )
 
         # Determine execution order
         execution_order = self._determine_execution_order(extracted_steps.steps)
@@ -154,12 +182,8 @@ class GuideBuilder:
             criteria_per_step,
         )
 
-        # Compile sections
-        sections = self._compile_sections(
-            extracted_steps,
-            criteria_per_step,
-            alternative_paths,
-        )
+        # Collect pitfalls and tips
+        pitfalls, tips = self._collect_pitfalls_and_tips(criteria_per_step)
 
         # Create overview
         overview = self._create_overview(
@@ -168,9 +192,15 @@ class GuideBuilder:
             len(alternative_paths),
         )
 
-        # Collect pitfalls and tips
-        pitfalls = self._collect_pitfalls(criteria_per_step)
-        tips = self._collect_debugging_tips(criteria_per_step)
+        # Compile sections
+        sections = self._compile_sections(
+            extracted_steps,
+            criteria_per_step,
+            alternative_paths,
+            pitfalls,
+            tips,
+            overview_text=overview,
+        )
 
         # Create guide
         guide = ImplementationGuide(
@@ -204,20 +234,36 @@ class GuideBuilder:
     def _determine_execution_order(self, steps: List[ImplementationStep]) -> List[int]:
         """Determine recommended execution order based on dependencies (AC6)."""
         # If dependencies detected, use them; otherwise, sequential order
+        by_num = {}
+        for step in steps:
+            by_num.setdefault(step.number, step)
+
+        # Kahn's algorithm: count each step's unmet dependencies (references
+        # to unknown steps are ignored) and index who waits on whom
+        unmet = {}
+        dependents = defaultdict(list)
+        for number, step in by_num.items():
+            deps = {dep for dep in step.dependencies if dep in by_num}
+            unmet[number] = len(deps)
+            for dep in deps:
+                dependents[dep].append(number)
+
+        # Among steps that are ready, the lowest-numbered goes first
+        ready = [number for number, count in unmet.items() if count == 0]
+        heapq.heapify(ready)
         order = []
-        remaining = {step.number for step in steps}
-
-        while remaining:
-            for step_num in list(remaining):
-                # Find step
-                step = next((s for s in steps if s.number == step_num), None)
-                if step is None:
-                    continue
-
-                # Check if all dependencies completed
-                if all(dep not in remaining for dep in step.dependencies):
-                    order.append(step_num)
-                    remaining.remove(step_num)
+        while ready:
+            number = heapq.heappop(ready)
+            order.append(number)
+            for dependent in dependents[number]:
+                unmet[dependent] -= 1
+                if unmet[dependent] == 0:
+                    heapq.heappush(ready, dependent)
+
+        if len(order) < len(by_num):
+            # Circular dependencies - keep the rest in document order
+            scheduled = set(order)
+            order.extend(number for number in by_num if number not in scheduled)
 
         return order if order else [s.number for s in steps]
 
@@ -226,21 +272,20 @@ class GuideBuilder:
     ) -> Dict[int, List[int]]:
         """Detect which steps can run in parallel (AC6)."""
         parallelizable = {}
+        dep_sets = [(step.number, set(step.dependencies)) for step in steps]
 
-        for step in steps:
+        for number, deps in dep_sets:
             # Steps with no dependencies on other steps can run in parallel
-            independent = []
-
-            for other_step in steps:
-                if (
-                    other_step.number != step.number
-                    and step.number not in other_step.dependencies
-                    and other_step.number not in step.dependencies
-                ):
-                    independent.append(other_step.number)
+            independent = [
+                other_number
+                for other_number, other_deps in dep_sets
+                if other_number != number
+                and number not in other_deps
+                and other_number not in deps
+            ]
 
             if independent:
-                parallelizable[step.number] = independent
+                parallelizable[number] = independent
 
         return parallelizable
 
@@ -251,6 +296,9 @@ class GuideBuilder:
     ) -> List[PathAlternative]:
         """Generate alternative implementation paths (AC7)."""
         paths = []
+        # Paths share read-only views of the guide's steps and criteria
+        steps = tuple(steps)
+        criteria = tuple(criteria)
 
         # Simple path: straight implementation
         paths.append(
@@ -259,12 +307,7 @@ class GuideBuilder:
                 description="Straightforward implementation with basic error handling",
                 steps=steps,
                 criteria=criteria,
-                tradeoffs={
-                    "complexity": "Low",
-                    "implementation_time": "Quick",
-                    "robustness": "Moderate",
-                    "maintainability": "Good",
-                },
+                tradeoffs=_SIMPLE_TRADEOFFS,
                 alignment_with_project="Aligns with project's quick implementation approach",
                 complexity_estimate="simple",
             )
@@ -277,12 +320,7 @@ class GuideBuilder:
                 description="Implementation with comprehensive error handling and logging",
                 steps=steps,  # Same steps, but with added error handling
                 criteria=criteria,
-                tradeoffs={
-                    "complexity": "Moderate",
-                    "implementation_time": "Longer",
-                    "robustness": "High",
-                    "maintainability": "Excellent",
-                },
+                tradeoffs=_ROBUST_TRADEOFFS,
                 alignment_with_project="Better for production use in project",
                 complexity_estimate="moderate",
             )
@@ -295,19 +333,15 @@ class GuideBuilder:
         extracted_steps: ExtractedSteps,
         criteria_per_step: List[GeneratedCriteria],
         alternative_paths: List[PathAlternative],
+        pitfalls: List[str],
+        tips: List[str],
+        overview_text: str,
     ) -> List[ImplementationGuideSection]:
         """Compile guide into organized sections (AC6)."""
         sections = []
 
         # Overview section
-        sections.append(
-            ImplementationGuideSection(
-                name="Overview",
-                content=self._create_overview(
-                    extracted_steps, len(criteria_per_step), len(alternative_paths)
-                ),
-            )
-        )
+        sections.append(ImplementationGuideSection(name="Overview", content=overview_text))
 
         # Implementation Steps section
         steps_section = ImplementationGuideSection(
@@ -368,7 +402,6 @@ class GuideBuilder:
             sections.append(alt_section)
 
         # Common Pitfalls section
-        pitfalls = self._collect_pitfalls(criteria_per_step)
         if pitfalls:
             pitfall_section = ImplementationGuideSection(
                 name="Common Pitfalls",
@@ -377,7 +410,6 @@ class GuideBuilder:
             sections.append(pitfall_section)
 
         # Debugging section
-        tips = self._collect_debugging_tips(criteria_per_step)
         if tips:
             debug_section = ImplementationGuideSection(
                 name="Debugging Tips",
@@ -408,15 +440,7 @@ class GuideBuilder:
 
     def _create_rollback_instructions(self, steps: List[ImplementationStep]) -> str:
         """Create rollback instructions (AC6)."""
-        return (
-            "Rollback Instructions:\n"
-            "If implementation fails or needs to be reverted:\n"
-            "1. Revert any modified files to their previous state\n"
-            "2. Remove any newly created files\n"
-            "3. Restore any configuration to original state\n"
-            "4. Restart affected services if needed\n"
-            f"Consider implementing in a feature branch to simplify rollback."
-        )
+        return _ROLLBACK_INSTRUCTIONS
 
     def _create_documentation_links(self) -> List[str]:
         """Create relevant documentation links (AC6)."""
@@ -438,25 +462,17 @@ class GuideBuilder:
 
         return links
 
-    def _collect_pitfalls(
+    def _collect_pitfalls_and_tips(
         self, criteria_per_step: List[GeneratedCriteria]
-    ) -> List[str]:
-        """Collect all pitfalls from criteria."""
-        pitfalls = []
+    ) -> Tuple[List[str], List[str]]:
+        """Collect all pitfalls and debugging tips from criteria in one pass."""
+        # Dicts dedupe while preserving first-seen order
+        pitfalls = {}
+        tips = {}
         for criteria in criteria_per_step:
-            pitfalls.extend(criteria.common_pitfalls)
-        # Remove duplicates while preserving order
-        return list(dict.fromkeys(pitfalls))
-
-    def _collect_debugging_tips(
-        self, criteria_per_step: List[GeneratedCriteria]
-    ) -> List[str]:
-        """Collect all debugging tips from criteria."""
-        tips = []
-        for criteria in criteria_per_step:
-            tips.extend(criteria.debugging_tips)
-        # Remove duplicates while preserving order
-        return list(dict.fromkeys(tips))
+            pitfalls.update(dict.fromkeys(criteria.common_pitfalls))
+            tips.update(dict.fromkeys(criteria.debugging_tips))
+        return list(pitfalls), list(tips)
 
     def _validate_guide(self, guide: ImplementationGuide) -> ValidationResult:
         """Validate guide completeness and consistency (AC8)."""
@@ -465,16 +481,15 @@ class GuideBuilder:
         unverifiable = []
 
         # AC8: Each step should have criteria
+        steps_with_criteria = {c.step.number for c in guide.criteria_per_step}
         for step in guide.steps:
-            criteria_for_step = [
-                c for c in guide.criteria_per_step if c.step.number == step.number
-            ]
-            if not criteria_for_step:
+            if step.number not in steps_with_criteria:
                 errors.append(f"Step {step.number} has no verification criteria")
 
         # AC8: Validate step order is consistent
-        for i, step_num in enumerate(guide.execution_order):
-            if step_num not in [s.number for s in guide.steps]:
+        step_numbers = {s.number for s in guide.steps}
+        for step_num in guide.execution_order:
+            if step_num not in step_numbers:
                 errors.append(
                     f"Execution order references non-existent step {step_num}"
                 )
@@ -497,21 +512,17 @@ class GuideBuilder:
 
         # AC8: Validate testing guidance exists
         test_steps = [
-            c for c in guide.criteria_per_step if "test" in c.step.content.lower()
+            c for c in guide.criteria_per_step if "test" in c.step.content_lower
         ]
         if test_steps and not any(c.testing_guidance for c in test_steps):
             warnings.append("Some test steps lack testing guidance")
 
-        # Calculate completeness
-        completeness = 100.0
-        if errors:
-            completeness -= 10 * len(errors)
-        if warnings:
-            completeness -= 5 * len(warnings)
-        completeness = max(0, min(100, completeness))
+        # Calculate completeness (never above 100: penalties only subtract)
+        error_count = len(errors)
+        completeness = max(0.0, 100.0 - 10 * error_count - 5 * len(warnings))
 
         return ValidationResult(
-            is_valid=len(errors) == 0,
+            is_valid=error_count == 0,
             errors=errors,
             warnings=warnings,
             completeness_percentage=completeness,
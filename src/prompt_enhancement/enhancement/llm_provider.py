@@ -5,14 +5,78 @@ Defines common interface for different LLM providers (OpenAI, DeepSeek).
 Enables provider-agnostic LLM calls with provider strategy pattern.
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import logging
+import math
+import operator
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from array import array
+from collections import OrderedDict, deque
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
 
+class ContextLengthError(ValueError):
+    """Prompt does not fit in the model's context window."""
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(model: str) -> Any:
+    """
+    tiktoken encoding for a model, or None if tiktoken is not installed.
+
+    Models tiktoken does not know (e.g. DeepSeek) use cl100k_base, which
+    is close enough for budgeting.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text: str, model: str = "gpt-4-turbo") -> int:
+    """
+    Count tokens in text with a model's tokenizer.
+
+    Without tiktoken installed, estimates ~4 characters per token.
+    """
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return -(-len(text) // 4)
+    return len(encoding.encode(text))
+
+
+def track_streamed(
+    stream_callback: Optional[Callable[[str], None]], streamed: List[bool]
+) -> Optional[Callable[[str], None]]:
+    """
+    Wrap a stream callback so delivered text is recorded in streamed.
+
+    Once streamed is non-empty the caller has already shown part of an
+    answer, so a failed call must be raised rather than retried.
+    """
+    if stream_callback is None:
+        return None
+
+    def forward(text: str) -> None:
+        streamed.append(True)
+        stream_callback(text)
+
+    return forward
+
+
 @dataclass
 class LLMResponse:
     """Response from LLM API call."""
@@ -25,6 +89,82 @@ class LLMResponse:
     latency_seconds: float
 
 
+class SemanticCache:
+    """
+    Reuse responses for prompts that closely match an earlier one.
+
+    Each (system_prompt, user_message) pair is embedded and compared by
+    cosine similarity with recent entries; a match at or above the
+    threshold is answered from the cache instead of the API. Entries may
+    carry a scope, and only match lookups made with the same scope.
+    """
+
+    DEFAULT_MODEL = "all-MiniLM-L6-v2"
+    DEFAULT_THRESHOLD = 0.92
+    DEFAULT_MAX_ENTRIES = 256
+
+    def __init__(
+        self,
+        embed: Optional[Callable[[str], Sequence[float]]] = None,
+        threshold: float = DEFAULT_THRESHOLD,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            embed: Maps text to a vector (defaults to a local
+                sentence-transformers model)
+            threshold: Minimum cosine similarity counted as a hit
+            max_entries: Oldest entries are dropped beyond this many
+
+        Raises:
+            ImportError: If no embed function is given and
+                sentence-transformers is not installed
+        """
+        if embed is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError as e:
+                raise ImportError(
+                    "sentence-transformers not installed, pass embed= to SemanticCache"
+                ) from e
+            embed = SentenceTransformer(self.DEFAULT_MODEL).encode
+
+        self._embed = embed
+        self.threshold = threshold
+        # (float32 vector, response, scope) triples; the oldest are evicted first
+        self._entries: deque = deque(maxlen=max_entries)
+
+    def embed(self, system_prompt: str, user_message: str) -> array:
+        """Embed a request as a unit-length float32 vector."""
+        return self.embed_text(f"{system_prompt}\n\n{user_message}")
+
+    def embed_text(self, text: str) -> array:
+        """Embed text as a unit-length float32 vector."""
+        vector = array("f", self._embed(text))
+        norm = math.sqrt(sum(x * x for x in vector))
+        if norm:
+            vector = array("f", (x / norm for x in vector))
+        return vector
+
+    def lookup(self, vector: array, scope: Optional[str] = None) -> Optional[Any]:
+        """Return the most similar cached response in scope above the threshold."""
+        best, best_score = None, self.threshold
+        # Snapshot so concurrent add() calls cannot break iteration
+        for stored, response, stored_scope in list(self._entries):
+            if stored_scope != scope:
+                continue
+            score = sum(map(operator.mul, vector, stored))
+            if score >= best_score:
+                best, best_score = response, score
+        return best
+
+    def add(self, vector: array, response: Any, scope: Optional[str] = None) -> None:
+        """Remember a response for its request embedding."""
+        self._entries.append((vector, response, scope))
+
+
 class LLMProvider(ABC):
     """
     Abstract base class for LLM providers.
@@ -33,16 +173,39 @@ class LLMProvider(ABC):
     Enables strategy pattern for provider selection and fallback.
     """
 
-    def __init__(self, api_key: str, model: str = "gpt-4-turbo"):
+    TEMPERATURE = 0.7
+    EXACT_CACHE_SIZE = 128
+    CONTEXT_WINDOW = 128000  # Input + output tokens the model accepts
+    MESSAGE_OVERHEAD_TOKENS = 11  # Chat framing for system + user + reply
+    CONTEXT_SAFETY_MARGIN = 64
+    BASE_URL: Optional[str] = None  # OpenAI-compatible endpoint, None for OpenAI
+
+    # Responses to byte-identical requests, shared by every provider instance
+    # and ordered least recently used first
+    _exact_cache: "OrderedDict[str, LLMResponse]" = OrderedDict()
+    # Calls run concurrently in executor threads and pools
+    _exact_cache_lock = threading.Lock()
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4-turbo",
+        cache: Optional[SemanticCache] = None,
+    ):
         """
         Initialize LLM provider.
 
         Args:
             api_key: API key for authentication
             model: Model name (e.g., "gpt-4-turbo")
+            cache: Semantic cache consulted before each API call
         """
         self.api_key = api_key
         self.model = model
+        self.cache = cache
+        self._client = None
+        # (event loop, AsyncOpenAI client); async connections are tied to a loop
+        self._aclient: Optional[Tuple[asyncio.AbstractEventLoop, Any]] = None
         logger.debug(f"Initialized {self.__class__.__name__} with model {model}")
 
     @abstractmethod
@@ -52,6 +215,9 @@ class LLMProvider(ABC):
         user_message: str,
         timeout_seconds: int = 30,
         max_tokens: int = 2000,
+        prompt_cache_key: Optional[str] = None,
+        stream_callback: Optional[Callable[[str], None]] = None,
+        temperature: Optional[float] = None,
     ) -> LLMResponse:
         """
         Make LLM API call.
@@ -61,6 +227,12 @@ class LLMProvider(ABC):
             user_message: User message with original prompt
             timeout_seconds: Timeout for API call
             max_tokens: Maximum response tokens
+            prompt_cache_key: Routing hint for provider-side prompt caching,
+                shared by requests with the same static prompt prefix
+            stream_callback: If given, each text fragment is passed to it
+                as it arrives
+            temperature: Sampling temperature (None for TEMPERATURE); only
+                temperature 0 requests are answered by the semantic cache
 
         Returns:
             LLMResponse with enhancement result
@@ -73,6 +245,302 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def acall(
+        self,
+        system_prompt: str,
+        user_message: str,
+        timeout_seconds: int = 30,
+        max_tokens: int = 2000,
+        prompt_cache_key: Optional[str] = None,
+        stream_callback: Optional[Callable[[str], None]] = None,
+        temperature: Optional[float] = None,
+    ) -> LLMResponse:
+        """
+        Make LLM API call without blocking the event loop.
+
+        Providers without an async client run call() in the default
+        executor; arguments, result and errors are the same as call().
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.call,
+                system_prompt,
+                user_message,
+                timeout_seconds,
+                max_tokens,
+                prompt_cache_key,
+                stream_callback,
+                temperature,
+            ),
+        )
+
+    def _client_kwargs(self) -> Dict[str, Any]:
+        """Arguments for constructing this provider's OpenAI-compatible clients."""
+        kwargs = {"api_key": self.api_key}
+        if self.BASE_URL:
+            kwargs["base_url"] = self.BASE_URL
+        return kwargs
+
+    def _get_client(self) -> Any:
+        """
+        Return this provider's OpenAI-compatible client, created on first use.
+
+        One client per provider keeps its HTTP connection pool, so later
+        calls reuse open keep-alive connections instead of paying a new
+        TCP+TLS handshake each time.
+        """
+        if self._client is None:
+            from openai import OpenAI
+
+            self._client = OpenAI(**self._client_kwargs())
+        return self._client
+
+    def _get_async_client(self) -> Any:
+        """Return the async client for the running event loop, created on first use."""
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient[0] is not loop:
+            from openai import AsyncOpenAI
+
+            self._aclient = (loop, AsyncOpenAI(**self._client_kwargs()))
+        return self._aclient[1]
+
+    def close(self) -> None:
+        """Close the provider's HTTP connections, if a client was created."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        # Async connections can only be closed on their loop; see aclose()
+        self._aclient = None
+
+    async def aclose(self) -> None:
+        """Close both the sync and the async client's connections."""
+        if self._aclient is not None and self._aclient[0] is asyncio.get_running_loop():
+            await self._aclient[1].close()
+        self.close()
+
+    def __enter__(self) -> "LLMProvider":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "LLMProvider":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens in text with this provider's model tokenizer."""
+        return count_tokens(text, self.model)
+
+    def _input_tokens(self, system_prompt: str, user_message: str) -> int:
+        """Tokens a request's messages take up, chat framing included."""
+        return (
+            self.count_tokens(system_prompt)
+            + self.count_tokens(user_message)
+            + self.MESSAGE_OVERHEAD_TOKENS
+        )
+
+    def _fit_max_tokens(
+        self, system_prompt: str, user_message: str, max_tokens: int
+    ) -> int:
+        """
+        Clamp max_tokens to what the context window leaves after the prompt.
+
+        Raises:
+            ContextLengthError: If the prompt alone leaves no room for output
+        """
+        input_tokens = self._input_tokens(system_prompt, user_message)
+        available = self.CONTEXT_WINDOW - input_tokens - self.CONTEXT_SAFETY_MARGIN
+        if available <= 0:
+            raise ContextLengthError(
+                f"Prompt is ~{input_tokens} tokens, over {self.model}'s "
+                f"{self.CONTEXT_WINDOW}-token context window"
+            )
+        return min(max_tokens, available)
+
+    def dry_run_cost(
+        self, system_prompt: str, user_message: str, max_tokens: int = 2000
+    ) -> float:
+        """
+        Estimate the most a call could cost, without making it.
+
+        Args:
+            system_prompt: System prompt with project context
+            user_message: User message with original prompt
+            max_tokens: Maximum response tokens
+
+        Returns:
+            Estimated cost in USD if the full output budget is used
+
+        Raises:
+            ContextLengthError: If the prompt does not fit the model
+        """
+        output_tokens = self._fit_max_tokens(system_prompt, user_message, max_tokens)
+        input_tokens = self._input_tokens(system_prompt, user_message)
+        return self.estimate_cost(input_tokens, output_tokens)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop every exact-match response cached by providers."""
+        with cls._exact_cache_lock:
+            cls._exact_cache.clear()
+
+    def _exact_key(
+        self, system_prompt: str, user_message: str, max_tokens: int, temperature: float
+    ) -> str:
+        """Hash everything that determines a completion into a cache key."""
+        payload = json.dumps(
+            {
+                "m": self.model,
+                "s": system_prompt,
+                "u": user_message,
+                "t": temperature,
+                "mx": max_tokens,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _check_cache(
+        self,
+        system_prompt: str,
+        user_message: str,
+        max_tokens: int,
+        temperature: float,
+        stream_callback: Optional[Callable[[str], None]] = None,
+    ) -> Tuple[Optional[array], Optional[LLMResponse]]:
+        """
+        Look for a cached response before calling the API.
+
+        Exact matches are checked first, then the semantic cache if one is
+        set and the request is deterministic (temperature 0); a similar
+        request's sampled answer is no stand-in for a fresh sample.
+        Returns (request embedding or None, cached response or None); a
+        hit reports its own lookup time as latency.
+        """
+        start_time = time.monotonic()
+        vector = None
+        key = self._exact_key(system_prompt, user_message, max_tokens, temperature)
+        with self._exact_cache_lock:
+            cached = self._exact_cache.get(key)
+            if cached is not None:
+                self._exact_cache.move_to_end(key)
+        if cached is None and self.cache is not None and temperature == 0:
+            vector = self.cache.embed(system_prompt, user_message)
+            cached = self.cache.lookup(vector)
+
+        if cached is None:
+            return vector, None
+
+        logger.debug(f"{self.get_provider_name()} response served from cache")
+        if stream_callback is not None:
+            stream_callback(cached.content)
+        return vector, replace(cached, latency_seconds=time.monotonic() - start_time)
+
+    def _remember(
+        self,
+        system_prompt: str,
+        user_message: str,
+        max_tokens: int,
+        temperature: float,
+        vector: Optional[array],
+        response: LLMResponse,
+    ) -> None:
+        """Cache a fresh response, evicting the least recently used."""
+        key = self._exact_key(system_prompt, user_message, max_tokens, temperature)
+        with self._exact_cache_lock:
+            self._exact_cache[key] = response
+            self._exact_cache.move_to_end(key)
+            if len(self._exact_cache) > self.EXACT_CACHE_SIZE:
+                self._exact_cache.popitem(last=False)
+        if vector is not None:
+            self.cache.add(vector, response)
+
+    def _completion_kwargs(
+        self,
+        system_prompt: str,
+        user_message: str,
+        timeout_seconds: int,
+        max_tokens: int,
+        temperature: float,
+        prompt_cache_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build chat.completions.create arguments shared by call and acall.
+
+        Responses are always streamed: a non-streamed completion can sit
+        fully buffered at the provider or a proxy until generation ends,
+        while a stream keeps the connection active from the first token.
+        """
+        kwargs = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message},
+            ],
+            "temperature": temperature,
+            "max_tokens": self._fit_max_tokens(system_prompt, user_message, max_tokens),
+            "timeout": timeout_seconds,
+            "stream": True,
+            # Token counts arrive in a final chunk only when asked for
+            "stream_options": {"include_usage": True},
+        }
+        if prompt_cache_key:
+            kwargs["extra_body"] = {"prompt_cache_key": prompt_cache_key}
+        return kwargs
+
+    @staticmethod
+    def _read_chunk(
+        chunk: Any,
+        parts: List[str],
+        stream_callback: Optional[Callable[[str], None]],
+    ) -> Any:
+        """Record one streamed chunk's text and return its usage, if any."""
+        if chunk.choices:
+            text = chunk.choices[0].delta.content
+            if text:
+                parts.append(text)
+                if stream_callback is not None:
+                    stream_callback(text)
+        return getattr(chunk, "usage", None)
+
+    def _collect_stream(
+        self, stream: Any, stream_callback: Optional[Callable[[str], None]] = None
+    ) -> Tuple[str, Any]:
+        """Accumulate a completion stream, forwarding text; return (content, usage)."""
+        parts: List[str] = []
+        usage = None
+        for chunk in stream:
+            usage = self._read_chunk(chunk, parts, stream_callback) or usage
+        return "".join(parts), usage
+
+    async def _acollect_stream(
+        self, stream: Any, stream_callback: Optional[Callable[[str], None]] = None
+    ) -> Tuple[str, Any]:
+        """Async counterpart of _collect_stream."""
+        parts: List[str] = []
+        usage = None
+        async for chunk in stream:
+            usage = self._read_chunk(chunk, parts, stream_callback) or usage
+        return "".join(parts), usage
+
+    def _to_llm_response(
+        self, content: str, usage: Any, provider: str, latency: float
+    ) -> LLMResponse:
+        """Build an LLMResponse from completion text and its usage block."""
+        return LLMResponse(
+            content=content,
+            tokens_input=usage.prompt_tokens if usage else 0,
+            tokens_output=usage.completion_tokens if usage else 0,
+            model=self.model,
+            provider=provider,
+            latency_seconds=latency,
+        )
+
     @abstractmethod
     def estimate_cost(
         self,
@@ -117,15 +585,18 @@ class OpenAIProvider(LLMProvider):
     # GPT-4 Turbo: $0.01 per 1K input tokens, $0.03 per 1K output tokens
     INPUT_COST_PER_1K_TOKENS = 0.01
     OUTPUT_COST_PER_1K_TOKENS = 0.03
+    BATCH_POLL_SECONDS = 30.0
+    BATCH_TIMEOUT_SECONDS = 24 * 60 * 60
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache: Optional[SemanticCache] = None):
         """
         Initialize OpenAI provider.
 
         Args:
             api_key: OpenAI API key (sk-...)
+            cache: Semantic cache consulted before each API call
         """
-        super().__init__(api_key, model="gpt-4-turbo")
+        super().__init__(api_key, model="gpt-4-turbo", cache=cache)
 
     def call(
         self,
@@ -133,16 +604,26 @@ class OpenAIProvider(LLMProvider):
         user_message: str,
         timeout_seconds: int = 30,
         max_tokens: int = 2000,
+        prompt_cache_key: Optional[str] = None,
+        stream_callback: Optional[Callable[[str], None]] = None,
+        temperature: Optional[float] = None,
     ) -> LLMResponse:
         """Make OpenAI API call (AC1, AC3)."""
-        import time
-        from openai import OpenAI, AuthenticationError, RateLimitError
+        from openai import AuthenticationError, RateLimitError
         from openai import APITimeoutError as OpenAITimeout
 
-        start_time = time.time()
+        if temperature is None:
+            temperature = self.TEMPERATURE
+        vector, cached = self._check_cache(
+            system_prompt, user_message, max_tokens, temperature, stream_callback
+        )
+        if cached is not None:
+            return cached
+
+        start_time = time.monotonic()
 
         try:
-            client = OpenAI(api_key=self.api_key)
+            client = self._get_client()
 
             logger.debug(
                 f"Calling OpenAI {self.model} with {len(system_prompt)} chars system "
@@ -150,32 +631,92 @@ class OpenAIProvider(LLMProvider):
             )
 
             response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message},
-                ],
-                temperature=0.7,
-                max_tokens=max_tokens,
-                timeout=timeout_seconds,
+                **self._completion_kwargs(
+                    system_prompt,
+                    user_message,
+                    timeout_seconds,
+                    max_tokens,
+                    temperature,
+                    prompt_cache_key,
+                )
             )
+            content, usage = self._collect_stream(response, stream_callback)
 
-            latency = time.time() - start_time
+            latency = time.monotonic() - start_time
+            result = self._to_llm_response(content, usage, "openai", latency)
 
-            result = LLMResponse(
-                content=response.choices[0].message.content,
-                tokens_input=response.usage.prompt_tokens,
-                tokens_output=response.usage.completion_tokens,
-                model=self.model,
-                provider="openai",
-                latency_seconds=latency,
+            logger.info(
+                f"OpenAI call successful: {result.tokens_input} input, "
+                f"{result.tokens_output} output tokens, {latency:.2f}s"
             )
 
+            self._remember(
+                system_prompt, user_message, max_tokens, temperature, vector, result
+            )
+            return result
+
+        except AuthenticationError as e:
+            logger.error(f"OpenAI authentication failed: {e}")
+            raise
+        except RateLimitError as e:
+            logger.warning(f"OpenAI rate limited: {e}")
+            raise
+        except OpenAITimeout as e:
+            logger.warning(f"OpenAI call timed out: {e}")
+            raise TimeoutError(f"OpenAI API timeout after {timeout_seconds}s") from e
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            raise
+
+    async def acall(
+        self,
+        system_prompt: str,
+        user_message: str,
+        timeout_seconds: int = 30,
+        max_tokens: int = 2000,
+        prompt_cache_key: Optional[str] = None,
+        stream_callback: Optional[Callable[[str], None]] = None,
+        temperature: Optional[float] = None,
+    ) -> LLMResponse:
+        """Make OpenAI API call with the async client (AC1, AC3)."""
+        from openai import AuthenticationError, RateLimitError
+        from openai import APITimeoutError as OpenAITimeout
+
+        if temperature is None:
+            temperature = self.TEMPERATURE
+        vector, cached = self._check_cache(
+            system_prompt, user_message, max_tokens, temperature, stream_callback
+        )
+        if cached is not None:
+            return cached
+
+        start_time = time.monotonic()
+
+        try:
+            client = self._get_async_client()
+            response = await client.chat.completions.create(
+                **self._completion_kwargs(
+                    system_prompt,
+                    user_message,
+                    timeout_seconds,
+                    max_tokens,
+                    temperature,
+                    prompt_cache_key,
+                )
+            )
+            content, usage = await self._acollect_stream(response, stream_callback)
+
+            latency = time.monotonic() - start_time
+            result = self._to_llm_response(content, usage, "openai", latency)
+
             logger.info(
-                f"OpenAI call successful: {result.tokens_input} input, "
+                f"OpenAI async call successful: {result.tokens_input} input, "
                 f"{result.tokens_output} output tokens, {latency:.2f}s"
             )
 
+            self._remember(
+                system_prompt, user_message, max_tokens, temperature, vector, result
+            )
             return result
 
         except AuthenticationError as e:
@@ -191,6 +732,111 @@ class OpenAIProvider(LLMProvider):
             logger.error(f"OpenAI API error: {e}")
             raise
 
+    def call_via_batch_api(
+        self,
+        items: List[Tuple[str, str]],
+        max_tokens: int = 2000,
+        poll_seconds: Optional[float] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> List[Optional[LLMResponse]]:
+        """
+        Run many requests through OpenAI's Batch API.
+
+        Batches are billed at half price but complete asynchronously
+        (within 24h), so this suits bulk jobs rather than interactive use.
+        Blocks, polling the batch, until it finishes.
+
+        Args:
+            items: (system_prompt, user_message) pairs
+            max_tokens: Maximum response tokens per request
+            poll_seconds: Seconds between status checks (BATCH_POLL_SECONDS)
+            timeout_seconds: Give up after this long (BATCH_TIMEOUT_SECONDS)
+
+        Returns:
+            One entry per item, in order: its LLMResponse, or None if that
+            request failed within the batch
+
+        Raises:
+            TimeoutError: If the batch has not finished within timeout_seconds
+            RuntimeError: If the batch failed, expired or was cancelled
+                without producing output
+        """
+        poll_seconds = poll_seconds or self.BATCH_POLL_SECONDS
+        timeout_seconds = timeout_seconds or self.BATCH_TIMEOUT_SECONDS
+        client = self._get_client()
+        start_time = time.monotonic()
+
+        lines = []
+        for index, (system_prompt, user_message) in enumerate(items):
+            body = {
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_message},
+                ],
+                "temperature": self.TEMPERATURE,
+                "max_tokens": self._fit_max_tokens(system_prompt, user_message, max_tokens),
+            }
+            lines.append(
+                json.dumps(
+                    {
+                        "custom_id": str(index),
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": body,
+                    }
+                )
+            )
+
+        batch_input = client.files.create(
+            file=("requests.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = client.batches.create(
+            input_file_id=batch_input.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logger.info(f"Submitted OpenAI batch {batch.id} with {len(items)} requests")
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() - start_time > timeout_seconds:
+                raise TimeoutError(
+                    f"OpenAI batch {batch.id} still {batch.status} after {timeout_seconds}s"
+                )
+            time.sleep(poll_seconds)
+            batch = client.batches.retrieve(batch.id)
+
+        if not batch.output_file_id:
+            raise RuntimeError(f"OpenAI batch {batch.id} ended with status {batch.status}")
+
+        latency = time.monotonic() - start_time
+        results: List[Optional[LLMResponse]] = [None] * len(items)
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                logger.warning(f"Batch request {record.get('custom_id')} failed")
+                continue
+            body = response["body"]
+            usage = body.get("usage") or {}
+            results[int(record["custom_id"])] = LLMResponse(
+                content=body["choices"][0]["message"]["content"],
+                tokens_input=usage.get("prompt_tokens", 0),
+                tokens_output=usage.get("completion_tokens", 0),
+                model=self.model,
+                provider="openai",
+                latency_seconds=latency,
+            )
+
+        logger.info(
+            f"OpenAI batch {batch.id} finished: "
+            f"{sum(r is not None for r in results)}/{len(items)} succeeded, {latency:.0f}s"
+        )
+        return results
+
     def estimate_cost(self, input_tokens: int, output_tokens: int) -> float:
         """Estimate OpenAI API call cost."""
         input_cost = (input_tokens / 1000) * self.INPUT_COST_PER_1K_TOKENS
@@ -205,15 +851,17 @@ class DeepSeekProvider(LLMProvider):
     # deepseek-reasoner: $0.0055 per 1K input tokens, $0.022 per 1K output tokens
     INPUT_COST_PER_1K_TOKENS = 0.0055
     OUTPUT_COST_PER_1K_TOKENS = 0.022
+    BASE_URL = "https://api.deepseek.com"
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache: Optional[SemanticCache] = None):
         """
         Initialize DeepSeek provider with V3.2 reasoner model.
 
         Args:
             api_key: DeepSeek API key
+            cache: Semantic cache consulted before each API call
         """
-        super().__init__(api_key, model="deepseek-reasoner")
+        super().__init__(api_key, model="deepseek-reasoner", cache=cache)
 
     def call(
         self,
@@ -221,20 +869,32 @@ class DeepSeekProvider(LLMProvider):
         user_message: str,
         timeout_seconds: int = 30,
         max_tokens: int = 2000,
+        prompt_cache_key: Optional[str] = None,
+        stream_callback: Optional[Callable[[str], None]] = None,
+        temperature: Optional[float] = None,
     ) -> LLMResponse:
-        """Make DeepSeek API call (via OpenAI-compatible endpoint)."""
-        import time
-        from openai import OpenAI, AuthenticationError, RateLimitError
+        """
+        Make DeepSeek API call (via OpenAI-compatible endpoint).
+
+        DeepSeek caches repeated prompt prefixes on its own, so
+        prompt_cache_key is accepted for interface parity and not sent.
+        """
+        from openai import AuthenticationError, RateLimitError
         from openai import APITimeoutError as OpenAITimeout
 
-        start_time = time.time()
+        if temperature is None:
+            temperature = self.TEMPERATURE
+        vector, cached = self._check_cache(
+            system_prompt, user_message, max_tokens, temperature, stream_callback
+        )
+        if cached is not None:
+            return cached
+
+        start_time = time.monotonic()
 
         try:
             # DeepSeek uses OpenAI-compatible API format with V3.2 endpoint
-            client = OpenAI(
-                api_key=self.api_key,
-                base_url="https://api.deepseek.com",
-            )
+            client = self._get_client()
 
             logger.debug(
                 f"Calling DeepSeek {self.model} (V3.2 Reasoning Mode) via OpenAI-compatible API with "
@@ -242,32 +902,90 @@ class DeepSeekProvider(LLMProvider):
             )
 
             response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message},
-                ],
-                temperature=0.7,
-                max_tokens=max_tokens,
-                timeout=timeout_seconds,
+                **self._completion_kwargs(
+                    system_prompt,
+                    user_message,
+                    timeout_seconds,
+                    max_tokens,
+                    temperature,
+                )
             )
+            content, usage = self._collect_stream(response, stream_callback)
 
-            latency = time.time() - start_time
+            latency = time.monotonic() - start_time
+            result = self._to_llm_response(content, usage, "deepseek", latency)
 
-            result = LLMResponse(
-                content=response.choices[0].message.content,
-                tokens_input=response.usage.prompt_tokens,
-                tokens_output=response.usage.completion_tokens,
-                model=self.model,
-                provider="deepseek",
-                latency_seconds=latency,
+            logger.info(
+                f"DeepSeek call successful: {result.tokens_input} input, "
+                f"{result.tokens_output} output tokens, {latency:.2f}s"
             )
 
+            self._remember(
+                system_prompt, user_message, max_tokens, temperature, vector, result
+            )
+            return result
+
+        except AuthenticationError as e:
+            logger.error(f"DeepSeek authentication failed: {e}")
+            raise
+        except RateLimitError as e:
+            logger.warning(f"DeepSeek rate limited: {e}")
+            raise
+        except OpenAITimeout as e:
+            logger.warning(f"DeepSeek call timed out: {e}")
+            raise TimeoutError(f"DeepSeek API timeout after {timeout_seconds}s") from e
+        except Exception as e:
+            logger.error(f"DeepSeek API error: {e}")
+            raise
+
+    async def acall(
+        self,
+        system_prompt: str,
+        user_message: str,
+        timeout_seconds: int = 30,
+        max_tokens: int = 2000,
+        prompt_cache_key: Optional[str] = None,
+        stream_callback: Optional[Callable[[str], None]] = None,
+        temperature: Optional[float] = None,
+    ) -> LLMResponse:
+        """Make DeepSeek API call with the async OpenAI-compatible client."""
+        from openai import AuthenticationError, RateLimitError
+        from openai import APITimeoutError as OpenAITimeout
+
+        if temperature is None:
+            temperature = self.TEMPERATURE
+        vector, cached = self._check_cache(
+            system_prompt, user_message, max_tokens, temperature, stream_callback
+        )
+        if cached is not None:
+            return cached
+
+        start_time = time.monotonic()
+
+        try:
+            client = self._get_async_client()
+            response = await client.chat.completions.create(
+                **self._completion_kwargs(
+                    system_prompt,
+                    user_message,
+                    timeout_seconds,
+                    max_tokens,
+                    temperature,
+                )
+            )
+            content, usage = await self._acollect_stream(response, stream_callback)
+
+            latency = time.monotonic() - start_time
+            result = self._to_llm_response(content, usage, "deepseek", latency)
+
             logger.info(
-                f"DeepSeek call successful: {result.tokens_input} input, "
+                f"DeepSeek async call successful: {result.tokens_input} input, "
                 f"{result.tokens_output} output tokens, {latency:.2f}s"
             )
 
+            self._remember(
+                system_prompt, user_message, max_tokens, temperature, vector, result
+            )
             return result
 
         except AuthenticationError as e:
@@ -290,13 +1008,318 @@ class DeepSeekProvider(LLMProvider):
         return input_cost + output_cost
 
 
-def create_provider(provider_name: str, api_key: str) -> LLMProvider:
+@dataclass(frozen=True)
+class RetryConfig:
+    """Jittered exponential backoff settings for RetryProvider."""
+
+    max_retries: int = 5
+    initial_delay: float = 0.5
+    backoff: float = 2.0
+    max_delay: float = 30.0
+    jitter: bool = True
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Seconds to wait before retry number attempt + 1.
+
+        A server-supplied Retry-After wins over the computed backoff;
+        either way the wait never exceeds max_delay.
+        """
+        if retry_after is not None:
+            return min(self.max_delay, retry_after)
+        delay = self.initial_delay * self.backoff ** attempt
+        if self.jitter:
+            delay *= random.uniform(0.5, 1.5)
+        return min(self.max_delay, delay)
+
+
+class RetryProvider(LLMProvider):
+    """
+    Wraps another provider and retries its transient failures.
+
+    Rate limits, timeouts, connection errors and 5xx responses are retried
+    with jittered exponential backoff; anything else (including auth
+    errors) is raised at once. A streamed call is not retried once text
+    has reached the callback, since the caller would see it twice.
+    """
+
+    def __init__(self, inner: LLMProvider, config: Optional[RetryConfig] = None):
+        """
+        Initialize retrying wrapper.
+
+        Args:
+            inner: Provider that makes the actual calls
+            config: Backoff settings (defaults to RetryConfig())
+        """
+        super().__init__(inner.api_key, model=inner.model)
+        self.inner = inner
+        self.config = config or RetryConfig()
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Whether an error is worth another attempt."""
+        from openai import APIConnectionError, APIStatusError, RateLimitError
+
+        if isinstance(
+            error, (TimeoutError, asyncio.TimeoutError, RateLimitError, APIConnectionError)
+        ):
+            return True
+        return isinstance(error, APIStatusError) and error.status_code >= 500
+
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        """Seconds requested by the server's Retry-After header, if any."""
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        if not headers:
+            return None
+        try:
+            return float(headers.get("retry-after"))
+        except (TypeError, ValueError):
+            # Missing, or an HTTP date rather than a number of seconds
+            return None
+
+    def _next_delay(
+        self, error: Exception, attempt: int, streamed: List[bool]
+    ) -> Optional[float]:
+        """Backoff before the next attempt, or None if error should be raised."""
+        if attempt >= self.config.max_retries or streamed or not self._is_retryable(error):
+            return None
+        delay = self.config.delay(attempt, self._retry_after(error))
+        logger.warning(
+            f"{self.get_provider_name()} call failed ({error}), retrying in "
+            f"{delay:.2f}s ({attempt + 1}/{self.config.max_retries})"
+        )
+        return delay
+
+    def call(
+        self,
+        system_prompt: str,
+        user_message: str,
+        timeout_seconds: int = 30,
+        max_tokens: int = 2000,
+        prompt_cache_key: Optional[str] = None,
+        stream_callback: Optional[Callable[[str], None]] = None,
+        temperature: Optional[float] = None,
+    ) -> LLMResponse:
+        """Call the inner provider, backing off between transient failures."""
+        streamed: List[bool] = []
+        callback = track_streamed(stream_callback, streamed)
+        attempt = 0
+        while True:
+            try:
+                return self.inner.call(
+                    system_prompt,
+                    user_message,
+                    timeout_seconds,
+                    max_tokens,
+                    prompt_cache_key,
+                    callback,
+                    temperature,
+                )
+            except Exception as e:
+                delay = self._next_delay(e, attempt, streamed)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+
+    async def acall(
+        self,
+        system_prompt: str,
+        user_message: str,
+        timeout_seconds: int = 30,
+        max_tokens: int = 2000,
+        prompt_cache_key: Optional[str] = None,
+        stream_callback: Optional[Callable[[str], None]] = None,
+        temperature: Optional[float] = None,
+    ) -> LLMResponse:
+        """Async counterpart of call()."""
+        streamed: List[bool] = []
+        callback = track_streamed(stream_callback, streamed)
+        attempt = 0
+        while True:
+            try:
+                return await self.inner.acall(
+                    system_prompt,
+                    user_message,
+                    timeout_seconds,
+                    max_tokens,
+                    prompt_cache_key,
+                    callback,
+                    temperature,
+                )
+            except Exception as e:
+                delay = self._next_delay(e, attempt, streamed)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def close(self) -> None:
+        """Close the inner provider's connections."""
+        self.inner.close()
+
+    async def aclose(self) -> None:
+        """Close the inner provider's connections, async ones included."""
+        await self.inner.aclose()
+
+    def estimate_cost(self, input_tokens: int, output_tokens: int) -> float:
+        """Estimate cost with the inner provider's pricing."""
+        return self.inner.estimate_cost(input_tokens, output_tokens)
+
+    def get_provider_name(self) -> str:
+        """Report the inner provider's name."""
+        return self.inner.get_provider_name()
+
+
+class PooledProvider(LLMProvider):
+    """
+    Spreads calls across several providers, e.g. one per API key.
+
+    Each call goes to the provider with the fewest calls in flight, ties
+    taken in round-robin order; on a rate limit the next provider is
+    tried, so throughput scales with the number of keys.
+    """
+
+    def __init__(self, providers: List[LLMProvider]):
+        """
+        Initialize provider pool.
+
+        Args:
+            providers: Providers to dispatch across
+
+        Raises:
+            ValueError: If providers is empty
+        """
+        if not providers:
+            raise ValueError("PooledProvider needs at least one provider")
+        super().__init__(providers[0].api_key, model=providers[0].model)
+        self.providers = list(providers)
+        self._in_flight = [0] * len(self.providers)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def _dispatch_order(self) -> List[int]:
+        """Provider indexes to try: least busy first, ties round-robin."""
+        with self._lock:
+            count = len(self.providers)
+            start = self._next
+            self._next = (start + 1) % count
+            rotation = [(start + i) % count for i in range(count)]
+        # sorted() is stable, so equally busy providers keep rotation order
+        return sorted(rotation, key=self._in_flight.__getitem__)
+
+    def _acquire(self, index: int) -> None:
+        with self._lock:
+            self._in_flight[index] += 1
+
+    def _release(self, index: int) -> None:
+        with self._lock:
+            self._in_flight[index] -= 1
+
+    def call(
+        self,
+        system_prompt: str,
+        user_message: str,
+        timeout_seconds: int = 30,
+        max_tokens: int = 2000,
+        prompt_cache_key: Optional[str] = None,
+        stream_callback: Optional[Callable[[str], None]] = None,
+        temperature: Optional[float] = None,
+    ) -> LLMResponse:
+        """Call the least busy provider, moving on when one is rate limited."""
+        from openai import RateLimitError
+
+        last_error = None
+        for index in self._dispatch_order():
+            self._acquire(index)
+            try:
+                return self.providers[index].call(
+                    system_prompt,
+                    user_message,
+                    timeout_seconds,
+                    max_tokens,
+                    prompt_cache_key,
+                    stream_callback,
+                    temperature,
+                )
+            except RateLimitError as e:
+                logger.warning(f"Pool member {index} rate limited, trying next")
+                last_error = e
+            finally:
+                self._release(index)
+        raise last_error
+
+    async def acall(
+        self,
+        system_prompt: str,
+        user_message: str,
+        timeout_seconds: int = 30,
+        max_tokens: int = 2000,
+        prompt_cache_key: Optional[str] = None,
+        stream_callback: Optional[Callable[[str], None]] = None,
+        temperature: Optional[float] = None,
+    ) -> LLMResponse:
+        """Async counterpart of call()."""
+        from openai import RateLimitError
+
+        last_error = None
+        for index in self._dispatch_order():
+            self._acquire(index)
+            try:
+                return await self.providers[index].acall(
+                    system_prompt,
+                    user_message,
+                    timeout_seconds,
+                    max_tokens,
+                    prompt_cache_key,
+                    stream_callback,
+                    temperature,
+                )
+            except RateLimitError as e:
+                logger.warning(f"Pool member {index} rate limited, trying next")
+                last_error = e
+            finally:
+                self._release(index)
+        raise last_error
+
+    def close(self) -> None:
+        """Close every pooled provider's connections."""
+        for provider in self.providers:
+            provider.close()
+
+    async def aclose(self) -> None:
+        """Close every pooled provider's connections, async ones included."""
+        for provider in self.providers:
+            await provider.aclose()
+
+    def validate_api_key(self) -> bool:
+        """Whether any pooled provider has a usable key."""
+        return any(provider.validate_api_key() for provider in self.providers)
+
+    def estimate_cost(self, input_tokens: int, output_tokens: int) -> float:
+        """Estimate cost with the pooled providers' pricing."""
+        return self.providers[0].estimate_cost(input_tokens, output_tokens)
+
+    def get_provider_name(self) -> str:
+        """Report the pooled providers' name."""
+        return self.providers[0].get_provider_name()
+
+
+def create_provider(
+    provider_name: str,
+    api_key: str,
+    cache: Optional[SemanticCache] = None,
+    retry: Optional[RetryConfig] = None,
+) -> LLMProvider:
     """
     Factory function to create LLM provider.
 
     Args:
         provider_name: "openai" or "deepseek"
         api_key: API key for provider
+        cache: Semantic cache consulted before each API call
+        retry: If given, wrap the provider in a RetryProvider with these settings
 
     Returns:
         LLMProvider instance
@@ -305,8 +1328,64 @@ def create_provider(provider_name: str, api_key: str) -> LLMProvider:
         ValueError: If provider_name not recognized
     """
     if provider_name.lower() == "openai":
-        return OpenAIProvider(api_key)
+        provider = OpenAIProvider(api_key, cache=cache)
     elif provider_name.lower() == "deepseek":
-        return DeepSeekProvider(api_key)
+        provider = DeepSeekProvider(api_key, cache=cache)
     else:
         raise ValueError(f"Unknown provider: {provider_name}")
+    return RetryProvider(provider, retry) if retry is not None else provider
+
+
+def create_pool(
+    provider_name: str,
+    api_keys: List[str],
+    cache: Optional[SemanticCache] = None,
+) -> PooledProvider:
+    """
+    Factory function to create a pool with one provider per API key.
+
+    Args:
+        provider_name: "openai" or "deepseek"
+        api_keys: API keys to spread calls across
+        cache: Semantic cache shared by every pooled provider
+
+    Returns:
+        PooledProvider instance
+
+    Raises:
+        ValueError: If provider_name not recognized or api_keys is empty
+    """
+    return PooledProvider(
+        [create_provider(provider_name, key, cache=cache) for key in api_keys]
+    )
+
+
+async def call_batch(
+    provider: LLMProvider,
+    items: List[Tuple[str, str]],
+    max_concurrency: int = 10,
+    **kwargs: Any,
+) -> List[Union[LLMResponse, BaseException]]:
+    """
+    Run many provider calls concurrently, at most max_concurrency at a time.
+
+    Args:
+        provider: Provider whose acall() serves every item
+        items: (system_prompt, user_message) pairs
+        max_concurrency: Upper bound on requests in flight
+        **kwargs: Passed to every acall() (e.g. timeout_seconds, max_tokens)
+
+    Returns:
+        One entry per item, in order: its LLMResponse, or the exception
+        that call raised
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def one(system_prompt: str, user_message: str) -> LLMResponse:
+        async with semaphore:
+            return await provider.acall(system_prompt, user_message, **kwargs)
+
+    return await asyncio.gather(
+        *(one(system_prompt, user_message) for system_prompt, user_message in items),
+        return_exceptions=True,
+    )
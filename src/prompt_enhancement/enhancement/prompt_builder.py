@@ -5,9 +5,11 @@ Constructs structured prompts for LLM that include project context
 and detected standards (AC2, AC6, AC8).
 """
 
+import functools
 import logging
-from typing import Optional
+from typing import Callable, List, Optional, Tuple
 from .context import ProjectContext
+from .llm_provider import count_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -19,22 +21,45 @@ class PromptBuilder:
     Takes a ProjectContext and original user prompt, and creates
     a structured message for the LLM that includes project metadata,
     detected standards, and user preferences.
+
+    Prompts are laid out static-first, dynamic-last: the project context
+    sections come before the original prompt, and render identically for
+    identical context (no timestamps or ids, stable ordering). Providers
+    only discount a cached prompt prefix, so anything request-specific
+    must stay at the end.
     """
 
-    def __init__(self, show_confidence: bool = True):
+    # Context sections kept first when a token budget forces some out
+    SECTION_PRIORITY = (
+        "metadata",
+        "overrides",
+        "standards",
+        "organization",
+        "dependencies",
+        "git",
+        "template",
+    )
+    MAX_DEPENDENCIES = 10
+
+    def __init__(self, show_confidence: bool = True, budget_tokens: Optional[int] = None):
         """
         Initialize prompt builder.
 
         Args:
             show_confidence: Whether to include confidence scores
+            budget_tokens: Token budget for the project context sections;
+                lower-priority sections are shortened or dropped to fit
+                (None for no limit)
         """
         self.show_confidence = show_confidence
+        self.budget_tokens = budget_tokens
         logger.debug("Initialized PromptBuilder")
 
     def build_prompt(
         self,
         user_prompt: str,
         project_context: ProjectContext,
+        context_prompt: Optional[str] = None,
     ) -> str:
         """
         Build structured LLM prompt.
@@ -45,59 +70,148 @@ class PromptBuilder:
         Args:
             user_prompt: Original user prompt (preserved unchanged)
             project_context: Collected project context
+            context_prompt: Output of build_context_prompt for this context,
+                if the caller already built it
 
         Returns:
             Structured prompt for LLM
         """
+        if context_prompt is None:
+            context_prompt = self.build_context_prompt(project_context)
+
+        # Section 1: Original prompt (always included, unchanged), placed
+        # after the context so the context stays a cacheable prefix
+        prompt = "\n\n".join(
+            (context_prompt, self._build_original_prompt_section(user_prompt))
+        )
+        logger.debug(f"Built prompt ({len(prompt)} chars)")
+        return prompt
+
+    def build_context_prompt(self, project_context: ProjectContext) -> str:
+        """
+        Build the project context sections of the LLM prompt.
+
+        Everything in the prompt except the original user prompt, so it
+        depends on the project context alone.
+
+        Args:
+            project_context: Collected project context
+
+        Returns:
+            Context sections joined in prompt order
+        """
         mode = "unknown"
         if project_context.collection_metadata:
             mode = project_context.collection_metadata.collection_mode
         logger.debug(f"Building LLM prompt (mode={mode})")
 
-        sections = []
-
-        # Section 1: Original prompt (always included, unchanged)
-        sections.append(self._build_original_prompt_section(user_prompt))
+        sections = self._context_sections(project_context)
+        if self.budget_tokens is not None:
+            return self._pack_sections(sections, project_context)
+
+        # Sections append their lines to one list, joined once at the end;
+        # an empty line separates consecutive sections
+        lines: List[str] = []
+        for index, (_, append_section) in enumerate(sections):
+            if index:
+                lines.append("")
+            append_section(lines, project_context)
+        return "\n".join(lines)
 
+    def _context_sections(
+        self, project_context: ProjectContext
+    ) -> List[Tuple[str, Callable[[List[str], ProjectContext], None]]]:
+        """Return (name, appender) for each section the context has, in prompt order."""
         # Section 2: Project metadata
-        sections.append(self._build_project_metadata_section(project_context))
+        sections = [("metadata", self._append_project_metadata_section)]
 
         # Section 3: Detected standards
-        sections.append(self._build_detected_standards_section(project_context))
+        if project_context.detected_standards:
+            sections.append(("standards", self._append_detected_standards_section))
 
         # Section 4: Project organization
         if project_context.project_organization:
-            sections.append(self._build_organization_section(project_context))
+            sections.append(("organization", self._append_organization_section))
 
         # Section 5: Git history
         if project_context.git_context:
-            sections.append(self._build_git_section(project_context))
+            sections.append(("git", self._append_git_section))
 
         # Section 6: Dependencies
         if project_context.dependencies:
-            sections.append(self._build_dependencies_section(project_context))
+            sections.append(("dependencies", self._append_dependencies_section))
 
         # Section 7: User overrides
         if project_context.user_overrides:
-            sections.append(self._build_overrides_section(project_context))
+            sections.append(("overrides", self._append_overrides_section))
 
         # Section 8: Template guidance
         if project_context.template_name:
-            sections.append(self._build_template_section(project_context))
+            sections.append(("template", self._append_template_section))
 
-        prompt = "\n\n".join(sections)
-        logger.debug(
-            f"Built prompt with {len(sections)} sections ({len(prompt)} chars)"
-        )
-        return prompt
+        return sections
+
+    def _pack_sections(
+        self,
+        sections: List[Tuple[str, Callable[[List[str], ProjectContext], None]]],
+        project_context: ProjectContext,
+    ) -> str:
+        """
+        Render the sections that fit budget_tokens, in prompt order.
+
+        Sections are admitted in SECTION_PRIORITY order; project metadata is
+        always kept. A dependency list that does not fit is shortened
+        before it is dropped.
+        """
+        appenders = dict(sections)
+        rendered = {}
+        remaining = self.budget_tokens
+
+        for name in self.SECTION_PRIORITY:
+            if name not in appenders:
+                continue
+            if name == "dependencies":
+                candidates = [
+                    functools.partial(self._append_dependencies_section, limit=limit)
+                    for limit in self._dependency_limits(project_context)
+                ]
+            else:
+                candidates = [appenders[name]]
+
+            for append_section in candidates:
+                lines: List[str] = []
+                append_section(lines, project_context)
+                text = "\n".join(lines)
+                cost = count_tokens(text) + 1  # Plus the separating blank line
+                if cost <= remaining or name == "metadata":
+                    rendered[name] = text
+                    remaining -= cost
+                    break
+            else:
+                logger.debug(
+                    f"Dropped {name} section to fit {self.budget_tokens}-token budget"
+                )
+
+        return "\n\n".join(rendered[name] for name, _ in sections if name in rendered)
+
+    def _dependency_limits(self, project_context: ProjectContext) -> List[int]:
+        """Dependency counts to try, from the full list down to one."""
+        limit = min(len(project_context.dependencies), self.MAX_DEPENDENCIES)
+        limits = []
+        while limit >= 1:
+            limits.append(limit)
+            limit //= 2
+        return limits
 
     def _build_original_prompt_section(self, user_prompt: str) -> str:
         """Build section with original user prompt (AC2, unchanged)."""
         return f"<ORIGINAL_PROMPT>\n{user_prompt}\n</ORIGINAL_PROMPT>"
 
-    def _build_project_metadata_section(self, context: ProjectContext) -> str:
-        """Build section with project metadata."""
-        lines = ["<PROJECT_METADATA>"]
+    def _append_project_metadata_section(
+        self, lines: List[str], context: ProjectContext
+    ) -> None:
+        """Append section with project metadata."""
+        lines.append("<PROJECT_METADATA>")
         lines.append(f"Project: {context.project_name}")
         lines.append(f"Language: {context.language}")
 
@@ -107,18 +221,16 @@ class PromptBuilder:
             lines.append(f"Framework Version: {context.framework_version}")
 
         lines.append("</PROJECT_METADATA>")
-        return "\n".join(lines)
 
-    def _build_detected_standards_section(self, context: ProjectContext) -> str:
+    def _append_detected_standards_section(
+        self, lines: List[str], context: ProjectContext
+    ) -> None:
         """
-        Build section with detected coding standards.
+        Append section with detected coding standards.
 
         AC3: Handle low-confidence standards
         """
-        if not context.detected_standards:
-            return ""
-
-        lines = ["<DETECTED_STANDARDS>"]
+        lines.append("<DETECTED_STANDARDS>")
 
         for standard_name, standard in sorted(context.detected_standards.items()):
             # Include standard name and detected value
@@ -147,25 +259,18 @@ class PromptBuilder:
                 lines.append(f"  Sample: {standard.sample_size} files analyzed")
 
         lines.append("</DETECTED_STANDARDS>")
-        return "\n".join(lines)
 
-    def _build_organization_section(self, context: ProjectContext) -> str:
-        """Build section with project organization pattern."""
-        if not context.project_organization:
-            return ""
+    def _append_organization_section(
+        self, lines: List[str], context: ProjectContext
+    ) -> None:
+        """Append section with project organization pattern."""
+        lines.append("<PROJECT_ORGANIZATION>")
+        lines.append(f"Pattern: {context.project_organization}")
+        lines.append("</PROJECT_ORGANIZATION>")
 
-        return (
-            f"<PROJECT_ORGANIZATION>\n"
-            f"Pattern: {context.project_organization}\n"
-            f"</PROJECT_ORGANIZATION>"
-        )
-
-    def _build_git_section(self, context: ProjectContext) -> str:
-        """Build section with Git history context."""
-        if not context.git_context:
-            return ""
-
-        lines = ["<GIT_HISTORY>"]
+    def _append_git_section(self, lines: List[str], context: ProjectContext) -> None:
+        """Append section with Git history context."""
+        lines.append("<GIT_HISTORY>")
 
         if context.git_context.total_commits:
             lines.append(f"Total commits: {context.git_context.total_commits}")
@@ -179,46 +284,41 @@ class PromptBuilder:
             )
 
         lines.append("</GIT_HISTORY>")
-        return "\n".join(lines)
-
-    def _build_dependencies_section(self, context: ProjectContext) -> str:
-        """Build section with dependencies."""
-        if not context.dependencies:
-            return ""
 
-        lines = ["<DEPENDENCIES>"]
-        for dep in context.dependencies[:10]:  # Limit to first 10
+    def _append_dependencies_section(
+        self, lines: List[str], context: ProjectContext, limit: int = MAX_DEPENDENCIES
+    ) -> None:
+        """Append section with the first limit dependencies."""
+        lines.append("<DEPENDENCIES>")
+        for dep in context.dependencies[:limit]:
             if dep.version:
                 lines.append(f"• {dep.name} ({dep.version})")
             else:
                 lines.append(f"• {dep.name}")
 
-        if len(context.dependencies) > 10:
-            lines.append(f"... and {len(context.dependencies) - 10} more")
+        if len(context.dependencies) > limit:
+            lines.append(f"... and {len(context.dependencies) - limit} more")
 
         lines.append("</DEPENDENCIES>")
-        return "\n".join(lines)
-
-    def _build_overrides_section(self, context: ProjectContext) -> str:
-        """Build section with user-specified overrides."""
-        if not context.user_overrides:
-            return ""
 
-        lines = ["<USER_OVERRIDES>"]
-        for key, value in context.user_overrides.items():
+    def _append_overrides_section(
+        self, lines: List[str], context: ProjectContext
+    ) -> None:
+        """Append section with user-specified overrides."""
+        lines.append("<USER_OVERRIDES>")
+        for key, value in sorted(context.user_overrides.items()):
             lines.append(f"• {key}: {value}")
 
         lines.append("</USER_OVERRIDES>")
-        return "\n".join(lines)
 
-    def _build_template_section(self, context: ProjectContext) -> str:
-        """Build section with template-specific guidance."""
-        return (
-            f"<TEMPLATE_INFO>\n"
-            f"Using template: {context.template_name}\n"
-            f"Apply template-specific rules and conventions\n"
-            f"</TEMPLATE_INFO>"
-        )
+    def _append_template_section(
+        self, lines: List[str], context: ProjectContext
+    ) -> None:
+        """Append section with template-specific guidance."""
+        lines.append("<TEMPLATE_INFO>")
+        lines.append(f"Using template: {context.template_name}")
+        lines.append("Apply template-specific rules and conventions")
+        lines.append("</TEMPLATE_INFO>")
 
     def build_system_prompt(self) -> str:
         """
@@ -4,12 +4,26 @@ LLM response validator for enhancement results.
 Validates that LLM responses meet quality requirements (AC2).
 """
 
+import functools
 import logging
 import re
-from typing import Tuple, List
+from itertools import islice
+from typing import FrozenSet, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+_COMMON_WORDS = frozenset({"the", "and", "or", "for", "with", "that", "this", "from"})
+_WORD_RE = re.compile(r"\b\w{3,}\b")
+_BLANK_LINES_RE = re.compile(r"\n\n+")
+
+
+@functools.lru_cache(maxsize=256)
+def _significant_words(text: str) -> FrozenSet[str]:
+    """Lowercased words of 3+ chars in text, excluding common words."""
+    return frozenset(
+        word for word in _WORD_RE.findall(text.lower()) if word not in _COMMON_WORDS
+    )
+
 
 class ResponseValidator:
     """
@@ -47,6 +61,14 @@ class ResponseValidator:
         "process",
         "manage",
     ]
+    SIMPLE_INDICATORS = ("basic", "simple", "easy", "straightforward")
+    COMPLEX_INDICATORS = (
+        "complex",
+        "advanced",
+        "sophisticated",
+        "intricate",
+        "architecture",
+    )
 
     def validate_response(
         self, response: str, original_prompt: str
@@ -93,12 +115,10 @@ class ResponseValidator:
         Looks for keywords like "implement", "step", "test", etc.
         """
         response_lower = response.lower()
-        actionable_count = sum(
-            1 for keyword in self.ACTIONABLE_KEYWORDS if keyword in response_lower
-        )
+        found = (kw for kw in self.ACTIONABLE_KEYWORDS if kw in response_lower)
 
-        # At least 3 actionable keywords
-        return actionable_count >= 3
+        # At least 3 actionable keywords; stop scanning once 3 are found
+        return len(list(islice(found, 3))) == 3
 
     def _preserves_original_intent(self, response: str, original: str) -> bool:
         """
@@ -106,24 +126,20 @@ class ResponseValidator:
 
         Simple heuristic: looks for key nouns/concepts from original prompt.
         """
-        # Extract significant words from original prompt (3+ chars, excluding common words)
-        common_words = {"the", "and", "or", "for", "with", "that", "this", "from"}
-        original_words = {
-            word.lower()
-            for word in re.findall(r"\b\w{3,}\b", original)
-            if word.lower() not in common_words
-        }
+        # Significant words from original prompt (3+ chars, excluding common
+        # words); cached, as the same prompt is validated on every retry
+        original_words = _significant_words(original)
 
         if not original_words:
             # Can't determine intent
             return True
 
-        # Check if response contains at least 30% of original meaningful words
+        # Check if response contains at least 30% of original meaningful words,
+        # as substrings so "create" still matches "creating"
         response_lower = response.lower()
-        matched_words = sum(1 for word in original_words if word in response_lower)
-
-        match_ratio = matched_words / len(original_words) if original_words else 0
-        return match_ratio >= 0.3
+        needed = -(-3 * len(original_words) // 10)  # ceil(30%), in integers
+        matched = (word for word in original_words if word in response_lower)
+        return len(list(islice(matched, needed))) == needed
 
     def sanitize_response(self, response: str) -> str:
         """
@@ -141,7 +157,7 @@ class ResponseValidator:
         sanitized = response.strip()
 
         # Replace multiple newlines with single
-        sanitized = re.sub(r"\n\n+", "\n\n", sanitized)
+        sanitized = _BLANK_LINES_RE.sub("\n\n", sanitized)
 
         # Ensure ends with period if not already
         if sanitized and not sanitized.endswith((".", "!", "?", ":")):
@@ -165,45 +181,38 @@ class ResponseValidator:
         Returns:
             Dictionary with extracted sections
         """
+        response_lower = response.lower()
         sections = {
             "full_response": response,
-            "has_implementation_steps": "step" in response.lower()
-            or "implement" in response.lower(),
-            "has_testing_guidance": "test" in response.lower()
-            or "verify" in response.lower(),
-            "has_error_handling": "error" in response.lower()
-            or "handle" in response.lower(),
-            "estimated_complexity": self._estimate_complexity(response),
+            "has_implementation_steps": "step" in response_lower
+            or "implement" in response_lower,
+            "has_testing_guidance": "test" in response_lower
+            or "verify" in response_lower,
+            "has_error_handling": "error" in response_lower
+            or "handle" in response_lower,
+            "estimated_complexity": self._estimate_complexity(response, response_lower),
         }
 
         return sections
 
-    def _estimate_complexity(self, response: str) -> str:
+    def _estimate_complexity(
+        self, response: str, response_lower: Optional[str] = None
+    ) -> str:
         """
         Estimate complexity of described implementation.
 
         Returns: "simple", "moderate", or "complex"
         """
-        response_lower = response.lower()
-        line_count = len(response.split("\n"))
-
-        complexity_indicators = {
-            "simple": ["basic", "simple", "easy", "straightforward"],
-            "complex": [
-                "complex",
-                "advanced",
-                "sophisticated",
-                "intricate",
-                "architecture",
-            ],
-        }
+        if response_lower is None:
+            response_lower = response.lower()
+        line_count = response.count("\n") + 1
 
         complex_score = sum(
-            1 for word in complexity_indicators["complex"] if word in response_lower
+            1 for word in self.COMPLEX_INDICATORS if word in response_lower
         )
 
         simple_score = sum(
-            1 for word in complexity_indicators["simple"] if word in response_lower
+            1 for word in self.SIMPLE_INDICATORS if word in response_lower
         )
 
         if complex_score > simple_score:
@@ -0,0 +1,147 @@
+"""
+Persistent key-value backends for caching enhancement results.
+
+Lets results survive across CLI invocations and processes. Values are
+opaque strings (the caller serializes), stored with a time-to-live.
+
+- SqliteBackend: zero-dependency local file cache (default location
+  ~/.prompt-enhancement/cache/enhancements.sqlite3)
+- RedisBackend: shared cache for several machines, requires redis-py
+"""
+
+import logging
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+
+class CacheBackend(ABC):
+    """Interface for persistent cache stores."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored value, or None if missing or expired
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: int = DEFAULT_TTL_SECONDS) -> None:
+        """
+        Store a value, replacing any existing one.
+
+        Args:
+            key: Cache key
+            value: Serialized value
+            ttl: Seconds until the entry expires
+        """
+        pass
+
+
+class SqliteBackend(CacheBackend):
+    """Cache stored in a local SQLite database, safe across processes."""
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize SQLite cache.
+
+        Args:
+            db_path: Database file (~/.prompt-enhancement/cache/enhancements.sqlite3)
+        """
+        if db_path is None:
+            db_path = str(
+                Path.home() / ".prompt-enhancement" / "cache" / "enhancements.sqlite3"
+            )
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+        logger.debug(f"Initialized SqliteBackend at {self.db_path}")
+
+    def _connect(self) -> sqlite3.Connection:
+        # Short-lived connections keep concurrent CLI processes independent;
+        # callers close them, since the connection context manager only commits
+        return sqlite3.connect(str(self.db_path), timeout=5)
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up an unexpired value."""
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str, ttl: int = DEFAULT_TTL_SECONDS) -> None:
+        """Store a value and drop entries that have expired."""
+        # Wall-clock time, since expiry must agree across processes
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, now + ttl),
+            )
+
+
+class RedisBackend(CacheBackend):
+    """Cache stored in Redis, shared by every process that can reach it."""
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        prefix: str = "prompt-enhancement:",
+        client: Optional[Any] = None,
+    ):
+        """
+        Initialize Redis cache.
+
+        Args:
+            url: Redis connection URL (ignored when client is given)
+            prefix: Namespace prepended to every key
+            client: Existing redis.Redis client to use
+
+        Raises:
+            ImportError: If no client is given and redis-py is not installed
+        """
+        if client is None:
+            # Imported here so importing this module never loads redis-py
+            try:
+                import redis
+            except ImportError as e:
+                raise ImportError(
+                    "redis-py not installed, cannot use RedisBackend"
+                ) from e
+            client = redis.Redis.from_url(url)
+
+        self.client = client
+        self.prefix = prefix
+        logger.debug(f"Initialized RedisBackend with prefix={prefix}")
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a value; Redis expires entries itself."""
+        value = self.client.get(self.prefix + key)
+        if isinstance(value, bytes):
+            value = value.decode("utf-8")
+        return value
+
+    def set(self, key: str, value: str, ttl: int = DEFAULT_TTL_SECONDS) -> None:
+        """Store a value with a TTL."""
+        self.client.setex(self.prefix + key, ttl, value)
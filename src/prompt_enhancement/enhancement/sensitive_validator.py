@@ -7,7 +7,7 @@ information are not included in LLM prompts (AC4).
 
 import logging
 import re
-from typing import Dict, List, Any
+from typing import Any, Dict, Iterable, List, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +41,24 @@ class SensitiveDataValidator:
             name: re.compile(pattern, re.IGNORECASE)
             for name, pattern in self.SENSITIVE_PATTERNS.items()
         }
+        # All patterns as one alternation: a single scan tells whether any
+        # pattern can match, which is the rare case for real prompts
+        self._combined = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.SENSITIVE_PATTERNS.values()),
+            re.IGNORECASE,
+        )
+
+    def _candidate_patterns(self, text: str) -> Iterable[Tuple[str, "re.Pattern"]]:
+        """
+        Patterns worth running individually on text.
+
+        Empty unless the combined scan finds something; then every pattern,
+        since overlapping patterns (e.g. OpenAI and DeepSeek keys) must
+        each be reported.
+        """
+        if self._combined.search(text) is None:
+            return ()
+        return self.compiled_patterns.items()
 
     def validate_context_dict(
         self, context_dict: Dict[str, Any]
@@ -60,7 +78,7 @@ class SensitiveDataValidator:
 
         # Convert dict to string and check
         context_str = str(context_dict)
-        for pattern_name, pattern in self.compiled_patterns.items():
+        for pattern_name, pattern in self._candidate_patterns(context_str):
             matches = pattern.findall(context_str)
             if matches:
                 violations.append(
@@ -96,7 +114,7 @@ class SensitiveDataValidator:
         violations = []
         field_str = str(field_value)
 
-        for pattern_name, pattern in self.compiled_patterns.items():
+        for pattern_name, pattern in self._candidate_patterns(field_str):
             if pattern.search(field_str):
                 violations.append(
                     f"Sensitive data in '{field_name}': {pattern_name} pattern detected"
@@ -117,9 +135,9 @@ class SensitiveDataValidator:
         """
         violations = []
 
-        for pattern_name, pattern in self.compiled_patterns.items():
-            matches = pattern.findall(prompt_text)
-            if matches:
+        for pattern_name, pattern in self._candidate_patterns(prompt_text):
+            # Only presence matters here, so stop at the first match
+            if pattern.search(prompt_text):
                 violations.append(f"Sensitive data in prompt: {pattern_name}")
                 logger.debug(f"Sensitive data in final prompt: {pattern_name}")
 
@@ -135,8 +153,11 @@ class SensitiveDataValidator:
         Returns:
             Text with sensitive patterns redacted
         """
+        # Patterns run one after another: with one combined sub() a match
+        # of one pattern can swallow the start of another's, leaving the
+        # rest of that secret unredacted
         sanitized = text
-        for pattern_name, pattern in self.compiled_patterns.items():
+        for pattern_name, pattern in self._candidate_patterns(text):
             sanitized = pattern.sub("[REDACTED]", sanitized)
         return sanitized
 
@@ -6,12 +6,15 @@ Implements AC1: Extract implementation steps from LLM response in various format
 
 import logging
 import re
-from dataclasses import dataclass
-from typing import List, Optional, Set, Dict
+from dataclasses import dataclass, field
+from typing import List, Optional, Set, Dict, Tuple
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+_STEP_REF_RE = re.compile(r"step\s+(\d+)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class StepFormat(Enum):
     """Format of implementation steps detected."""
@@ -35,10 +38,26 @@ class ImplementationStep:
     is_actionable: bool = True  # Has verb + object
     complexity: str = "moderate"  # simple, moderate, complex
 
+    # Memo for content_lower, and the content string it was computed from
+    _content_lower: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _lowered_from: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         if self.dependencies is None:
             self.dependencies = []
 
+    @property
+    def content_lower(self) -> str:
+        """Lowercased content, recomputed only when content is reassigned."""
+        if self._lowered_from is not self.content:
+            self._content_lower = self.content.lower()
+            self._lowered_from = self.content
+        return self._content_lower
+
 
 @dataclass
 class StepGroup:
@@ -73,13 +92,15 @@ class StepExtractor:
     Implements AC1 requirements.
     """
 
-    # Patterns for detecting steps
-    NUMBERED_PATTERN = r"^\s*(\d+)\s*[\.\)]\s+(.+?)$"
+    # Patterns for detecting steps, compiled once for every response
+    NUMBERED_PATTERN = re.compile(r"^\s*(\d+)\s*[\.\)]\s+(.+?)$", re.IGNORECASE)
     BULLET_PATTERNS = [
-        r"^\s*[\-\*•]\s+(.+?)$",  # - or * or •
-        r"^\s*▪\s+(.+?)$",  # Bullet
+        re.compile(r"^\s*[\-\*•]\s+(.+?)$"),  # - or * or •
+        re.compile(r"^\s*▪\s+(.+?)$"),  # Bullet
     ]
-    STEP_KEYWORD_PATTERN = r"(?:step|phase|stage)\s+(\d+)[\s:]*(.+?)$"
+    STEP_KEYWORD_PATTERN = re.compile(
+        r"(?:step|phase|stage)\s+(\d+)[\s:]*(.+?)$", re.IGNORECASE | re.MULTILINE
+    )
 
     # Actionable keyword detection (AC1 validation)
     ACTIONABLE_VERBS = {
@@ -180,12 +201,11 @@ class StepExtractor:
             )
 
         # Try different extraction methods in order of specificity
-        steps = self._extract_numbered_steps(llm_response)
-        format_type = StepFormat.NUMBERED
-
-        if not steps:
-            steps = self._extract_bullet_steps(llm_response)
-            format_type = StepFormat.BULLETS
+        numbered, bullets = self._extract_line_steps(llm_response)
+        if numbered:
+            steps, format_type = numbered, StepFormat.NUMBERED
+        else:
+            steps, format_type = bullets, StepFormat.BULLETS
 
         if not steps:
             steps = self._extract_keyword_steps(llm_response)
@@ -234,50 +254,44 @@ class StepExtractor:
 
         return result
 
-    def _extract_numbered_steps(self, response: str) -> List[ImplementationStep]:
-        """Extract numbered steps (1. Step, 2. Step)."""
-        steps = []
-        lines = response.split("\n")
+    def _extract_line_steps(
+        self, response: str
+    ) -> Tuple[List[ImplementationStep], List[ImplementationStep]]:
+        """
+        Extract numbered (1. Step) and bullet (-, *, •) steps in one pass.
 
-        for line in lines:
-            match = re.match(self.NUMBERED_PATTERN, line, re.IGNORECASE)
+        Returns (numbered steps, bullet steps). Numbered steps take
+        precedence, so bullets are no longer matched once one is found.
+        """
+        numbered = []
+        bullets = []
+
+        for line in response.split("\n"):
+            match = self.NUMBERED_PATTERN.match(line)
             if match:
-                number = int(match.group(1))
                 content = match.group(2).strip()
                 if content:
-                    steps.append(
+                    numbered.append(
                         ImplementationStep(
-                            number=number,
+                            number=int(match.group(1)),
                             content=content,
                             original_text=line.strip(),
                             format_detected=StepFormat.NUMBERED,
                         )
                     )
+                continue
 
-        # Sort by number and renumber sequentially
-        if steps:
-            steps.sort(key=lambda s: s.number)
-            for i, step in enumerate(steps, 1):
-                step.number = i
-
-        return steps
-
-    def _extract_bullet_steps(self, response: str) -> List[ImplementationStep]:
-        """Extract bullet steps (-, *, •)."""
-        steps = []
-        lines = response.split("\n")
-        step_num = 0
+            if numbered:
+                continue
 
-        for line in lines:
             for pattern in self.BULLET_PATTERNS:
-                match = re.match(pattern, line)
+                match = pattern.match(line)
                 if match:
                     content = match.group(1).strip()
                     if content:
-                        step_num += 1
-                        steps.append(
+                        bullets.append(
                             ImplementationStep(
-                                number=step_num,
+                                number=len(bullets) + 1,
                                 content=content,
                                 original_text=line.strip(),
                                 format_detected=StepFormat.BULLETS,
@@ -285,16 +299,20 @@ class StepExtractor:
                         )
                     break
 
-        return steps
+        # Sort numbered steps by number and renumber sequentially
+        if numbered:
+            numbered.sort(key=lambda s: s.number)
+            for i, step in enumerate(numbered, 1):
+                step.number = i
+
+        return numbered, bullets
 
     def _extract_keyword_steps(self, response: str) -> List[ImplementationStep]:
         """Extract steps marked with keywords (Step 1:, Phase 2:, etc)."""
         steps = []
 
         # Find all step-like patterns
-        for match in re.finditer(
-            self.STEP_KEYWORD_PATTERN, response, re.IGNORECASE | re.MULTILINE
-        ):
+        for match in self.STEP_KEYWORD_PATTERN.finditer(response):
             number = int(match.group(1))
             content = match.group(2).strip()
 
@@ -325,10 +343,11 @@ class StepExtractor:
         for step in steps:
             # Clean up whitespace
             step.content = step.content.strip()
-            step.content = re.sub(r"\s+", " ", step.content)
+            step.content = _WHITESPACE_RE.sub(" ", step.content)
 
-            # Check if actionable
-            step.is_actionable = self._is_actionable(step.content)
+            # Check if actionable; this also primes the content_lower memo
+            # that dependency, complexity and grouping passes read
+            step.is_actionable = self._is_actionable(step.content, step.content_lower)
 
             # Only keep non-empty steps
             if step.content:
@@ -336,13 +355,14 @@ class StepExtractor:
 
         return cleaned
 
-    def _is_actionable(self, text: str) -> bool:
+    def _is_actionable(self, text: str, text_lower: Optional[str] = None) -> bool:
         """Check if text contains actionable guidance (AC1 validation)."""
-        # Look for verbs that indicate action
-        words = text.lower().split()
+        if text_lower is None:
+            text_lower = text.lower()
 
-        # Check for actionable verbs in first few words
-        for word in words[:5]:
+        # Check for actionable verbs in first few words, without splitting
+        # the rest of the text
+        for word in text_lower.split(None, 5)[:5]:
             # Remove punctuation
             clean_word = word.rstrip(".,!?;:")
             if clean_word in self.ACTIONABLE_VERBS:
@@ -358,7 +378,7 @@ class StepExtractor:
             "bear in mind",
         }
 
-        if any(phrase in text.lower() for phrase in generic_phrases):
+        if any(phrase in text_lower for phrase in generic_phrases):
             return True  # At least it's guidance
 
         return len(text) > 20  # Non-empty is better than empty
@@ -368,13 +388,13 @@ class StepExtractor:
     ) -> List[ImplementationStep]:
         """Detect step dependencies based on keywords and ordering (AC1)."""
         for i, step in enumerate(steps):
-            content_lower = step.content.lower()
+            content_lower = step.content_lower
 
             # Check for dependency keywords
             for keyword in self.DEPENDENCY_KEYWORDS:
                 if keyword in content_lower:
                     # Look for step references like "after step 1"
-                    match = re.search(r"step\s+(\d+)", content_lower)
+                    match = _STEP_REF_RE.search(content_lower)
                     if match:
                         dep_num = int(match.group(1))
                         if dep_num < step.number and dep_num not in step.dependencies:
@@ -394,7 +414,7 @@ class StepExtractor:
     ) -> List[ImplementationStep]:
         """Estimate complexity of each step."""
         for step in steps:
-            content_lower = step.content.lower()
+            content_lower = step.content_lower
 
             # Complex indicators
             complex_words = {
@@ -425,7 +445,7 @@ class StepExtractor:
         current_group = "Implementation"
 
         for step in steps:
-            content_lower = step.content.lower()
+            content_lower = step.content_lower
 
             # Detect group by keywords
             if any(
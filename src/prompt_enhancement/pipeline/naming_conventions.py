@@ -127,7 +127,8 @@ class NamingConventionDetector:
     CAMEL_CASE_PATTERN = re.compile(r"^[a-z][a-z0-9]*[A-Z][a-zA-Z0-9]*$")
     PASCAL_CASE_PATTERN = re.compile(r"^[A-Z][a-zA-Z0-9]*$")
     KEBAB_CASE_PATTERN = re.compile(r"^[a-z][a-z0-9\-]*$")
-    UPPER_SNAKE_CASE_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]*$")
+    # Leading underscores mark private constants (PEP 8), e.g. _MAX_SIZE
+    UPPER_SNAKE_CASE_PATTERN = re.compile(r"^_*[A-Z][A-Z0-9_]*$")
 
     # Language-specific extraction patterns
     PYTHON_FUNCTION_PATTERN = re.compile(
@@ -100,6 +100,12 @@ class TestOverrideParsingAC3:
         assert len(errors) > 0
         assert "Unknown override key" in errors[0]
 
+    def test_misspelled_override_key_suggests_match(self):
+        """Test misspelled override key suggests the closest valid key."""
+        overrides, errors = OverrideParser.parse_overrides(["namig=camelCase"])
+        assert overrides == {}
+        assert "Did you mean 'naming'?" in errors[0]
+
     def test_malformed_override(self):
         """Test malformed override syntax."""
         overrides, errors = OverrideParser.parse_overrides(["invalid_syntax"])
@@ -117,6 +117,17 @@ class TestTemplateSystemAC4:
 
             assert result is False
 
+    def test_resaved_custom_template_is_reloaded(self):
+        """Test overwriting a custom template picks up the new contents."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = TemplateManager(tmpdir)
+
+            manager.save_template("my-template", StandardsConfig(naming_convention="camelCase"))
+            assert manager.get_template("my-template").naming_convention == "camelCase"
+
+            manager.save_template("my-template", StandardsConfig(naming_convention="snake_case"))
+            assert manager.get_template("my-template").naming_convention == "snake_case"
+
 
 class TestTemplateSystemAC5:
     """AC5: Template suggestion from overrides."""
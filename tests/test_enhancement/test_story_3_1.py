@@ -6,6 +6,8 @@ Tests all 8 acceptance criteria (AC1-AC8).
 
 import pytest
 import json
+from concurrent.futures import ThreadPoolExecutor
+
 from src.prompt_enhancement.enhancement import (
     ProjectContext,
     ProjectContextCollector,
@@ -15,6 +17,9 @@ from src.prompt_enhancement.enhancement import (
     CollectionMetadata,
     GitHistoryContext,
 )
+from src.prompt_enhancement.enhancement import context_collector
+from src.prompt_enhancement.enhancement.context_collector import SYMBOL_INDEX_CHUNKSIZE
+from src.prompt_enhancement.symbol_indexer import SymbolIndexer
 
 
 class TestAC1_CollectProjectContext:
@@ -49,10 +54,108 @@ class TestAC1_CollectProjectContext:
         assert context.project_name  # Project name
         assert context.language  # Primary language
         assert isinstance(context.detected_standards, dict)  # Standards dict
-        assert isinstance(context.git_context, GitHistoryContext)  # Git context
+        assert context.git_context is None  # No git history in analysis result
         assert isinstance(context.dependencies, list)  # Dependencies list
         assert context.project_fingerprint  # Fingerprint for caching
 
+    def test_collector_reads_tech_stack_attributes(self, tmp_path):
+        """Test language and framework extraction from a tech stack object."""
+        from types import SimpleNamespace
+
+        tech_stack = SimpleNamespace(
+            primary_language=SimpleNamespace(value="python"),
+            frameworks=["fastapi", "sqlalchemy"],
+            framework_versions={"primary": "0.110"},
+        )
+        collector = ProjectContextCollector(str(tmp_path))
+        context = collector.collect_context({"tech_stack": tech_stack})
+
+        assert context.language == "python"
+        assert context.framework == "fastapi"
+        assert context.framework_version == "0.110"
+
+    def test_collector_tolerates_incomplete_tech_stack(self, tmp_path):
+        """Test that missing or malformed tech stack attributes fall back."""
+        from types import SimpleNamespace
+
+        collector = ProjectContextCollector(str(tmp_path))
+        context = collector.collect_context(
+            {"tech_stack": SimpleNamespace(primary_language=None, framework_versions="1.0")}
+        )
+
+        assert context.language == "unknown"
+        assert context.framework is None
+        assert context.framework_version is None
+
+    def test_collector_decodes_confidence_report_once(self, tmp_path):
+        """Test that standards and organization share one decoded report."""
+        calls = []
+
+        class Report:
+            def to_dict(self):
+                calls.append(1)
+                return {
+                    "naming_convention": {"detected_value": "snake_case", "confidence": 0.9},
+                    "code_organization": {"detected_value": "by-feature", "confidence": 0.8},
+                }
+
+        collector = ProjectContextCollector(str(tmp_path))
+        context = collector.collect_context({"confidence_report": Report()})
+
+        assert len(calls) == 1
+        assert context.detected_standards["naming_convention"].detected_value == "snake_case"
+        assert context.project_organization == "by-feature"
+
+    def test_collector_accepts_objects_and_plain_dicts(self, tmp_path):
+        """Test that analysis results may be to_dict() objects or plain dicts."""
+        from unittest.mock import Mock
+
+        git_history = Mock()
+        git_history.to_dict.return_value = {"current_branch": "dev", "total_commits": 5}
+        collector = ProjectContextCollector(str(tmp_path))
+
+        from_object = collector.collect_context({"git_history": git_history})
+        from_dict = collector.collect_context(
+            {"git_history": {"current_branch": "dev", "total_commits": 5}}
+        )
+
+        assert from_object.git_context == from_dict.git_context
+
+    def test_collector_infers_dependency_package_managers(self, tmp_path):
+        """Test that dependency package managers are inferred from names."""
+        collector = ProjectContextCollector(str(tmp_path))
+        context = collector.collect_context(
+            {
+                "indicator_files": {
+                    "dependencies": {
+                        "scikit-py": "1.0",
+                        "@types/node": "20.0",
+                        "serde-rs": "1.0",
+                        "requests": "2.31",
+                    }
+                }
+            }
+        )
+
+        managers = {d.name: d.package_manager for d in context.dependencies}
+        assert managers == {
+            "scikit-py": "pip",
+            "@types/node": "npm",
+            "serde-rs": "cargo",
+            "requests": None,
+        }
+
+    def test_collector_builds_git_context_from_history(self, tmp_path):
+        """Test that git context is created only when git history is provided."""
+        collector = ProjectContextCollector(str(tmp_path))
+        context = collector.collect_context(
+            {"git_history": {"current_branch": "main", "total_commits": 7}}
+        )
+
+        assert isinstance(context.git_context, GitHistoryContext)
+        assert context.git_context.total_commits == 7
+        assert "git_history" in context.collection_metadata.fields_collected
+
     def test_context_is_organized_for_llm(self):
         """Test that context is properly organized for LLM consumption."""
         context = ProjectContext(
@@ -95,6 +198,20 @@ class TestAC2_BuildStructuredPrompt:
         assert "<ORIGINAL_PROMPT>" in prompt
         assert "</ORIGINAL_PROMPT>" in prompt
 
+    def test_context_is_prefix_and_prompt_is_last(self):
+        """Test that static context leads and the user prompt comes last."""
+        builder = PromptBuilder()
+        context = ProjectContext(project_name="test", language="python")
+        context.user_overrides = {"b": "2", "a": "1"}
+
+        first = builder.build_prompt("first prompt", context)
+        second = builder.build_prompt("second prompt", context)
+        prefix = builder.build_context_prompt(context)
+
+        assert first.startswith(prefix) and second.startswith(prefix)
+        assert first.endswith("</ORIGINAL_PROMPT>")
+        assert prefix.index("• a: 1") < prefix.index("• b: 2")
+
     def test_prompt_includes_all_seven_sections(self):
         """Test that prompt includes all AC2 required sections."""
         builder = PromptBuilder()
@@ -139,6 +256,34 @@ class TestAC2_BuildStructuredPrompt:
         assert len(prompt) > 0
         assert "\n" in prompt  # Properly formatted with newlines
 
+    def test_budget_drops_low_priority_sections(self, monkeypatch):
+        """Test that a token budget keeps high-priority sections and trims the rest."""
+        import sys
+        from src.prompt_enhancement.enhancement import llm_provider
+        from src.prompt_enhancement.enhancement.context import Dependency
+
+        # Use the character-based estimate so the budget is deterministic
+        monkeypatch.setitem(sys.modules, "tiktoken", None)
+        llm_provider._get_encoding.cache_clear()
+
+        context = ProjectContext(project_name="test", language="python")
+        context.user_overrides = {"style": "concise"}
+        context.dependencies = [
+            Dependency(name=f"package-{i}", version=f"1.0.{i}") for i in range(20)
+        ]
+        context.git_context = GitHistoryContext(current_branch="main", total_commits=42)
+
+        unbudgeted = PromptBuilder().build_context_prompt(context)
+        budgeted = PromptBuilder(budget_tokens=60).build_context_prompt(context)
+        llm_provider._get_encoding.cache_clear()
+
+        assert "<PROJECT_METADATA>" in budgeted
+        assert "<USER_OVERRIDES>" in budgeted
+        assert "<GIT_HISTORY>" in unbudgeted and "<GIT_HISTORY>" not in budgeted
+        assert "package-9" in unbudgeted
+        assert "package-9" not in budgeted and "... and 18 more" in budgeted
+        assert PromptBuilder(budget_tokens=10**6).build_context_prompt(context) == unbudgeted
+
 
 class TestAC3_HandleLowConfidence:
     """AC3: Handle Low-Confidence Standards"""
@@ -255,6 +400,33 @@ class TestAC4_ExcludeSensitiveData:
         assert "sk-" not in sanitized
         assert "[REDACTED]" in sanitized
 
+    def test_validator_reports_every_overlapping_pattern(self):
+        """Test that one key matching several patterns is reported under each."""
+        validator = SensitiveDataValidator()
+        key = "sk-" + "a1" * 20
+
+        is_valid, violations = validator.validate_prompt_text(f"Use {key} and AKIA1234567890ABCDEF")
+        assert not is_valid
+        assert violations == [
+            "Sensitive data in prompt: openai_key",
+            "Sensitive data in prompt: deepseek_pattern",
+            "Sensitive data in prompt: aws_pattern",
+        ]
+        assert validator.validate_prompt_text("Add a login page") == (True, [])
+
+        sanitized = validator.sanitize_for_logging(f"key {key}, password: hunter2 ok")
+        assert sanitized == "key [REDACTED], [REDACTED] ok"
+
+    def test_sanitize_redacts_secret_inside_another_match(self):
+        """Test that a secret overlapping another pattern's match is still redacted."""
+        validator = SensitiveDataValidator()
+
+        sanitized = validator.sanitize_for_logging(
+            "ghp_api_keyapi_keysecretbbbbbbbbbbbbpassword: AAAAAAAA"
+        )
+
+        assert "AAAAAAAA" not in sanitized
+
 
 class TestAC5_CacheProjectContext:
     """AC5: Cache Project Context for Consistency"""
@@ -300,6 +472,54 @@ class TestAC5_CacheProjectContext:
         assert context.collection_metadata.collected_at is not None
         assert "Z" in context.collection_metadata.collected_at  # ISO format
 
+    def test_collected_context_has_utc_timestamp(self, tmp_path):
+        """Test that collection metadata carries an ISO 8601 UTC timestamp."""
+        from datetime import datetime
+
+        collector = ProjectContextCollector(str(tmp_path))
+        collected_at = collector.collect_context({}).collection_metadata.collected_at
+
+        assert collected_at.endswith("Z")
+        datetime.strptime(collected_at, "%Y-%m-%dT%H:%M:%SZ")
+
+    def test_fallback_fingerprint_is_cached(self, tmp_path, monkeypatch):
+        """Test that the fallback fingerprint walk runs once per project state."""
+        (tmp_path / "app.py").write_text("x = 1\n")
+        collector = ProjectContextCollector(str(tmp_path))
+
+        first = collector.collect_context({}).project_fingerprint
+
+        def fail(limit):
+            raise AssertionError("fingerprint should come from cache")
+
+        monkeypatch.setattr(collector, "_scan_python_files", fail)
+        assert collector.collect_context({}).project_fingerprint == first
+
+    def test_fallback_fingerprint_invalidated_by_marker_files(self, tmp_path):
+        """Test that touching a marker file recomputes the fingerprint."""
+        import os
+
+        (tmp_path / "pyproject.toml").write_text("[project]\n")
+        collector = ProjectContextCollector(str(tmp_path))
+        collector.collect_context({})
+
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "mod.py").write_text("y = 2\n")
+        os.utime(tmp_path / "pyproject.toml", ns=(0, 2**62))
+
+        before = collector._fingerprint_cache
+        collector.collect_context({})
+        assert collector._fingerprint_cache != before
+
+    def test_fallback_fingerprint_walk_is_bounded(self, tmp_path):
+        """Test that the fallback fingerprint samples a bounded number of files."""
+        for i in range(5):
+            (tmp_path / f"m{i}.py").write_text("")
+        collector = ProjectContextCollector(str(tmp_path))
+
+        assert len(collector._scan_python_files(3)) == 3
+        assert len(collector._scan_python_files(100)) == 5
+
 
 class TestAC6_FormatContextForDifferentModes:
     """AC6: Format Context for Different Use Cases"""
@@ -483,6 +703,76 @@ class TestAC8_ContextTransparency:
         assert 0.92 in metadata.standards_confidence.values()
         assert 0.85 in metadata.standards_confidence.values()
 
+    def test_metadata_lists_collected_and_skipped_fields(self, tmp_path):
+        """Test that every tracked field is reported as collected or skipped."""
+        collector = ProjectContextCollector(str(tmp_path))
+        context = collector.collect_context(
+            {"git_history": {"total_commits": 3}, "indicator_files": {"dependencies": {"a": "1"}}}
+        )
+
+        metadata = context.collection_metadata
+        assert metadata.fields_collected == ["git_history", "dependencies"]
+        assert metadata.fields_skipped == ["language", "framework", "detected_standards"]
+
+    def test_metadata_warns_about_low_confidence_standards(self, tmp_path):
+        """Test that low-confidence standards produce warnings alongside the map."""
+        collector = ProjectContextCollector(str(tmp_path))
+        context = collector.collect_context(
+            {
+                "confidence_report": {
+                    "naming_convention": {"detected_value": "snake_case", "confidence": 0.95},
+                    "test_framework": {"detected_value": "pytest", "confidence": 0.40},
+                }
+            },
+            collection_mode="partial",
+        )
+
+        metadata = context.collection_metadata
+        assert metadata.standards_confidence == {
+            "naming_convention": 0.95,
+            "test_framework": 0.40,
+        }
+        assert metadata.warnings[0].startswith("Low confidence in test_framework: 40%")
+        assert "partial" in metadata.warnings[-1]
+        assert len(metadata.warnings) == 2
+
+    def test_minimal_mode_skips_expensive_extraction(self, tmp_path, monkeypatch):
+        """Test that minimal mode skips git, dependencies and the file walk."""
+        analysis_result = {
+            "git_history": {"total_commits": 3},
+            "indicator_files": {"dependencies": {"requests": "2.31"}},
+            "confidence_report": {
+                "naming_convention": {"detected_value": "snake_case", "confidence": 0.9}
+            },
+        }
+        collector = ProjectContextCollector(str(tmp_path))
+
+        def fail(limit):
+            raise AssertionError("minimal mode should not walk the project")
+
+        monkeypatch.setattr(collector, "_scan_python_files", fail)
+        context = collector.collect_context(analysis_result, collection_mode="minimal")
+
+        assert context.git_context is None
+        assert context.dependencies == []
+        assert "naming_convention" in context.detected_standards
+        assert context.project_fingerprint
+        assert "git_history" in context.collection_metadata.fields_skipped
+
+    def test_partial_mode_skips_dependencies(self, tmp_path):
+        """Test that partial mode keeps git history but skips dependencies."""
+        collector = ProjectContextCollector(str(tmp_path))
+        context = collector.collect_context(
+            {
+                "git_history": {"total_commits": 3},
+                "indicator_files": {"dependencies": {"requests": "2.31"}},
+            },
+            collection_mode="partial",
+        )
+
+        assert context.git_context.total_commits == 3
+        assert context.dependencies == []
+
     def test_warnings_about_skipped_context(self):
         """Test that warnings are shown about skipped context."""
         collector = ProjectContextCollector()
@@ -496,5 +786,185 @@ class TestAC8_ContextTransparency:
         assert len(warnings) > 0
 
 
+class TestFileSymbols:
+    """Symbol index access through the context collector."""
+
+    SOURCE = (
+        "class Service:\n"
+        "    def run(self, x: int) -> int:\n"
+        "        return x\n"
+        "\n"
+        "def helper():\n"
+        "    pass\n"
+    )
+
+    @pytest.fixture
+    def source_file(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)  # keep the indexer's disk cache in tmp
+        path = tmp_path / "service.py"
+        path.write_text(self.SOURCE)
+        return path
+
+    def test_symbol_indexer_created_lazily(self, tmp_path, monkeypatch):
+        """Test that context collection alone does not build a symbol indexer."""
+        monkeypatch.chdir(tmp_path)
+        collector = ProjectContextCollector(str(tmp_path))
+        collector.collect_context({})
+
+        assert collector._symbol_indexer is None
+        assert not (tmp_path / ".cache").exists()
+        assert collector.symbol_indexer is collector.symbol_indexer
+
+    def test_get_file_symbols_returns_dicts(self, source_file):
+        """Test that symbols are returned as plain dictionaries."""
+        collector = ProjectContextCollector(str(source_file.parent))
+        symbols = collector.get_file_symbols(str(source_file))
+
+        by_name = {s["name"]: s for s in symbols}
+        assert by_name["Service"]["type"] == "class"
+        assert by_name["run"]["parent_class"] == "Service"
+        assert by_name["helper"]["decorators"] == []
+
+    def test_get_file_symbols_with_field_subset(self, source_file):
+        """Test that callers can request only some symbol fields."""
+        collector = ProjectContextCollector(str(source_file.parent))
+        full = collector.get_file_symbols(str(source_file))
+
+        names = collector.get_file_symbols(str(source_file), fields=["name"])
+        assert names == [{"name": s["name"]} for s in full]
+
+        pairs = collector.get_file_symbols(str(source_file), fields=("name", "signature"))
+        assert pairs == [{"name": s["name"], "signature": s["signature"]} for s in full]
+
+    def test_get_file_symbols_rejects_unknown_fields(self, source_file):
+        """Test that unknown field names are reported, not silently dropped."""
+        collector = ProjectContextCollector(str(source_file.parent))
+        with pytest.raises(ValueError, match="Unknown symbol fields: body"):
+            collector.get_file_symbols(str(source_file), fields=["name", "body"])
+
+    def test_iter_file_symbols_yields_lazily(self, source_file):
+        """Test that the iterator variant yields the same dicts one by one."""
+        collector = ProjectContextCollector(str(source_file.parent))
+        symbols = collector.iter_file_symbols(str(source_file), fields=["name"])
+
+        assert not isinstance(symbols, list)
+        assert next(symbols) == {"name": "Service"}
+        assert [{"name": "Service"}, *symbols] == collector.get_file_symbols(
+            str(source_file), fields=["name"]
+        )
+
+    def test_unchanged_file_is_not_reindexed(self, source_file, monkeypatch):
+        """Test that symbols of an unchanged file come from the cache."""
+        collector = ProjectContextCollector(str(source_file.parent))
+        first = collector.get_file_symbols(str(source_file))
+
+        def fail(path):
+            raise AssertionError("unchanged file should not be re-indexed")
+
+        monkeypatch.setattr(collector.symbol_indexer, "get_file_symbols", fail)
+        assert collector.get_file_symbols(str(source_file)) == first
+
+    def test_modified_file_is_reindexed(self, source_file):
+        """Test that editing a file invalidates its cached symbols."""
+        collector = ProjectContextCollector(str(source_file.parent))
+        collector.get_file_symbols(str(source_file))
+
+        source_file.write_text(self.SOURCE + "\ndef another_helper():\n    pass\n")
+        names = {s["name"] for s in collector.get_file_symbols(str(source_file))}
+        assert "another_helper" in names
+
+    def test_symbol_cache_is_bounded_lru(self, tmp_path, monkeypatch):
+        """Test that edits replace a file's entry and old files are evicted."""
+        from src.prompt_enhancement.enhancement import context_collector
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(context_collector, "SYMBOL_CACHE_SIZE", 2)
+        collector = ProjectContextCollector(str(tmp_path))
+        paths = [tmp_path / f"mod{i}.py" for i in range(3)]
+        for path in paths:
+            path.write_text("def func():\n    pass\n")
+
+        collector.get_file_symbols(str(paths[0]))
+        paths[0].write_text("def func():\n    return 1\n")
+        collector.get_file_symbols(str(paths[0]))
+        assert len(collector._symbol_cache) == 1
+
+        collector.get_file_symbols(str(paths[1]))
+        collector.get_file_symbols(str(paths[0]))  # Now most recently used
+        collector.get_file_symbols(str(paths[2]))
+        assert list(collector._symbol_cache) == [str(paths[0]), str(paths[2])]
+
+    def test_get_many_file_symbols_matches_single_file_api(self, tmp_path, monkeypatch):
+        """Test that batch indexing returns the same symbols per file."""
+        monkeypatch.chdir(tmp_path)
+        paths = []
+        for i in range(SYMBOL_INDEX_CHUNKSIZE):
+            path = tmp_path / f"mod{i}.py"
+            path.write_text(f"def func_{i}():\n    pass\n")
+            paths.append(str(path))
+
+        collector = ProjectContextCollector(str(tmp_path))
+        try:
+            results = collector.get_many_file_symbols(paths + [str(tmp_path / "gone.py")])
+        finally:
+            collector.close()
+
+        for i, path in enumerate(paths):
+            assert [s["name"] for s in results[path]] == [f"func_{i}"]
+            assert results[path] == collector.get_file_symbols(path)
+        assert results[str(tmp_path / "gone.py")] == []
+
+    def test_get_many_file_symbols_does_not_cache_failures(self, tmp_path, monkeypatch):
+        """Test that a file the pool fails to index is retried on the next call."""
+        monkeypatch.chdir(tmp_path)
+        paths = []
+        for i in range(SYMBOL_INDEX_CHUNKSIZE):
+            path = tmp_path / f"mod{i}.py"
+            path.write_text(f"def func_{i}():\n    pass\n")
+            paths.append(str(path))
+
+        original = SymbolIndexer.get_file_symbols
+
+        def flaky(self, file_path):
+            if file_path == paths[0]:
+                raise PermissionError("denied")
+            return original(self, file_path)
+
+        monkeypatch.setattr(context_collector, "ProcessPoolExecutor", ThreadPoolExecutor)
+        monkeypatch.setattr(SymbolIndexer, "get_file_symbols", flaky)
+        collector = ProjectContextCollector(str(tmp_path))
+        try:
+            results = collector.get_many_file_symbols(paths)
+        finally:
+            collector.close()
+
+        assert results[paths[0]] == []
+        assert paths[0] not in collector._symbol_cache
+        assert [s["name"] for s in results[paths[1]]] == ["func_1"]
+
+        monkeypatch.setattr(SymbolIndexer, "get_file_symbols", original)
+        assert [s["name"] for s in collector.get_file_symbols(paths[0])] == ["func_0"]
+
+    def test_get_many_file_symbols_serves_cached_files(self, source_file, monkeypatch):
+        """Test that cached files are not sent to the indexing pool."""
+        collector = ProjectContextCollector(str(source_file.parent))
+        expected = collector.get_file_symbols(str(source_file))
+
+        def fail(path):
+            raise AssertionError("cached file should not be re-indexed")
+
+        monkeypatch.setattr(collector.symbol_indexer, "get_file_symbols", fail)
+        results = collector.get_many_file_symbols([str(source_file)])
+
+        assert results == {str(source_file): expected}
+        assert collector._symbol_pool is None
+
+    def test_missing_file_returns_empty_list(self, tmp_path, monkeypatch):
+        """Test that a missing file degrades to an empty symbol list."""
+        monkeypatch.chdir(tmp_path)
+        collector = ProjectContextCollector(str(tmp_path))
+        assert collector.get_file_symbols(str(tmp_path / "missing.py")) == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,9 +4,11 @@ Comprehensive tests for Story 3.2: Call LLM to Generate Project-Aware Enhancemen
 Tests all 8 acceptance criteria (AC1-AC8) with mock LLM APIs.
 """
 
+import asyncio
 import pytest
 import os
-from unittest.mock import Mock, patch, MagicMock
+import time
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 from src.prompt_enhancement.enhancement import (
     ProjectContext,
@@ -14,20 +16,61 @@ from src.prompt_enhancement.enhancement import (
     PromptBuilder,
 )
 from src.prompt_enhancement.enhancement.llm_provider import (
+    ContextLengthError,
     OpenAIProvider,
     DeepSeekProvider,
+    LLMProvider,
     LLMResponse,
+    PooledProvider,
+    RetryConfig,
+    RetryProvider,
+    SemanticCache,
+    call_batch,
+    create_pool,
     create_provider,
 )
 from src.prompt_enhancement.enhancement.response_validator import ResponseValidator
 from src.prompt_enhancement.enhancement.generator import EnhancementGenerator
+from src.prompt_enhancement.enhancement import llm_provider, result_cache
+from src.prompt_enhancement.enhancement.result_cache import RedisBackend, SqliteBackend
 from src.prompt_enhancement.enhancement.exceptions import (
     AuthenticationError,
+    EnhancementError,
+    ServerError,
     TimeoutError,
     ValidationError,
 )
 
 
+def _chunk(text=None, usage=None):
+    """One streamed completion chunk."""
+    choices = [Mock(delta=Mock(content=text))] if text is not None else []
+    return Mock(choices=choices, usage=usage)
+
+
+def _streamed(text="Enhanced", prompt_tokens=1, completion_tokens=1):
+    """Fake chat.completions.create returning a fresh stream on every call."""
+    usage = Mock(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+    return lambda **kwargs: iter([_chunk(text), _chunk(usage=usage)])
+
+
+def _astreamed(text="Enhanced"):
+    """Async counterpart of _streamed."""
+    async def stream():
+        for chunk in [_chunk(text), _chunk(usage=Mock(prompt_tokens=1, completion_tokens=1))]:
+            yield chunk
+
+    return lambda **kwargs: stream()
+
+
+@pytest.fixture(autouse=True)
+def _clear_provider_cache():
+    """Keep provider-level cached responses from leaking between tests."""
+    LLMProvider.clear_cache()
+    yield
+    LLMProvider.clear_cache()
+
+
 class TestAC1_SingleAPICallWithContext:
     """AC1: Single LLM API Call with Project Context"""
 
@@ -36,7 +79,7 @@ class TestAC1_SingleAPICallWithContext:
         generator = EnhancementGenerator()
         context = ProjectContext(project_name="test", language="python")
 
-        with patch.object(generator, '_select_provider') as mock_select:
+        with patch.object(generator, '_select_providers') as mock_select:
             mock_provider = Mock()
             mock_provider.call.return_value = LLMResponse(
                 content="Enhanced prompt with implementation steps",
@@ -46,7 +89,7 @@ class TestAC1_SingleAPICallWithContext:
                 provider="openai",
                 latency_seconds=1.5,
             )
-            mock_select.return_value = mock_provider
+            mock_select.return_value = [mock_provider]
 
             try:
                 result = generator.generate_enhancement("test prompt", context)
@@ -55,6 +98,166 @@ class TestAC1_SingleAPICallWithContext:
             except:
                 pass  # May fail on other issues
 
+    def _mock_provider(self):
+        provider = Mock()
+        provider.call.return_value = LLMResponse(
+            content="Enhanced prompt with implementation steps",
+            tokens_input=100,
+            tokens_output=200,
+            model="gpt-4-turbo",
+            provider="openai",
+            latency_seconds=1.5,
+        )
+        provider.estimate_cost.return_value = 0.01
+        return provider
+
+    def test_identical_prompt_served_from_cache(self):
+        """Test that repeating an identical request skips the LLM call."""
+        generator = EnhancementGenerator()
+        context = ProjectContext(project_name="test", language="python")
+        provider = self._mock_provider()
+
+        with patch.object(generator, "_select_providers", return_value=[provider]), \
+                patch.object(generator.response_validator, "validate_response", return_value=(True, [])):
+            first = generator.generate_enhancement("test prompt", context)
+            second = generator.generate_enhancement("test prompt", context)
+            generator.generate_enhancement("other prompt", context)
+
+        assert provider.call.call_count == 2
+        assert second.enhanced_prompt == first.enhanced_prompt
+        assert first.estimated_cost == 0.01
+        assert second.estimated_cost == 0.0
+
+    def test_cache_keys_prompt_verbatim(self):
+        """Test that prompts differing in case or indentation are not conflated."""
+        generator = EnhancementGenerator()
+        context = ProjectContext(project_name="test", language="python")
+        provider = self._mock_provider()
+
+        with patch.object(generator, "_select_providers", return_value=[provider]), \
+                patch.object(generator.response_validator, "validate_response", return_value=(True, [])):
+            generator.generate_enhancement("rename Foo to foo", context)
+            generator.generate_enhancement("rename foo to FOO", context)
+            generator.generate_enhancement("fix:\nif a:\n    b()\nc()", context)
+            generator.generate_enhancement("fix:\nif a:\n    b()\n    c()", context)
+
+        assert provider.call.call_count == 4
+
+    def test_semantic_cache_answers_similar_prompts_per_context(self):
+        """Test that the opt-in semantic cache reuses results within one context."""
+        vectors = {"add login": [1.0, 0.0], "add a login": [0.99, 0.1], "drop tables": [0.0, 1.0]}
+        generator = EnhancementGenerator(
+            semantic_cache=SemanticCache(embed=lambda text: vectors[text])
+        )
+        context = ProjectContext(project_name="test", language="python")
+        provider = self._mock_provider()
+
+        with patch.object(generator, "_select_providers", return_value=[provider]), \
+                patch.object(generator.response_validator, "validate_response", return_value=(True, [])):
+            generator.generate_enhancement("add login", context)
+            similar = generator.generate_enhancement("add a login", context)
+            generator.generate_enhancement("drop tables", context)
+            generator.generate_enhancement(
+                "add a login", ProjectContext(project_name="other", language="python")
+            )
+
+        assert provider.call.call_count == 3
+        assert similar.original_prompt == "add a login"
+        assert similar.estimated_cost == 0.0
+
+    def test_persistent_cache_shared_between_generators(self, tmp_path):
+        """Test that a result persisted by one generator is reused by another."""
+        context = ProjectContext(project_name="test", language="python")
+        provider = self._mock_provider()
+        results = []
+
+        for _ in range(2):
+            generator = EnhancementGenerator(
+                cache=SqliteBackend(str(tmp_path / "cache.sqlite3"))
+            )
+            with patch.object(generator, "_select_providers", return_value=[provider]), \
+                    patch.object(generator.response_validator, "validate_response", return_value=(True, [])):
+                results.append(generator.generate_enhancement("test prompt", context))
+
+        assert provider.call.call_count == 1
+        assert results[1].enhanced_prompt == results[0].enhanced_prompt
+        assert results[1].estimated_cost == 0.0
+
+    def test_broken_persistent_cache_is_a_miss(self):
+        """Test that backend failures never break enhancement."""
+        backend = Mock()
+        backend.get.side_effect = OSError("disk gone")
+        backend.set.side_effect = OSError("disk gone")
+        generator = EnhancementGenerator(cache=backend)
+        provider = self._mock_provider()
+
+        with patch.object(generator, "_select_providers", return_value=[provider]), \
+                patch.object(generator.response_validator, "validate_response", return_value=(True, [])):
+            result = generator.generate_enhancement(
+                "test prompt", ProjectContext(project_name="test", language="python")
+            )
+
+        assert result.was_degraded is False
+        assert provider.call.call_count == 1
+
+    def test_generation_time_uses_monotonic_clock(self):
+        """Test that elapsed time is measured with the monotonic clock."""
+        generator = EnhancementGenerator(cache_enabled=False)
+        provider = self._mock_provider()
+
+        with patch.object(generator, "_select_providers", return_value=[provider]), \
+                patch.object(generator.response_validator, "validate_response", return_value=(True, [])), \
+                patch("src.prompt_enhancement.enhancement.generator.time.monotonic",
+                      side_effect=[10.0, 12.5]):
+            result = generator.generate_enhancement(
+                "test prompt", ProjectContext(project_name="test", language="python")
+            )
+
+        assert result.generation_time_seconds == 2.5
+
+    def test_cache_can_be_disabled(self):
+        """Test that cache_enabled=False always calls the LLM."""
+        generator = EnhancementGenerator(cache_enabled=False)
+        context = ProjectContext(project_name="test", language="python")
+        provider = self._mock_provider()
+
+        with patch.object(generator, "_select_providers", return_value=[provider]), \
+                patch.object(generator.response_validator, "validate_response", return_value=(True, [])):
+            generator.generate_enhancement("test prompt", context)
+            generator.generate_enhancement("test prompt", context)
+
+        assert provider.call.call_count == 2
+
+    def test_async_enhancements_run_concurrently(self):
+        """Test that agenerate_enhancement calls overlap under asyncio.gather."""
+        generator = EnhancementGenerator()
+        context = ProjectContext(project_name="test", language="python")
+        provider = self._mock_provider()
+        in_flight = []
+        peak = []
+
+        async def acall(**kwargs):
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.pop()
+            return provider.call.return_value
+
+        provider.acall = acall
+
+        async def run_batch():
+            return await asyncio.gather(
+                *(generator.agenerate_enhancement(f"prompt {i}", context) for i in range(3))
+            )
+
+        with patch.object(generator, "_select_providers", return_value=[provider]), \
+                patch.object(generator.response_validator, "validate_response", return_value=(True, [])):
+            results = asyncio.run(run_batch())
+
+        assert [r.original_prompt for r in results] == ["prompt 0", "prompt 1", "prompt 2"]
+        assert max(peak) == 3
+        provider.call.assert_not_called()
+
     def test_openai_provider_sends_complete_context(self):
         """Test that OpenAI provider receives full project context."""
         provider = OpenAIProvider(api_key="sk-test")
@@ -67,6 +270,273 @@ class TestAC1_SingleAPICallWithContext:
         assert len(system_prompt) > 0
         assert len(user_message) > 0
 
+    def test_prompt_cache_key_sent_per_project(self):
+        """Test that the prompt cache key depends on context, not the user prompt."""
+        generator = EnhancementGenerator(cache_enabled=False)
+        context = ProjectContext(project_name="test", language="python")
+        provider = self._mock_provider()
+
+        with patch.object(generator, "_select_providers", return_value=[provider]), \
+                patch.object(generator.response_validator, "validate_response", return_value=(True, [])):
+            generator.generate_enhancement("first prompt", context)
+            generator.generate_enhancement("second prompt", context)
+            generator.generate_enhancement(
+                "first prompt", ProjectContext(project_name="other", language="python")
+            )
+
+        keys = [c.kwargs["prompt_cache_key"] for c in provider.call.call_args_list]
+        assert keys[0] == keys[1] != keys[2]
+
+        with patch("openai.OpenAI") as mock_client:
+            create = mock_client.return_value.chat.completions.create
+            create.side_effect = _streamed()
+            OpenAIProvider(api_key="sk-test").call("system", "user", prompt_cache_key=keys[0])
+
+        assert create.call_args.kwargs["extra_body"] == {"prompt_cache_key": keys[0]}
+
+    def test_streamed_call_forwards_chunks_and_usage(self):
+        """Test that a stream callback gets each fragment and usage is read at the end."""
+        usage = Mock(prompt_tokens=12, completion_tokens=3)
+        received = []
+
+        with patch("openai.OpenAI") as mock_client:
+            create = mock_client.return_value.chat.completions.create
+            create.return_value = iter(
+                [_chunk("Add "), _chunk(""), _chunk("tests"), _chunk(usage=usage)]
+            )
+            response = OpenAIProvider(api_key="sk-test").call(
+                "system", "user", stream_callback=received.append
+            )
+
+        assert received == ["Add ", "tests"]
+        assert response.content == "Add tests"
+        assert (response.tokens_input, response.tokens_output) == (12, 3)
+        assert create.call_args.kwargs["stream"] is True
+        assert create.call_args.kwargs["stream_options"] == {"include_usage": True}
+
+    def test_generator_passes_stream_callback_and_replays_cache(self):
+        """Test that the callback reaches the provider and cache hits replay once."""
+        generator = EnhancementGenerator()
+        context = ProjectContext(project_name="test", language="python")
+        provider = self._mock_provider()
+        received = []
+
+        with patch.object(generator, "_select_providers", return_value=[provider]), \
+                patch.object(generator.response_validator, "validate_response", return_value=(True, [])):
+            generator.generate_enhancement("test prompt", context, stream_callback=received.append)
+            second = generator.generate_enhancement(
+                "test prompt", context, stream_callback=received.append
+            )
+
+        assert received == [second.enhanced_prompt]
+        provider.call.call_args.kwargs["stream_callback"]("chunk")
+        assert received == [second.enhanced_prompt, "chunk"]
+
+    def test_semantic_cache_answers_similar_requests(self):
+        """Test that near-duplicate requests are served without an API call."""
+        vectors = {"add login": [1.0, 0.0], "add a login": [0.99, 0.1], "drop tables": [0.0, 1.0]}
+        cache = SemanticCache(embed=lambda text: vectors[text.split("\n\n")[1]])
+        provider = create_provider("openai", "sk-test", cache=cache)
+        received = []
+
+        with patch("openai.OpenAI") as mock_client:
+            create = mock_client.return_value.chat.completions.create
+            create.side_effect = _streamed("Enhanced", 10, 5)
+
+            first = provider.call("system", "add login", temperature=0)
+            second = provider.call(
+                "system", "add a login", stream_callback=received.append, temperature=0
+            )
+            provider.call("system", "drop tables", temperature=0)
+            # Sampled requests never take a neighbour's answer
+            provider.call("system", "add a login")
+
+        assert create.call_count == 3
+        assert second.content == first.content == "Enhanced"
+        assert second.latency_seconds < first.latency_seconds + 1
+        assert received == ["Enhanced"]
+
+    def test_identical_requests_reuse_response(self):
+        """Test that byte-identical requests are answered from the exact cache."""
+        with patch("openai.OpenAI") as mock_client:
+            create = mock_client.return_value.chat.completions.create
+            create.side_effect = _streamed("Enhanced", 10, 5)
+
+            first = OpenAIProvider(api_key="sk-test").call("system", "user")
+            second = OpenAIProvider(api_key="sk-other").call("system", "user")
+            OpenAIProvider(api_key="sk-test").call("system", "user", max_tokens=500)
+            OpenAIProvider(api_key="sk-test").call("system", "user", temperature=0)
+            DeepSeekProvider(api_key="sk-test").call("system", "user")
+
+        assert create.call_count == 4
+        assert create.call_args_list[2].kwargs["temperature"] == 0
+        assert all(c.kwargs["stream"] for c in create.call_args_list)
+        assert second.content == first.content == "Enhanced"
+        assert (second.tokens_input, second.tokens_output) == (10, 5)
+
+    def test_provider_reuses_one_client(self):
+        """Test that one client (and its connection pool) serves every call."""
+        with patch("openai.OpenAI") as mock_client:
+            create = mock_client.return_value.chat.completions.create
+            create.side_effect = _streamed()
+
+            with DeepSeekProvider(api_key="sk-test") as provider:
+                provider.call("system", "first")
+                provider.call("system", "second")
+
+        mock_client.assert_called_once_with(
+            api_key="sk-test", base_url="https://api.deepseek.com"
+        )
+        assert create.call_count == 2
+        mock_client.return_value.close.assert_called_once()
+
+    def test_async_client_reused_within_event_loop(self):
+        """Test that acall keeps one async client per event loop."""
+        provider = OpenAIProvider(api_key="sk-test")
+
+        async def two_calls():
+            await provider.acall("system", "first")
+            await provider.acall("system", "second")
+
+        with patch("openai.AsyncOpenAI") as mock_client:
+            create = AsyncMock(side_effect=_astreamed())
+            mock_client.return_value.chat.completions.create = create
+
+            asyncio.run(two_calls())
+            assert mock_client.call_count == 1
+            asyncio.run(provider.acall("system", "third"))
+
+        assert mock_client.call_count == 2
+        assert create.await_count == 3
+
+    def test_call_batch_bounds_concurrency(self):
+        """Test that call_batch limits requests in flight and keeps order."""
+        in_flight, peak = [0], []
+
+        async def acall(system_prompt, user_message, **kwargs):
+            in_flight[0] += 1
+            peak.append(in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            if user_message == "bad":
+                raise TimeoutError("slow")
+            return LLMResponse(user_message, 1, 1, "m", "openai", 0.01)
+
+        provider = Mock(acall=acall)
+        items = [("system", f"prompt {i}") for i in range(6)] + [("system", "bad")]
+        results = asyncio.run(call_batch(provider, items, max_concurrency=3))
+
+        assert [r.content for r in results[:6]] == [f"prompt {i}" for i in range(6)]
+        assert isinstance(results[6], TimeoutError)
+        assert max(peak) == 3
+
+    def test_max_tokens_fitted_to_context_window(self):
+        """Test max_tokens is clamped, and oversized prompts fail before any call."""
+        provider = OpenAIProvider(api_key="sk-test")
+
+        with patch.dict("sys.modules", {"tiktoken": None}):
+            llm_provider._get_encoding.cache_clear()
+            try:
+                assert provider.count_tokens("x" * 10) == 3
+                with patch.object(OpenAIProvider, "CONTEXT_WINDOW", 200), \
+                        patch("openai.OpenAI") as mock_client:
+                    create = mock_client.return_value.chat.completions.create
+                    create.side_effect = _streamed()
+
+                    provider.call("s" * 40, "u" * 40)
+                    # 200 window - (10 + 10 + 11 overhead) - 64 margin
+                    assert create.call_args.kwargs["max_tokens"] == 105
+                    assert 0 < provider.dry_run_cost("s" * 40, "u" * 40) < 0.01
+
+                    with pytest.raises(ContextLengthError):
+                        provider.call("s" * 40, "u" * 600)
+                    assert create.call_count == 1
+            finally:
+                llm_provider._get_encoding.cache_clear()
+
+    def test_batch_api_round_trip(self):
+        """Test batch submission, polling, and mapping results back in order."""
+        import json
+
+        output = "\n".join([
+            json.dumps({"custom_id": "1", "response": {"status_code": 200, "body": {
+                "choices": [{"message": {"content": "Second"}}],
+                "usage": {"prompt_tokens": 7, "completion_tokens": 3},
+            }}}),
+            json.dumps({"custom_id": "0", "response": {"status_code": 500, "body": {}}}),
+        ])
+
+        with patch("openai.OpenAI") as mock_client, \
+                patch.object(llm_provider.time, "sleep") as sleep:
+            client = mock_client.return_value
+            client.batches.create.return_value = Mock(id="b1", status="in_progress")
+            client.batches.retrieve.return_value = Mock(
+                id="b1", status="completed", output_file_id="out"
+            )
+            client.files.content.return_value.text = output
+
+            results = OpenAIProvider(api_key="sk-test").call_via_batch_api(
+                [("system", "first"), ("system", "second")], poll_seconds=5
+            )
+
+        filename, payload = client.files.create.call_args.kwargs["file"]
+        requests = [json.loads(line) for line in payload.decode().splitlines()]
+        assert [r["custom_id"] for r in requests] == ["0", "1"]
+        assert requests[1]["body"]["messages"][1]["content"] == "second"
+        assert client.files.create.call_args.kwargs["purpose"] == "batch"
+        sleep.assert_called_once_with(5)
+
+        assert results[0] is None
+        assert results[1].content == "Second"
+        assert (results[1].tokens_input, results[1].tokens_output) == (7, 3)
+
+    def test_exact_cache_evicts_least_recently_used(self):
+        """Test that the exact cache stays within EXACT_CACHE_SIZE."""
+        provider = OpenAIProvider(api_key="sk-test")
+        response = LLMResponse("text", 1, 1, "gpt-4-turbo", "openai", 0.1)
+
+        with patch.object(LLMProvider, "EXACT_CACHE_SIZE", 2):
+            for message in ["a", "b", "a", "c"]:
+                provider._remember("system", message, 2000, 0.7, None, response)
+
+            assert provider._check_cache("system", "a", 2000, 0.7)[1] is not None
+            assert provider._check_cache("system", "b", 2000, 0.7)[1] is None
+
+    def test_exact_cache_safe_under_concurrent_access(self):
+        """Test that threads sharing the exact cache never break its LRU order."""
+        from collections import OrderedDict
+        from concurrent.futures import ThreadPoolExecutor
+
+        class YieldingCache(OrderedDict):
+            """Gives other threads a chance to run between get() and move_to_end()."""
+
+            def get(self, key, default=None):
+                value = super().get(key, default)
+                time.sleep(0.0001)
+                return value
+
+        provider = OpenAIProvider(api_key="sk-test")
+        response = LLMResponse("text", 1, 1, "gpt-4-turbo", "openai", 0.1)
+
+        def churn(worker):
+            # Few keys over a small cache, so hits and evictions overlap
+            for i in range(200):
+                provider._remember("system", str((worker + i) % 6), 2000, 0.7, None, response)
+                provider._check_cache("system", str((worker + i + 3) % 6), 2000, 0.7)
+
+        with patch.object(LLMProvider, "_exact_cache", YieldingCache()), \
+                patch.object(LLMProvider, "EXACT_CACHE_SIZE", 4):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(churn, range(8)))
+
+            assert len(LLMProvider._exact_cache) == 4
+
+    def test_semantic_cache_requires_embedder(self):
+        """Test a clear error when no embed function or model is available."""
+        with patch.dict("sys.modules", {"sentence_transformers": None}):
+            with pytest.raises(ImportError):
+                SemanticCache()
+
     def test_deepseek_uses_openai_compatible_api(self):
         """Test that DeepSeek uses OpenAI-compatible endpoint with V3.2 reasoner."""
         provider = DeepSeekProvider(api_key="sk-test")
@@ -112,6 +582,28 @@ class TestAC2_ResponseValidation:
         is_valid, violations = validator.validate_response(strong_response, "test")
         assert is_valid
 
+    def test_actionable_guidance_needs_three_keywords(self):
+        """Test the three-keyword threshold and the one-pass section summary."""
+        validator = ResponseValidator()
+
+        assert not validator._contains_actionable_guidance("Write a test.")
+        assert validator._contains_actionable_guidance("Write a test, then verify.")
+
+        sections = validator.extract_key_sections("Implement an ADVANCED retry ARCHITECTURE")
+        assert sections["has_implementation_steps"]
+        assert not sections["has_testing_guidance"]
+        assert sections["estimated_complexity"] == "complex"
+
+    def test_intent_needs_thirty_percent_of_prompt_words(self):
+        """Test the 30% threshold and that prompt words match as substrings."""
+        validator = ResponseValidator()
+        original = " ".join(f"word{i}" for i in range(10))
+
+        assert validator._preserves_original_intent("word0 word1 word2", original)
+        assert not validator._preserves_original_intent("word0 word1", original)
+        assert validator._preserves_original_intent("Updated the configs", "update config")
+        assert not validator._preserves_original_intent("Unrelated text", "update config")
+
     def test_validator_checks_response_length(self):
         """Test that validator enforces length constraints."""
         validator = ResponseValidator()
@@ -169,6 +661,35 @@ class TestAC3_TimeoutAndErrorHandling:
         assert error.category == "TIMEOUT_ERROR"
         assert "timeout" in error.recovery_suggestion.lower()
 
+    def test_generator_import_does_not_load_openai(self):
+        """Test that the SDK is only imported once an error must be classified."""
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        code = (
+            "import sys\n"
+            "import src.prompt_enhancement.enhancement.generator as g\n"
+            "assert 'openai' not in sys.modules\n"
+            "assert 'redis' not in sys.modules\n"
+            "g._get_openai_errors()\n"
+            "assert 'openai' in sys.modules\n"
+        )
+        repo_root = Path(__file__).resolve().parents[2]
+        subprocess.run([sys.executable, "-c", code], cwd=repo_root, check=True)
+
+    def test_error_categories_and_ad_hoc_errors(self):
+        """Test subclass categories and ad-hoc EnhancementError instances."""
+        error = AuthenticationError()
+        assert error.message == "API key invalid or missing"
+        assert str(error) == "API key invalid or missing"
+        assert error.category == "AUTH_ERROR"
+        assert isinstance(error, EnhancementError)
+
+        ad_hoc = EnhancementError("boom", category="CUSTOM")
+        assert ad_hoc.category == "CUSTOM"
+        assert ad_hoc.recovery_suggestion is None
+
 
 class TestAC4_RetryAndFallback:
     """AC4: Retry and Fallback Mechanism"""
@@ -177,6 +698,152 @@ class TestAC4_RetryAndFallback:
         """Test that system retries at most once."""
         assert EnhancementGenerator.MAX_RETRIES == 1
 
+    def test_server_error_fails_over_to_next_provider(self):
+        """Test that a failing primary hands over to the secondary immediately."""
+        generator = EnhancementGenerator()
+        primary = Mock()
+        primary.call.side_effect = Exception("503 Service Unavailable")
+        secondary = Mock()
+        secondary.call.return_value = LLMResponse(
+            content="Enhanced", tokens_input=1, tokens_output=1,
+            model="deepseek-reasoner", provider="deepseek", latency_seconds=0.1,
+        )
+
+        with patch("src.prompt_enhancement.enhancement.generator.time.sleep") as mock_sleep:
+            provider, response = generator._call_with_fallback(
+                [primary, secondary], "system", "user", timeout_seconds=30
+            )
+
+        assert provider is secondary
+        assert response.provider == "deepseek"
+        assert primary.call.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_last_provider_error_is_raised(self):
+        """Test that the last provider keeps its retry and its error propagates."""
+        generator = EnhancementGenerator()
+        primary = Mock()
+        primary.call.side_effect = Exception("500")
+        secondary = Mock()
+        secondary.call.side_effect = Exception("500")
+
+        with patch("src.prompt_enhancement.enhancement.generator.time.sleep"):
+            with pytest.raises(ServerError):
+                generator._call_with_fallback(
+                    [primary, secondary], "system", "user", timeout_seconds=30
+                )
+
+        assert primary.call.call_count == 1
+        assert secondary.call.call_count == 2
+
+    def test_partially_streamed_call_not_retried_or_failed_over(self):
+        """Test a failure after text reached the callback is raised at once."""
+        generator = EnhancementGenerator()
+
+        def fail_midway(**kwargs):
+            kwargs["stream_callback"]("partial ")
+            raise Exception("503 stream dropped")
+
+        primary = Mock()
+        primary.call.side_effect = fail_midway
+        secondary = Mock()
+        received = []
+
+        with patch("src.prompt_enhancement.enhancement.generator.time.sleep") as mock_sleep:
+            with pytest.raises(ServerError):
+                generator._call_with_fallback(
+                    [primary, secondary], "system", "user", timeout_seconds=30,
+                    stream_callback=received.append,
+                )
+
+        assert received == ["partial "]
+        assert primary.call.call_count == 1
+        secondary.call.assert_not_called()
+        mock_sleep.assert_not_called()
+
+    def test_async_partially_streamed_call_not_retried(self):
+        """Test the async retry loop also stops once text has streamed."""
+        generator = EnhancementGenerator()
+
+        async def fail_midway(**kwargs):
+            kwargs["stream_callback"]("partial ")
+            raise Exception("503 stream dropped")
+
+        provider = Mock()
+        provider.acall = Mock(side_effect=fail_midway)
+        received = []
+
+        with pytest.raises(ServerError):
+            asyncio.run(generator._acall_llm_with_retry(
+                provider, "system", "user", timeout_seconds=30,
+                stream_callback=received.append,
+            ))
+
+        assert received == ["partial "]
+        assert provider.acall.call_count == 1
+
+    def test_async_hung_provider_fails_over(self):
+        """Test that the async path enforces the hard timeout and fails over."""
+        generator = EnhancementGenerator()
+
+        async def hang(**kwargs):
+            await asyncio.sleep(10)
+
+        primary = Mock()
+        primary.acall = hang
+        secondary = Mock()
+        secondary.acall = AsyncMock(return_value=LLMResponse(
+            content="Enhanced", tokens_input=1, tokens_output=1,
+            model="deepseek-reasoner", provider="deepseek", latency_seconds=0.1,
+        ))
+
+        provider, response = asyncio.run(generator._acall_with_fallback(
+            [primary, secondary], "system", "user", timeout_seconds=0.01
+        ))
+
+        assert provider is secondary
+        assert response.provider == "deepseek"
+
+    def test_circuit_breaker_skips_failing_provider(self):
+        """Test that repeated failures open a provider's circuit until cooldown."""
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-a", "DEEPSEEK_API_KEY": "sk-b"}):
+            generator = EnhancementGenerator()
+        openai_provider, deepseek_provider = generator._select_providers()
+        clock = "src.prompt_enhancement.enhancement.generator.time.monotonic"
+
+        with patch(clock, return_value=100.0):
+            for _ in range(EnhancementGenerator.BREAKER_FAILURE_THRESHOLD):
+                generator._record_outcome(openai_provider, succeeded=False)
+            assert generator._select_providers() == [deepseek_provider]
+            assert generator.breaker_status()["OpenAI"]["open"] is True
+
+            # With every circuit open, all providers are still tried
+            for _ in range(EnhancementGenerator.BREAKER_FAILURE_THRESHOLD):
+                generator._record_outcome(deepseek_provider, succeeded=False)
+            assert generator._select_providers() == [openai_provider, deepseek_provider]
+
+        with patch(clock, return_value=100.0 + EnhancementGenerator.BREAKER_COOLDOWN_SECONDS):
+            assert generator._select_providers() == [openai_provider, deepseek_provider]
+            assert generator.breaker_status()["OpenAI"]["open"] is False
+
+        generator._record_outcome(openai_provider, succeeded=True)
+        assert "OpenAI" not in generator.breaker_status()
+
+    def test_fallback_records_breaker_outcomes(self):
+        """Test that fallback counts the failed provider and resets the healthy one."""
+        generator = EnhancementGenerator()
+        primary = Mock()
+        primary.get_provider_name.return_value = "Primary"
+        primary.call.side_effect = Exception("503")
+        secondary = Mock()
+        secondary.get_provider_name.return_value = "Secondary"
+
+        generator._call_with_fallback([primary, secondary], "system", "user", timeout_seconds=30)
+
+        assert generator.breaker_status() == {
+            "Primary": {"failures": 1, "open": False, "retry_in_seconds": 0.0}
+        }
+
     def test_degradation_returns_generic_enhancement(self):
         """Test that degradation produces generic enhancement."""
         generator = EnhancementGenerator()
@@ -190,6 +857,10 @@ class TestAC4_RetryAndFallback:
         assert len(result.quality_warnings) > 0
         assert "generic" in result.enhanced_prompt.lower()
 
+        # Braces in the user's prompt are kept verbatim
+        braces = generator._degrade_to_generic_enhancement("use {name} here", "x")
+        assert braces.enhanced_prompt.startswith("use {name} here\n\n")
+
     def test_quality_warning_on_degradation(self):
         """Test that quality warnings are shown when degrading."""
         generator = EnhancementGenerator()
@@ -202,6 +873,155 @@ class TestAC4_RetryAndFallback:
         assert any("no project awareness" in w.lower() for w in result.quality_warnings)
 
 
+class TestRetryProvider:
+    """Provider-level retries with jittered exponential backoff"""
+
+    RESPONSE = LLMResponse("Enhanced", 1, 1, "gpt-4-turbo", "openai", 0.1)
+
+    def _inner(self, *outcomes):
+        inner = Mock(spec=OpenAIProvider, api_key="sk-test", model="gpt-4-turbo")
+        inner.call.side_effect = list(outcomes)
+        inner.get_provider_name.return_value = "OpenAI"
+        return inner
+
+    def test_transient_errors_retried_with_backoff(self):
+        """Test timeouts and 5xx errors are retried with growing delays."""
+        from openai import InternalServerError
+
+        server_error = InternalServerError(
+            "boom", response=Mock(status_code=503, headers={}), body=None
+        )
+        inner = self._inner(asyncio.TimeoutError("slow"), server_error, self.RESPONSE)
+        provider = RetryProvider(inner, RetryConfig(jitter=False))
+
+        with patch.object(llm_provider.time, "sleep") as sleep:
+            assert provider.call("system", "user") is self.RESPONSE
+
+        assert [c.args[0] for c in sleep.call_args_list] == [0.5, 1.0]
+        assert provider.get_provider_name() == "OpenAI"
+
+    def test_retry_after_header_respected(self):
+        """Test a rate limit's Retry-After header sets the delay."""
+        from openai import RateLimitError
+
+        response = Mock(status_code=429, headers={"retry-after": "7"})
+        inner = self._inner(RateLimitError("slow down", response=response, body=None), self.RESPONSE)
+
+        with patch.object(llm_provider.time, "sleep") as sleep:
+            RetryProvider(inner).call("system", "user")
+
+        sleep.assert_called_once_with(7.0)
+
+    def test_gives_up_after_max_retries_and_on_other_errors(self):
+        """Test retries stop at max_retries and non-transient errors raise at once."""
+        inner = self._inner(*[asyncio.TimeoutError("slow")] * 3)
+        with patch.object(llm_provider.time, "sleep"):
+            with pytest.raises(asyncio.TimeoutError):
+                RetryProvider(inner, RetryConfig(max_retries=2)).call("system", "user")
+        assert inner.call.call_count == 3
+
+        inner = self._inner(ValueError("bad request"), self.RESPONSE)
+        with pytest.raises(ValueError):
+            RetryProvider(inner).call("system", "user")
+        assert inner.call.call_count == 1
+
+    def test_partially_streamed_call_not_retried(self):
+        """Test a failure after text reached the callback is raised, not retried."""
+        def fail_midway(*args):
+            args[5]("partial ")
+            raise asyncio.TimeoutError("dropped")
+
+        inner = self._inner()
+        inner.call.side_effect = fail_midway
+        received = []
+
+        with pytest.raises(asyncio.TimeoutError):
+            RetryProvider(inner).call("system", "user", stream_callback=received.append)
+        assert received == ["partial "]
+
+    def test_async_retry_and_factory_wrapping(self):
+        """Test acall retries too and create_provider wraps when asked."""
+        inner = self._inner()
+        inner.acall = AsyncMock(side_effect=[asyncio.TimeoutError("slow"), self.RESPONSE])
+
+        with patch.object(llm_provider.asyncio, "sleep", AsyncMock()) as sleep:
+            result = asyncio.run(RetryProvider(inner).acall("system", "user"))
+
+        assert result is self.RESPONSE
+        assert sleep.await_count == 1
+
+        wrapped = create_provider("deepseek", "sk-test", retry=RetryConfig(max_retries=2))
+        assert isinstance(wrapped, RetryProvider)
+        assert isinstance(wrapped.inner, DeepSeekProvider)
+        assert isinstance(create_provider("deepseek", "sk-test"), DeepSeekProvider)
+
+
+class TestPooledProvider:
+    """Dispatch across several API keys"""
+
+    RESPONSE = LLMResponse("Enhanced", 1, 1, "gpt-4-turbo", "openai", 0.1)
+
+    def _member(self, key):
+        member = Mock(spec=OpenAIProvider, api_key=key, model="gpt-4-turbo")
+        member.call.return_value = self.RESPONSE
+        return member
+
+    def test_idle_members_used_round_robin(self):
+        """Test sequential calls rotate through the pool."""
+        members = [self._member(f"sk-{i}") for i in range(3)]
+        pool = PooledProvider(members)
+
+        for _ in range(6):
+            pool.call("system", "user")
+
+        assert [m.call.call_count for m in members] == [2, 2, 2]
+
+        pool._in_flight[:] = [2, 0, 1]
+        assert pool._dispatch_order() == [1, 2, 0]
+
+    def test_rate_limited_member_skipped(self):
+        """Test a rate limit moves the call on, and the last error surfaces."""
+        from openai import RateLimitError
+
+        limited = RateLimitError("slow down", response=Mock(status_code=429, headers={}), body=None)
+        members = [self._member("sk-0"), self._member("sk-1")]
+        members[0].call.side_effect = limited
+
+        assert PooledProvider(members).call("system", "user") is self.RESPONSE
+
+        members[1].call.side_effect = limited
+        with pytest.raises(RateLimitError):
+            PooledProvider(members).call("system", "user")
+
+    def test_least_loaded_member_chosen_concurrently(self):
+        """Test concurrent async calls spread across members by in-flight count."""
+        members = [self._member(f"sk-{i}") for i in range(2)]
+        used = []
+
+        for member in members:
+            async def acall(*args, key=member.api_key):
+                used.append(key)
+                await asyncio.sleep(0.01)
+                return self.RESPONSE
+
+            member.acall = acall
+
+        pool = PooledProvider(members)
+        asyncio.run(call_batch(pool, [("system", f"p{i}") for i in range(4)]))
+
+        assert sorted(used) == ["sk-0", "sk-0", "sk-1", "sk-1"]
+        assert pool._in_flight == [0, 0]
+
+    def test_create_pool_builds_one_provider_per_key(self):
+        """Test the pool factory and its validation."""
+        pool = create_pool("deepseek", ["sk-a", "sk-b"])
+        assert [p.api_key for p in pool.providers] == ["sk-a", "sk-b"]
+        assert pool.get_provider_name() == "DeepSeek"
+
+        with pytest.raises(ValueError):
+            create_pool("deepseek", [])
+
+
 class TestAC5_TemplateAwareEnhancement:
     """AC5: Template-Aware Enhancement"""
 
@@ -275,6 +1095,24 @@ class TestAC6_ProviderStrategy:
             provider = generator._select_provider()
             assert isinstance(provider, DeepSeekProvider)
 
+    def test_credentials_read_once_until_refreshed(self):
+        """Test that providers are reused until credentials are refreshed."""
+        with patch.dict(os.environ, {"DEEPSEEK_API_KEY": "sk-test"}, clear=True):
+            generator = EnhancementGenerator()
+        first = generator._select_providers()
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-new"}, clear=True):
+            assert generator._select_providers() == first
+            assert generator._select_provider() is first[0]
+
+            generator.refresh_credentials()
+            assert [p.get_provider_name() for p in generator._select_providers()] == ["OpenAI"]
+
+        with patch.dict(os.environ, {}, clear=True):
+            generator.refresh_credentials()
+            with pytest.raises(AuthenticationError):
+                generator._select_providers()
+
 
 class TestAC7_CostAndRateLimit:
     """AC7: Cost and Rate Limit Awareness"""
@@ -312,6 +1150,46 @@ class TestAC7_CostAndRateLimit:
         assert response.tokens_output == 100
 
 
+class TestPersistentCacheBackends:
+    """Result cache backends shared across processes"""
+
+    def test_sqlite_roundtrip_and_overwrite(self, tmp_path):
+        """Test values are stored, replaced, and visible to a new instance."""
+        cache = SqliteBackend(str(tmp_path / "cache.sqlite3"))
+        assert cache.get("key") is None
+
+        cache.set("key", "first")
+        cache.set("key", "second")
+
+        assert SqliteBackend(str(tmp_path / "cache.sqlite3")).get("key") == "second"
+
+    def test_sqlite_expired_entries_are_misses(self, tmp_path):
+        """Test entries past their TTL are not returned."""
+        cache = SqliteBackend(str(tmp_path / "nested" / "cache.sqlite3"))
+        cache.set("key", "value", ttl=60)
+
+        with patch.object(result_cache.time, "time", return_value=time.time() + 120):
+            assert cache.get("key") is None
+
+    def test_redis_uses_prefixed_keys_and_ttl(self):
+        """Test keys are namespaced, TTL is passed, and bytes are decoded."""
+        client = Mock()
+        client.get.return_value = b"value"
+        cache = RedisBackend(client=client, prefix="pe:")
+
+        cache.set("key", "value", ttl=30)
+
+        client.setex.assert_called_once_with("pe:key", 30, "value")
+        assert cache.get("key") == "value"
+        client.get.assert_called_once_with("pe:key")
+
+    def test_redis_requires_redis_py_without_client(self):
+        """Test a clear error when redis-py is missing."""
+        with patch.dict("sys.modules", {"redis": None}):
+            with pytest.raises(ImportError):
+                RedisBackend()
+
+
 class TestAC8_RequestResponseLogging:
     """AC8: Request and Response Logging"""
 
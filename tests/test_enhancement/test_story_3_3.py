@@ -130,6 +130,20 @@ class TestAC1_ExtractImplementationSteps:
         # Should detect and extract multiple steps
         assert result.total_steps >= 2
 
+    def test_numbered_steps_take_precedence_over_bullets(self):
+        """Test that bullets are ignored once numbered steps are present."""
+        response = """
+        - Read the existing handlers
+        2. Add validation
+        - Keep error messages short
+        1. Create the schema
+        """
+        result = StepExtractor().extract_steps(response)
+
+        assert result.format_detected == StepFormat.NUMBERED
+        assert [s.content for s in result.steps] == ["Create the schema", "Add validation"]
+        assert [s.number for s in result.steps] == [1, 2]
+
     def test_empty_response_handling(self):
         """Test handling of empty responses."""
         extractor = StepExtractor()
@@ -147,6 +161,22 @@ class TestAC1_ExtractImplementationSteps:
         assert result.total_steps >= 1
         assert len(result.steps[0].content) > 0
 
+    def test_content_lower_follows_content(self):
+        """Test lowercased content is memoized but tracks reassignment."""
+        step = ImplementationStep(
+            number=1, content="Write Tests", original_text="1. Write Tests",
+            format_detected=StepFormat.NUMBERED,
+        )
+
+        assert step.content_lower == "write tests"
+        step.content = "Deploy API"
+        assert step.content_lower == "deploy api"
+        assert "_content_lower" not in repr(step)
+        assert step == ImplementationStep(
+            number=1, content="Deploy API", original_text="1. Write Tests",
+            format_detected=StepFormat.NUMBERED,
+        )
+
 
 class TestAC2_GenerateVerificationCriteria:
     """AC2: Generate Project-Specific Verification Criteria"""
@@ -208,6 +238,32 @@ class TestAC2_GenerateVerificationCriteria:
         behavior_criteria = [c for c in criteria.verification_criteria if c.criterion_type == "behavior"]
         assert len(behavior_criteria) >= 0  # May or may not have
 
+    def test_behavior_uses_first_should_or_will(self):
+        """Test the earliest whole-word should/will statement is the behavior."""
+        step = ImplementationStep(
+            number=1,
+            content="Willing callers will get JSON and should see a cache hit",
+            original_text="1. Willing callers will get JSON and should see a cache hit",
+            format_detected=StepFormat.NUMBERED,
+        )
+        context = ProjectContext(project_name="test", language="python")
+        generator = CriteriaGenerator(context)
+
+        criteria = generator.generate_criteria_for_step(step)
+
+        behavior = [c for c in criteria.verification_criteria if c.criterion_type == "behavior"][0]
+        assert behavior.expected_behavior == "will get JSON and should see a cache hit"
+
+    def test_behavior_offset_survives_case_expansion(self):
+        """Test behavior text is sliced correctly when lowercasing adds characters."""
+        context = ProjectContext(project_name="test", language="python")
+        generator = CriteriaGenerator(context)
+        content = "İİİ İstanbul import should succeed"
+
+        behavior = generator._identify_behavior(content, content.lower())
+
+        assert behavior["expected"] == "should succeed"
+
     def test_code_review_checklist(self):
         """Test code review checklist generation."""
         step = ImplementationStep(
@@ -248,6 +304,102 @@ class TestAC2_GenerateVerificationCriteria:
         # Criteria should be generated
         assert len(criteria.verification_criteria) > 0
 
+    def test_keywords_drive_artifact_and_pitfalls(self):
+        """Test keyword matches select the artifact type and extra pitfalls."""
+        from src.prompt_enhancement.enhancement import ArtifactType
+
+        step = ImplementationStep(
+            number=1,
+            content="Update database Settings for the async worker",
+            original_text="1. Update database Settings for the async worker",
+            format_detected=StepFormat.NUMBERED,
+        )
+        context = ProjectContext(project_name="test", language="python")
+        generator = CriteriaGenerator(context)
+
+        criteria = generator.generate_criteria_for_step(step)
+
+        artifact = criteria.verification_criteria[0]
+        assert artifact.artifact_type == ArtifactType.CONFIG_FILE
+        assert "Remember to await async calls" in criteria.common_pitfalls
+        assert "Use connection pooling for database operations" in criteria.common_pitfalls
+        assert "Query database directly to verify data state" in criteria.debugging_tips
+
+    def test_detected_standards_resolved_for_all_steps(self):
+        """Test detected standards flow into checklists and examples."""
+        context = ProjectContext(
+            project_name="test",
+            language="python",
+            detected_standards={
+                "naming_conventions": Mock(detected_value="camelCase"),
+                "test_framework": Mock(detected_value="unittest"),
+            },
+        )
+        generator = CriteriaGenerator(context)
+
+        for number, content in enumerate(
+            ["Create a helper function", "Write a test for the helper"], start=1
+        ):
+            step = ImplementationStep(
+                number=number,
+                content=content,
+                original_text=f"{number}. {content}",
+                format_detected=StepFormat.NUMBERED,
+            )
+            criteria = generator.generate_criteria_for_step(step)
+
+            review = [
+                c for c in criteria.verification_criteria
+                if c.criterion_type == "code_review"
+            ][0]
+            assert "✓ Code follows camelCase naming conventions" in review.code_review_checklist
+            assert "✓ Code organization matches project pattern (by-layer)" in review.code_review_checklist
+            assert criteria.code_examples[0].follows_standards["naming"] == "camelCase"
+            assert criteria.code_examples[0].follows_standards["organization"] == "default"
+
+        assert criteria.testing_guidance.framework == "unittest"
+
+
+    def test_generate_criteria_for_steps_matches_per_step(self):
+        """Test batch generation matches generating each step individually."""
+        steps = [
+            ImplementationStep(
+                number=i + 1,
+                content=content,
+                original_text=f"{i + 1}. {content}",
+                format_detected=StepFormat.NUMBERED,
+            )
+            for i, content in enumerate(
+                ["Create a helper function", "Add API endpoint", "Write a test"]
+            )
+        ]
+        context = ProjectContext(project_name="test", language="python", framework="fastapi")
+        generator = CriteriaGenerator(context)
+
+        batch = generator.generate_criteria_for_steps(steps)
+
+        assert batch == [
+            generator.generate_criteria_for_step(step, step_index=i)
+            for i, step in enumerate(steps)
+        ]
+
+    def test_repeated_calls_return_equal_criteria(self):
+        """Test generating criteria for the same step twice gives equal results."""
+        step = ImplementationStep(
+            number=1, content="Create a user model function",
+            original_text="1. Create a user model function",
+            format_detected=StepFormat.NUMBERED,
+        )
+        generator = CriteriaGenerator(
+            ProjectContext(project_name="test", language="python", framework="fastapi")
+        )
+
+        first = generator.generate_criteria_for_step(step)
+        second = generator.generate_criteria_for_step(step)
+
+        assert first == second
+        assert first.verification_criteria is not second.verification_criteria
+
 
 class TestAC3_CustomizeByProjectType:
     """AC3: Customize Guidance by Project Type"""
@@ -323,6 +475,15 @@ class TestAC3_CustomizeByProjectType:
         assert "organization" in all_text.lower() or len(criteria.verification_criteria) > 0
 
 
+    def test_normalized_language_and_framework(self):
+        """Test language and framework are normalized for dispatch."""
+        generator = CriteriaGenerator(ProjectContext(project_name="test", language="Python"))
+
+        assert generator.language_lower == "python"
+        assert generator.framework_or_generic == "generic"
+        assert generator._get_file_extension() == "py"
+
+
 class TestAC4_CodeExamplesWithStandards:
     """AC4: Add Code Examples Following Detected Standards"""
 
@@ -409,6 +570,16 @@ class TestAC4_CodeExamplesWithStandards:
             assert filename.endswith(".py")  # Python file
 
 
+    def test_example_filename_from_second_word(self):
+        """Test example filenames use the cleaned second word of the step."""
+        context = ProjectContext(project_name="test", language="python")
+        generator = CriteriaGenerator(context)
+
+        assert generator._get_example_filename("Create user-service now", "python") == "userservice_example.py"
+        assert generator._get_example_filename("Create", "python") == "example_example.py"
+        assert generator._get_example_filename("Create --- helper", "python") == "example_example.py"
+
+
 class TestAC5_TestingGuidance:
     """AC5: Include Testing Guidance Specific to Framework"""
 
@@ -512,6 +683,7 @@ class TestAC6_ComprehensiveGuide:
         assert len(guide.sections) > 0
         section_names = [s.name for s in guide.sections]
         assert "Overview" in section_names or any("Overview" in name for name in section_names)
+        assert guide.sections[0].content == guide.overview
 
     def test_guide_includes_execution_order(self):
         """Test that guide specifies execution order."""
@@ -547,6 +719,29 @@ class TestAC6_ComprehensiveGuide:
         # Should identify parallelizable steps
         assert isinstance(guide.can_parallelize, dict)
 
+    def test_execution_order_and_parallelism_follow_dependencies(self):
+        """Test dependency-aware ordering, including circular dependencies."""
+        def step(number, deps):
+            return ImplementationStep(
+                number=number, content=f"Step {number}", original_text="",
+                format_detected=StepFormat.NUMBERED, dependencies=deps,
+            )
+
+        builder = GuideBuilder(ProjectContext(project_name="test", language="python"))
+        steps = [step(1, [2]), step(2, []), step(3, [1])]
+
+        assert builder._determine_execution_order(steps) == [2, 1, 3]
+        assert builder._detect_parallelizable_steps(steps) == {2: [3], 3: [2]}
+
+        cyclic = [step(1, [2]), step(2, [1]), step(3, [])]
+        assert builder._determine_execution_order(cyclic) == [3, 1, 2]
+
+        # Ready steps go lowest-number first; unknown dependencies are ignored
+        chain = [step(n, [n + 1] if n < 200 else [999]) for n in range(1, 201)]
+        assert builder._determine_execution_order(chain) == list(range(200, 0, -1))
+        fan_in = [step(4, [1, 2, 3]), step(3, []), step(1, []), step(2, [1])]
+        assert builder._determine_execution_order(fan_in) == [1, 2, 3, 4]
+
     def test_guide_includes_rollback_instructions(self):
         """Test that guide includes rollback instructions."""
         response = """
@@ -580,6 +775,12 @@ class TestAC6_ComprehensiveGuide:
         # Should have pitfalls
         assert isinstance(guide.common_pitfalls, list)
 
+        # Shared pitfalls appear once, and the section lists the same items
+        assert len(guide.common_pitfalls) == len(set(guide.common_pitfalls))
+        assert "Use connection pooling for database operations" in guide.common_pitfalls
+        section = next(sec for sec in guide.sections if sec.name == "Common Pitfalls")
+        assert section.content == "\n".join(f"- {p}" for p in guide.common_pitfalls)
+
     def test_guide_includes_debugging_tips(self):
         """Test that guide includes debugging tips."""
         response = """
@@ -634,6 +835,13 @@ class TestAC7_MultipleImplementationPaths:
             # Tradeoffs should have meaningful keys
             assert any(key in path.tradeoffs for key in ["complexity", "performance", "maintainability"])
 
+        # Paths share read-only step and tradeoff data
+        simple, robust = guide.alternative_paths
+        assert simple.steps is robust.steps
+        assert simple.steps == tuple(guide.steps)
+        with pytest.raises(TypeError):
+            simple.tradeoffs["complexity"] = "High"
+
     def test_recommended_path_selection(self):
         """Test that a recommended path is selected."""
         response = """
@@ -688,6 +896,14 @@ class TestAC8_ValidationAndQuality:
             criteria_for_step = [c for c in guide.criteria_per_step if c.step.number == step.number]
             assert len(criteria_for_step) >= 0  # May be zero for generic steps
 
+        # Dropping a step's criteria is reported as an error
+        guide.criteria_per_step = guide.criteria_per_step[:-1]
+        validation = builder._validate_guide(guide)
+        assert validation.errors == [
+            f"Step {guide.steps[-1].number} has no verification criteria"
+        ]
+        assert validation.completeness_percentage == 90.0 - 5 * len(validation.warnings)
+
     def test_validation_checks_consistency(self):
         """Test that validation checks for consistency."""
         response = """
@@ -783,5 +999,66 @@ class TestIntegration_FullStory33:
         assert guide.project_context.framework == "django"
 
 
+class TestPackageExports:
+    """The enhancement package exposes one consistent public surface."""
+
+    EXPECTED_EXPORTS = {
+        # Story 3.1
+        "ProjectContext",
+        "StandardsDetectionResult",
+        "CollectionMetadata",
+        "GitHistoryContext",
+        "Dependency",
+        "ProjectContextCollector",
+        "PromptBuilder",
+        "SensitiveDataValidator",
+        # Story 3.2
+        "EnhancementGenerator",
+        "EnhancementResult",
+        "CacheBackend",
+        "SqliteBackend",
+        "RedisBackend",
+        # Story 3.3
+        "StepExtractor",
+        "ImplementationStep",
+        "StepFormat",
+        "ExtractedSteps",
+        "StepGroup",
+        "CriteriaGenerator",
+        "VerificationCriterion",
+        "CodeExample",
+        "TestingGuidance",
+        "GeneratedCriteria",
+        "ArtifactType",
+        "GuideBuilder",
+        "ImplementationGuide",
+        "ImplementationPath",
+        "PathAlternative",
+        "ImplementationGuideSection",
+        "ValidationResult",
+    }
+
+    def test_all_matches_expected_exports(self):
+        """Test __all__ lists exactly the Story 3.1-3.3 exports."""
+        import src.prompt_enhancement.enhancement as enhancement
+
+        assert len(enhancement.__all__) == len(set(enhancement.__all__))
+        assert set(enhancement.__all__) == self.EXPECTED_EXPORTS
+
+    def test_all_exports_resolve(self):
+        """Test every name in __all__ resolves, including lazy exports."""
+        import src.prompt_enhancement.enhancement as enhancement
+
+        for name in enhancement.__all__:
+            assert getattr(enhancement, name) is not None
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown attributes still raise AttributeError."""
+        import src.prompt_enhancement.enhancement as enhancement
+
+        with pytest.raises(AttributeError):
+            enhancement.DoesNotExist
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -146,6 +146,14 @@ class TestNamingConventionTypes:
             convention = detector._classify_convention(name)
             assert convention == NamingConventionType.UPPER_SNAKE_CASE
 
+    def test_recognize_private_upper_snake_case(self):
+        """Should treat underscore-prefixed UPPER_SNAKE_CASE names as constants."""
+        detector = NamingConventionDetector(Path("/tmp"))
+
+        for name in ["_MAX_RETRIES", "_WORD_RE", "__CACHE"]:
+            convention = detector._classify_convention(name)
+            assert convention == NamingConventionType.UPPER_SNAKE_CASE
+
     def test_recognize_kebab_case(self):
         """Should correctly identify kebab-case pattern - AC2."""
         detector = NamingConventionDetector(Path("/tmp"))